@@ -0,0 +1,145 @@
+"""
+Running summaries of leaderboard measurements, updated one value at a time.
+
+Each Aggregate follows one measured quantity (elapsed_ms, swaps or
+comparisons) of one group of runs and keeps, in constant space:
+
+    count, min, max     exact
+    mean, variance      Welford's online algorithm, numerically stable
+    p50, p95            P² estimates (Jain & Chlamtac, 1985): five markers
+                        per quantile, moved with a parabolic fit as values
+                        arrive, so no value is ever stored
+
+The database keeps one Aggregate state per (algorithm, array size,
+distribution) and metric and folds in every new run as it is saved (see
+database.get_stats()). to_state() / from_state() turn an Aggregate into
+plain JSON-compatible data and back.
+"""
+
+import math
+
+
+class P2Quantile:
+    """P² estimate of the p-quantile of a stream of values."""
+
+    def __init__(self, p: float):
+        self.p = p
+        self.count = 0
+        self.heights = []                   # the first five values, then the markers
+        self.positions = [1, 2, 3, 4, 5]    # marker positions (1-based ranks)
+        self.desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, x: float):
+        self.count += 1
+        q = self.heights
+        if self.count <= 5:
+            q.append(x)
+            q.sort()
+            return
+
+        # Cell of x, widening the extreme markers if needed
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = max(q[4], x)
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= x < q[i + 1])
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.desired[i] += self._increments[i]
+
+        # Move the three middle markers towards their desired positions
+        for i in (1, 2, 3):
+            d = self.desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                h = self._parabolic(i, d)
+                if not q[i - 1] < h < q[i + 1]:
+                    h = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = h
+                n[i] += d
+
+    def _parabolic(self, i, d):
+        q, n = self.heights, self.positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+
+    def value(self):
+        """The current estimate; exact while there are five values or fewer."""
+        if not self.count:
+            return None
+        if self.count <= 5:
+            # Nearest rank on the values seen so far
+            return self.heights[min(self.count - 1, int(self.p * self.count))]
+        return self.heights[2]
+
+    def to_state(self) -> list:
+        return [self.count, list(self.heights), list(self.positions), list(self.desired)]
+
+    @classmethod
+    def from_state(cls, p: float, state: list) -> 'P2Quantile':
+        sketch = cls(p)
+        sketch.count, sketch.heights, sketch.positions, sketch.desired = (
+            state[0], list(state[1]), list(state[2]), list(state[3]))
+        return sketch
+
+
+class Aggregate:
+    """Count, min, max, mean, variance and p50 / p95 of a stream of values."""
+
+    QUANTILES = (0.5, 0.95)
+
+    def __init__(self):
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        self.m2 = 0.0           # sum of squared deviations from the mean
+        self.sketches = [P2Quantile(p) for p in self.QUANTILES]
+
+    def add(self, x: float):
+        self.count += 1
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        for sketch in self.sketches:
+            sketch.add(x)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance; 0 for fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def p50(self):
+        return self.sketches[0].value()
+
+    @property
+    def p95(self):
+        return self.sketches[1].value()
+
+    def to_state(self) -> dict:
+        return {'count': self.count, 'min': self.min, 'max': self.max,
+                'mean': self.mean, 'm2': self.m2,
+                'sketches': [sketch.to_state() for sketch in self.sketches]}
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'Aggregate':
+        agg = cls()
+        agg.count, agg.min, agg.max = state['count'], state['min'], state['max']
+        agg.mean, agg.m2 = state['mean'], state['m2']
+        agg.sketches = [P2Quantile.from_state(p, s)
+                        for p, s in zip(cls.QUANTILES, state['sketches'])]
+        return agg
@@ -0,0 +1,239 @@
+"""
+What each algorithm is, and what a run of it is expected to cost.
+
+An AlgorithmMeta holds an algorithm's complexity class, whether it is
+stable, in place and comparison-based, and a cost model: the expected
+number of comparisons and swaps, and of steps (frames the generator
+yields), for a random input of size n. The models were fitted to
+benchmark runs on the default inputs (distributions.make_input('random',
+n), values 10 to 400), so they are typically within 10-30%; a sorted or
+reversed input can be much cheaper or dearer.
+
+The built-ins are described in METADATA below, so nothing is imported to
+answer questions about them. A plugin can describe itself with a
+module-level dict of the same fields:
+
+    METADATA = {'complexity': 'O(n)', 'stable': True, 'in_place': False,
+                'comparison': False,
+                'comparisons': lambda n: 0, 'swaps': lambda n: n}
+
+Algorithms without a cost model have no predicted cost and are never
+held back.
+
+The cost models guard the runs: a run whose predicted step count exceeds
+the step budget (STEP_BUDGET, from the SORT_STEP_BUDGET environment
+variable; 0 turns the guard off) is refused by the headless tools and
+clamped to max_size() in the GUI, so no one starts bogoSort at n = 200 by
+accident.
+"""
+
+import functools
+import math
+import os
+import sys
+from collections import namedtuple
+
+from algs import get_info, load
+
+# complexity: average case, e.g. 'O(n log n)'; stable, in_place,
+# comparison: bools, None if unknown; comparisons, swaps: n -> expected
+# count; steps: n -> expected yields, None when that is comparisons + swaps
+AlgorithmMeta = namedtuple('AlgorithmMeta',
+                           'complexity stable in_place comparison comparisons swaps steps',
+                           defaults=(None,))
+
+# About a minute of an instrumented run, at the benchmark's 1M steps/s or so
+STEP_BUDGET_ENV = 'SORT_STEP_BUDGET'
+DEFAULT_STEP_BUDGET = 50_000_000
+STEP_BUDGET = int(os.environ.get(STEP_BUDGET_ENV, DEFAULT_STEP_BUDGET))
+
+# Largest size max_size() looks at; anything affordable beyond it counts as unlimited
+MAX_SEARCH_SIZE = 10 ** 9
+_HUGE = 1e18        # a step count past any budget
+
+
+def _lg(n):
+    return math.log2(n) if n > 1 else 0.0
+
+
+def _nlogn(n):
+    return n * _lg(n)
+
+
+@functools.lru_cache(maxsize=None)
+def _stooge_comparisons(n):
+    # One comparison, then three recursive calls on 2/3 of the range
+    if n < 2:
+        return 0
+    if n == 2:
+        return 1
+    return 1 + 3 * _stooge_comparisons(n - n // 3)
+
+
+_slow_table = [0, 0]
+
+
+def _slow_comparisons(n):
+    # C(n) = C(ceil(n/2)) + C(floor(n/2)) + 1 + C(n - 1), built bottom-up:
+    # the recursion is n deep. It passes any budget within a few thousand.
+    table = _slow_table
+    while len(table) <= n and table[-1] < _HUGE:
+        k = len(table)
+        table.append(table[(k + 1) // 2] + table[k // 2] + 1 + table[k - 1])
+    return table[n] if n < len(table) else math.inf
+
+
+def _factorial(n):
+    log = math.lgamma(n + 1)
+    return math.exp(log) if log < 690 else math.inf
+
+
+METADATA = {
+    'insertionSort':       AlgorithmMeta('O(n²)', True, True, True,
+                                         lambda n: n * n / 4, lambda n: n * n / 4),
+    'bubbleSort':          AlgorithmMeta('O(n²)', True, True, True,
+                                         lambda n: n * (n - 1) / 2, lambda n: n * n / 4),
+    'selectionSort':       AlgorithmMeta('O(n²)', False, True, True,
+                                         lambda n: n * (n - 1) / 2, lambda n: n),
+    'mergeSort':           AlgorithmMeta('O(n log n)', True, False, True,
+                                         lambda n: _nlogn(n) - 1.2 * n, _nlogn),
+    'quickSort':           AlgorithmMeta('O(n log n)', False, True, True,
+                                         lambda n: 1.2 * _nlogn(n), lambda n: 0.7 * _nlogn(n)),
+    'countingSort':        AlgorithmMeta('O(n + k)', True, False, False,
+                                         lambda n: 0, lambda n: n, lambda n: 2 * n),
+    'cocktailSort':        AlgorithmMeta('O(n²)', True, True, True,
+                                         lambda n: 0.38 * n * n, lambda n: n * n / 4),
+    'cycleSort':           AlgorithmMeta('O(n²)', False, True, True,
+                                         lambda n: 1.5 * n * n, lambda n: n),
+    # Expected n! shuffles of n swaps each, and e - 1 comparisons per check
+    'bogoSort':            AlgorithmMeta('O(n · n!)', False, True, True,
+                                         lambda n: (math.e - 1) * _factorial(n),
+                                         lambda n: n * _factorial(n)),
+    'heapSort':            AlgorithmMeta('O(n log n)', False, True, True,
+                                         lambda n: 2 * _nlogn(n) - 3 * n,
+                                         lambda n: _nlogn(n) - 0.9 * n),
+    # Three decimal digits for values up to 400, two passes over the array each
+    'radixSort':           AlgorithmMeta('O(d (n + k))', True, False, False,
+                                         lambda n: 0, lambda n: 3 * n, lambda n: 7 * n),
+    'shellSort':           AlgorithmMeta('O(n^1.25)', False, True, True,
+                                         lambda n: 1.2 * _nlogn(n), lambda n: 0.9 * _nlogn(n)),
+    'gnomeSort':           AlgorithmMeta('O(n²)', True, True, True,
+                                         lambda n: n * n / 2, lambda n: n * n / 4),
+    'combSort':            AlgorithmMeta('O(n log n)', False, True, True,
+                                         lambda n: 2.1 * _nlogn(n), lambda n: 0.38 * _nlogn(n)),
+    'bitonicSort':         AlgorithmMeta('O(n log² n)', False, True, True,
+                                         lambda n: n / 4 * _lg(n) * (_lg(n) + 1),
+                                         lambda n: n / 8 * _lg(n) * (_lg(n) + 1)),
+    'pancakeSort':         AlgorithmMeta('O(n²)', False, True, True,
+                                         lambda n: n * n / 2, lambda n: 0.33 * n * n),
+    'binaryInsertionSort': AlgorithmMeta('O(n²)', True, True, True,
+                                         lambda n: _nlogn(n) - 1.44 * n, lambda n: n * n / 4),
+    'bucketSort':          AlgorithmMeta('O(n + k)', True, False, True,
+                                         lambda n: 0.6 * n, lambda n: n, lambda n: 2.65 * n),
+    'timSort':             AlgorithmMeta('O(n log n)', True, False, True,
+                                         lambda n: 0.85 * _nlogn(n), lambda n: 1.05 * _nlogn(n)),
+    'stoogeSort':          AlgorithmMeta('O(n^2.71)', False, True, True,
+                                         _stooge_comparisons, lambda n: n * n / 4),
+    'strandSort':          AlgorithmMeta('O(n²)', True, False, True,
+                                         lambda n: 1.3 * n ** 1.5, lambda n: 0.6 * n ** 1.8),
+    'oddEvenSort':         AlgorithmMeta('O(n²)', True, True, True,
+                                         lambda n: n * n / 2, lambda n: n * n / 4),
+    'pigeonholeSort':      AlgorithmMeta('O(n + k)', True, False, False,
+                                         lambda n: 0, lambda n: n, lambda n: 2 * n),
+    'exchangeSort':        AlgorithmMeta('O(n²)', False, True, True,
+                                         lambda n: n * (n - 1) / 2, lambda n: n * n / 8),
+    'treeSort':            AlgorithmMeta('O(n log n)', True, False, True,
+                                         lambda n: 1.15 * _nlogn(n), lambda n: n),
+    'slowSort':            AlgorithmMeta('O(n^(log n / 2))', False, True, True,
+                                         _slow_comparisons, lambda n: n * n / 4),
+    'quickSort_LR':        AlgorithmMeta('O(n log n)', False, True, True,
+                                         lambda n: 1.5 * _nlogn(n), lambda n: 0.27 * _nlogn(n)),
+}
+
+_UNKNOWN = AlgorithmMeta('?', None, None, None, None, None)
+
+
+@functools.lru_cache(maxsize=None)
+def get_meta(name: str) -> AlgorithmMeta:
+    """
+    The metadata of algorithm `name`: from METADATA for the built-ins, else
+    from its module's METADATA dict (which imports a plugin), else all
+    unknown. KeyError if there is no such algorithm.
+    """
+    meta = METADATA.get(name)
+    if meta is not None:
+        return meta
+    get_info(name)
+    try:
+        module = sys.modules.get(load(name).__module__)
+    except Exception:
+        # A plugin that fails to import says so when it is run
+        return _UNKNOWN
+    declared = getattr(module, 'METADATA', None)
+    if not declared:
+        return _UNKNOWN
+    return _UNKNOWN._replace(**declared)
+
+
+def expected_steps(name: str, n: int):
+    """
+    Predicted steps of algorithm `name` on a random input of size `n`, a
+    float (math.inf when it would never end), or None if the algorithm has
+    no cost model.
+    """
+    meta = get_meta(name)
+    if meta.steps is not None:
+        return max(0.0, float(meta.steps(n)))
+    if meta.comparisons is None or meta.swaps is None:
+        return None
+    return max(0.0, float(meta.comparisons(n))) + max(0.0, float(meta.swaps(n)))
+
+
+def max_size(name: str, budget: int = None):
+    """
+    The largest array size whose predicted steps stay within `budget`
+    (default STEP_BUDGET), or None if any size up to MAX_SEARCH_SIZE does,
+    the budget is 0 (off) or the algorithm has no cost model.
+    """
+    budget = STEP_BUDGET if budget is None else budget
+    if budget <= 0 or expected_steps(name, MAX_SEARCH_SIZE) is None \
+            or expected_steps(name, MAX_SEARCH_SIZE) <= budget:
+        return None
+    # The cost models grow with n: find the last affordable size
+    low, high = 0, 1
+    while expected_steps(name, high) <= budget:
+        low, high = high, high * 2
+    while high - low > 1:
+        middle = (low + high) // 2
+        if expected_steps(name, middle) <= budget:
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+def check_size(name: str, n: int, budget: int = None):
+    """
+    None if a run of `name` on `n` elements fits in `budget` (default
+    STEP_BUDGET), else a message saying why not and what size would.
+    """
+    budget = STEP_BUDGET if budget is None else budget
+    steps = expected_steps(name, n)
+    if budget <= 0 or steps is None or steps <= budget:
+        return None
+    largest = max_size(name, budget)
+    return (f'{name} at n={n} is expected to take {format_steps(steps)} steps, '
+            f'over the step budget of {format_steps(budget)}; '
+            f'n={largest} or less fits')
+
+
+def format_steps(steps: float) -> str:
+    """Short label for a step count, e.g. '850', '3.2k', '45M', '1.2e+15'."""
+    if steps == math.inf:
+        return '∞'
+    if steps >= 1e15:
+        return f'{steps:.2g}'
+    for scale, suffix in ((1e12, 'T'), (1e9, 'G'), (1e6, 'M'), (1e3, 'k')):
+        if steps >= scale:
+            return f'{steps / scale:.3g}{suffix}'
+    return f'{steps:.0f}'
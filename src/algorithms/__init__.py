@@ -1,30 +1,15 @@
-from algorithms.bubbleSort import bubbleSort
-from algorithms.bogoSort import bogoSort
-from algorithms.bitonicSort import bitonicSort
-from algorithms.binaryinsertionSort import binaryinsertionSort
-from algorithms.exchangeSort import exchangeSort
-from algorithms.heapSort import heapSort
-from algorithms.gnomeSort import gnomeSort
-from algorithms.cycleSort import cycleSort
-from algorithms.countingSort import countingSort
-from algorithms.combSort import combSort
-from algorithms.cocktailSort import cocktailSort
-from algorithms.bucketSort import bucketSort
-from algorithms.timSort import timSort
-from algorithms.strandSort import strandSort
-from algorithms.stoogeSort import stoogeSort
-from algorithms.shellSort import shellSort
-from algorithms.selectionSort import selectionSort
-from algorithms.quickSort import quickSort
-from algorithms.pigeonholeSort import pigeonholeSort
-from algorithms.pancakeSort import pancakeSort
-from algorithms.oddevenSort import oddevenSort
-from algorithms.mergeSort import mergeSort
-from algorithms.insertionSort import insertionSort
-from algorithms.radixSort import radixSort
-from algorithms.treeSort import treeSort
-from algorithms.slowSort import slowSort
+"""
+The built-in sorting algorithms, one module each, named after the function
+it defines.
 
+Importing the package imports none of them: `from algorithms import
+bubbleSort` loads algorithms/bubbleSort.py the first time the name is
+looked up (PEP 562). The GUI and the headless tools find them through
+algs.REGISTRY, which holds their names and flags without importing them.
+"""
+
+import importlib
+import types
 
 __all__ = [
     "bogoSort",
@@ -44,6 +29,7 @@ __all__ = [
     "shellSort",
     "selectionSort",
     "quickSort",
+    "quickSort_LR",
     "pigeonholeSort",
     "pancakeSort",
     "oddevenSort",
@@ -54,3 +40,22 @@ __all__ = [
     "exchangeSort",
     "slowSort",
 ]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    importlib.import_module(f'{__name__}.{name}')
+    # Importing a submodule binds it here under its own name, hiding the
+    # function of that name; this also catches the modules it imported in
+    # turn (timSort imports binaryinsertionSort)
+    namespace = globals()
+    for function in __all__:
+        value = namespace.get(function)
+        if isinstance(value, types.ModuleType):
+            namespace[function] = getattr(value, function)
+    return namespace[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
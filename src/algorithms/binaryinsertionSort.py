@@ -1,60 +1,65 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, WRITE
 
 def binaryinsertionSort(array, *args):
     """
     Binary insertion sort is an optimized version of insertion sort that uses binary search 
     to find the position to insert the current element in the sorted sublist.
 
-    Time complexity: O(n log n)
+    Time complexity: O(n^2). The binary search needs only O(n log n)
+    comparisons in total, but every insertion still shifts the larger
+    elements one position at a time, O(n^2) moves in the worst case.
 
     Example:
-        >>> array = [5, 2, 4, 6, 1, 3]
+        >>> array = [5, 2, 4]
         >>> list(binaryinsertionSort(array))
-        ([5, 2, 4, 6, 1, 3], 0, 0, 0, 0)
-        ([2, 5, 4, 6, 1, 3], 1, 1, 0, 1)
-        ([2, 4, 5, 6, 1, 3], 1, 2, 1, 2)
-        ([2, 4, 5, 6, 1, 3], 2, 2, 1, 3)
-        ([1, 2, 4, 5, 6, 3], 0, 3, 1, 4)
-        ([1, 2, 3, 4, 5, 6], 0, 4, 2, 5)
+        [(0, 0, 1, -1, -1), (2, 1, 5, 0, 1), (2, 0, 2, 0, 1), (0, 0, 2, -1, -1), (0, 1, 2, -1, -1), (2, 2, 5, 1, 2), (2, 1, 4, 1, 2)]
+        >>> array
+        [2, 4, 5]
     """
     for i in range(1, len(array)):
         val = array[i]
-        j = binary_search(array, val, 0, i - 1)
-        yield array, 0, i-1, j, i
-        # Count swaps for shifting elements
+        j = yield from binary_search(array, val, 0, i - 1, i)
+        # Shift the sorted part right of j up by one
         for k in range(i, j, -1):
+            yield WRITE, k, array[k-1], j, i
             array[k] = array[k-1]
-            increment_swaps()
-        array[j] = val
+        if j != i:
+            yield WRITE, j, val, j, i
+            array[j] = val
 
 
-def binary_search(arr, val, start, end):
+def binary_search(arr, val, start, end, source=-1):
     """
     Binary search is an efficient search algorithm 
     for finding a target value in a sorted list or array 
     by repeatedly dividing the search interval in half, 
     resulting in a time complexity of O(log n) in the worst case.
 
+    It yields a COMPARE event per probe and returns the insertion index, so
+    callers use it as `j = yield from binary_search(...)`. `source` is the
+    index val was read from, or -1 when it is held outside the array.
+
     Example:
         >>> arr = [1, 2, 4, 5, 6]
-        >>> binary_search(arr, 3, 0, 4)
-        2
+        >>> search = binary_search(arr, 3, 0, 4)
+        >>> list(search)
+        [(0, 2, -1, -1, -1), (0, 0, -1, -1, -1), (0, 1, -1, -1, -1)]
     """
-    if start == end:
-        increment_comparisons()
-        if arr[start] > val:
-            return start
+    while start < end:
+        mid = round((start + end) / 2)
+        yield COMPARE, mid, source, -1, -1
+        if arr[mid] < val:
+            start = mid + 1
+        elif arr[mid] > val:
+            end = mid - 1
         else:
-            return start + 1
+            return mid
 
     if start > end:
         return start
 
-    mid = round((start + end) / 2)
-    increment_comparisons()
-    if arr[mid] < val:
-        return binary_search(arr, val, mid + 1, end)
-    elif arr[mid] > val:
-        return binary_search(arr, val, start, mid - 1)
+    yield COMPARE, start, source, -1, -1
+    if arr[start] > val:
+        return start
     else:
-        return mid
+        return start + 1
@@ -1,5 +1,5 @@
 # bitonic sort for length not a power of two https://www.inf.hs-flensburg.de/lang/algorithmen/sortieren/bitonic/oddn.htm
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def bitonicSort(array, *args):
     """
@@ -33,11 +33,10 @@ def compAndSwap(array, i, j, dir):
     Compare the elements at indices i and j in the input array and swap them
     if they are not in the correct order (as determined by the dir parameter).
     """
-    increment_comparisons()
+    yield COMPARE, i, j, -1, -1
     if (dir and array[i] > array[j]) or (not dir and array[i] <= array[j]):
+        yield SWAP, i, j, -1, -1
         array[i], array[j] = array[j], array[i]
-        increment_swaps()
-        yield array, i, -1, j, -1
 
 
 def bitonicMerge(array, low, cnt, dire):
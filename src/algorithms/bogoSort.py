@@ -1,30 +1,28 @@
-from random import randint
-from counters import increment_comparisons, increment_swaps
+import random
+from events import COMPARE, SWAP
 
 
-def bogoSort(array, *args):
+def bogoSort(array, *args, rng=random):
     """
     Bogo Sort sorts an array by randomly shuffling it and checking if the elements 
     are in sorted order. It repeatedly shuffles the array until it is sorted.
 
     Time complexity: O(n*n!), where n is the number of elements in the list.
+
+    Shuffles draw from `rng` (a random.Random, or the random module by
+    default), so a seeded rng makes the run reproducible.
     """
-    is_sorted = False
     arrayLen = len(array)
-    count = 0
+    is_sorted = arrayLen < 2
     while not is_sorted:
-        count += 1
         for i in range(arrayLen):
-            j = randint(0, arrayLen-1)
+            j = rng.randint(0, arrayLen-1)
+            yield SWAP, i, j, -1, -1
             array[i], array[j] = array[j], array[i]
-            increment_swaps()
 
         for k in range(len(array)-1):
-            yield array, k, k+1, -1, -1
-            increment_comparisons()
+            yield COMPARE, k, k+1, -1, -1
             if array[k] > array[k+1]:
                 is_sorted = False
                 break
             is_sorted = True
-        if count > 4000:
-            is_sorted = True
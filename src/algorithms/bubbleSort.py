@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def bubbleSort(array, *args):
     """
@@ -12,11 +12,10 @@ def bubbleSort(array, *args):
     for i in range(size):
         swapped = False
         for j in range(size - i - 1):
-            yield array, j, j+1, -1, -1
-            increment_comparisons()
+            yield COMPARE, j, j+1, -1, -1
             if array[j] > array[j + 1]:
+                yield SWAP, j, j+1, -1, -1
                 array[j], array[j + 1] = array[j + 1], array[j]
-                increment_swaps()
                 swapped = True
         if not swapped:
             break
@@ -1,4 +1,4 @@
-from counters import increment_swaps
+from events import COMPARE, READ, WRITE
 
 def bucketSort(array, *args):
     """
@@ -12,27 +12,42 @@ def bucketSort(array, *args):
     and k is the number of buckets used, but can be as bad as O(n^2) if the elements 
     are not uniformly distributed among the buckets.
     """
+    n = len(array)
+    if n < 2:
+        return
+    low, high = min(array), max(array)
+
     # Create buckets
     bucket = []
-    for i in range(len(array)):
+    for i in range(n):
         bucket.append([])
-    n = len(bucket)
-
-    # Assign values to buckets
-    for j in array:
-        index_b = int(j/n)
-        bucket[index_b].append(j)
-        yield array, j, -1, index_b, -1
 
-    # Sort each bucket
-    for i in range(len(array)):
-        bucket[i] = sorted(bucket[i])
+    # Assign values to buckets, spreading the value range over all of them
+    for i in range(n):
+        yield READ, i, -1, -1, -1
+        index_b = (array[i] - low) * n // (high - low + 1)
+        bucket[index_b].append(array[i])
 
-    # Merge the buckets to create the sorted array
+    # Merge the buckets back into the array, insertion sorting each one
+    # in place as it lands
     k = 0
-    for i in range(len(array)):
-        for j in range(len(bucket[i])):
-            yield array, k, -1, i, -1
-            array[k] = bucket[i][j]
-            increment_swaps()
+    for i in range(n):
+        first = k
+        for value in bucket[i]:
+            yield WRITE, k, value, first, -1
+            array[k] = value
             k += 1
+        for m in range(first + 1, k):
+            key = array[m]
+            j = m - 1
+            while j >= first:
+                yield COMPARE, j, -1, first, k - 1
+                if array[j] > key:
+                    yield WRITE, j + 1, array[j], first, k - 1
+                    array[j + 1] = array[j]
+                    j -= 1
+                else:
+                    break
+            if j + 1 != m:
+                yield WRITE, j + 1, key, first, k - 1
+                array[j + 1] = key
@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def cocktailSort(array, *args):
     """    
@@ -16,21 +16,19 @@ def cocktailSort(array, *args):
     while swapped:
         swapped = False
         for i in range(start, end):
-            yield array, i, i+1, -1, -1
-            increment_comparisons()
+            yield COMPARE, i, i+1, -1, -1
             if (array[i] > array[i+1]):
+                yield SWAP, i, i+1, -1, -1
                 array[i], array[i+1] = array[i+1], array[i]
-                increment_swaps()
                 swapped = True
         if swapped is False:
             break
         swapped = False
         end = end-1
         for i in range(end-1, start-1, -1):
-            yield array, -1, -1, i, i+1
-            increment_comparisons()
+            yield COMPARE, i, i+1, -1, -1
             if (array[i] > array[i+1]):
+                yield SWAP, i, i+1, -1, -1
                 array[i], array[i+1] = array[i+1], array[i]
-                increment_swaps()
                 swapped = True
         start = start+1
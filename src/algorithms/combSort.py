@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def get_gap(prev_gap) -> int:
     """
@@ -32,9 +32,8 @@ def combSort(array, *args):
         swapped = False
 
         for idx in range(0, size - gap):
-            yield array, idx, idx+gap, -1, -1
-            increment_comparisons()
+            yield COMPARE, idx, idx+gap, -1, -1
             if array[idx] > array[idx + gap]:
+                yield SWAP, idx, idx+gap, -1, -1
                 array[idx], array[idx + gap] = array[idx + gap], array[idx]
-                increment_swaps()
                 swapped = True
@@ -1,4 +1,4 @@
-from counters import increment_swaps
+from events import READ, WRITE
 
 def countingSort(array, *args):
     """
@@ -16,11 +16,11 @@ def countingSort(array, *args):
     A = array.copy()
     C = [0]*(max(A)+1)
     for i in range(size):
+        yield READ, i, -1, -1, -1
         C[A[i]] += 1
     for i in range(1, len(C)):
         C[i] += C[i-1]
     for i in range(0, size):
-        yield array, C[A[size-i-1]]-1, -1, size-i-1, -1
+        yield WRITE, C[A[size-i-1]]-1, A[size-i-1], size-i-1, -1
         array[C[A[size-i-1]]-1] = A[size-i-1]
-        increment_swaps()
         C[A[size-i-1]] -= 1
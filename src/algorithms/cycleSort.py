@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, WRITE
 
 def cycleSort(array, *args):
     """
@@ -16,7 +16,7 @@ def cycleSort(array, *args):
         pos = cycle_start
         
         for i in range(cycle_start + 1, len(array)):
-            increment_comparisons()
+            yield COMPARE, i, -1, cycle_start, -1
             if array[i] < item:
                 pos += 1
 
@@ -25,19 +25,17 @@ def cycleSort(array, *args):
 
         while array[pos] == item:
             pos += 1
-        yield array, cycle_start, pos, -1, -1
+        yield WRITE, pos, item, cycle_start, -1
         array[pos], item = item, array[pos]
-        increment_swaps()
 
         while pos != cycle_start:
             pos = cycle_start
             for i in range(cycle_start + 1, len(array)):
-                increment_comparisons()
+                yield COMPARE, i, -1, cycle_start, -1
                 if array[i] < item:
                     pos += 1
 
             while array[pos] == item:
                 pos += 1
-            yield array, cycle_start, pos, -1, -1
+            yield WRITE, pos, item, cycle_start, -1
             array[pos], item = item, array[pos]
-            increment_swaps()
@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def exchangeSort(array, *args):
     """
@@ -14,8 +14,7 @@ def exchangeSort(array, *args):
     size = len(array)
     for i in range(size - 1):
         for j in range(i + 1, size):
-            yield array, i, j, -1, -1
-            increment_comparisons()
+            yield COMPARE, i, j, -1, -1
             if array[i] > array[j]:
+                yield SWAP, i, j, -1, -1
                 array[j], array[i] = array[i], array[j]
-                increment_swaps()
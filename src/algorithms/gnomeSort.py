@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP, HIGHLIGHT
 
 def gnomeSort(a, *args):
     """
@@ -10,12 +10,14 @@ def gnomeSort(a, *args):
     """
     i, size = 0, len(a)
     while i < size:
-        increment_comparisons()
-        if a[i-1] <= a[i] or i == 0:
-             yield a, i, i-1, -1, -1
+        if i == 0:
+            yield HIGHLIGHT, i, -1, -1, -1
+            i += 1
+            continue
+        yield COMPARE, i, i-1, -1, -1
+        if a[i-1] <= a[i]:
              i += 1
         else:
-            yield a, i, i-1, -1, -1
+            yield SWAP, i, i-1, -1, -1
             a[i-1],a[i] = a[i],a[i-1]
-            increment_swaps()
             i -= 1
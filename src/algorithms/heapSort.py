@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def heapSort(array, *args):
     """
@@ -13,14 +13,13 @@ def heapSort(array, *args):
     until all elements have been extracted and placed in their correct position 
     in the sorted array. 
     
-    Time complexity: O(nlog²n).
+    Time complexity: O(n log n) in every case.
     """
     yield from heapify(array, len(array))
     end = len(array) - 1
     while end > 0:
-        yield array, -1, -1, 0, end
+        yield SWAP, 0, end, -1, end
         array[end], array[0] = array[0], array[end]
-        increment_swaps()
         end -= 1
         yield from siftDown(array, 0, end)
 
@@ -44,17 +43,16 @@ def siftDown(array, start, end):
     while 2 * root + 1 <= end:
         child = 2 * root + 1
         swap = root
-        increment_comparisons()
+        yield COMPARE, swap, child, -1, end
         if array[swap] < array[child]:
             swap = child
         if child + 1 <= end:
-            increment_comparisons()
+            yield COMPARE, swap, child + 1, -1, end
             if array[swap] < array[child + 1]:
                 swap = child + 1
         if swap == root:
             return
         else:
-            yield array, root, swap, -1, -1
+            yield SWAP, root, swap, -1, end
             array[root], array[swap] = array[swap], array[root]
-            increment_swaps()
             root = swap
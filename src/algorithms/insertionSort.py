@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, WRITE
 
 def insertionSort(array, *args):
     """
@@ -20,13 +20,14 @@ def insertionSort(array, *args):
         key = array[i]
         mySortedRows.append(i)
         while j >= 0:
-            yield array, j, -1, i, -1
-            increment_comparisons()
+            yield COMPARE, j, -1, i, -1
             if array[j] > key:
+                yield WRITE, j+1, array[j], i, -1
                 array[j+1] = array[j]
-                increment_swaps()
                 j -= 1
             else:
                 break
-        array[j+1] = key
+        if j+1 != i:
+            yield WRITE, j+1, key, i, -1
+            array[j+1] = key
     mySortedRows.clear()
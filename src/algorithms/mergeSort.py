@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, WRITE
 
 def mergeSort(array, left, right):
     """
@@ -9,7 +9,8 @@ def mergeSort(array, left, right):
     each half before merging them back together. This process 
     is repeated until the entire list is sorted. 
     
-    Time complexity: O(nlog²n).
+    Time complexity: O(n log n) in every case, with O(n) extra memory for the
+    merge buffers.
     """
     if left < right:
         mid = int((left+right)/2)
@@ -28,25 +29,25 @@ def merge(array, left, mid, right):
     j = 0
     k = left
     while i < len(L) and j < len(R):
-         # The two lines below are not part of the algorithm
-        yield array, left+i, mid+j, left, right
-        increment_comparisons()
+        # L[i] is only held in L; R[j] still sits at mid+1+j
+        yield COMPARE, mid+1+j, -1, left, right
         if L[i] < R[j]:
+            yield WRITE, k, L[i], left, right
             array[k] = L[i]
             i += 1
         else:
+            yield WRITE, k, R[j], left, right
             array[k] = R[j]
             j += 1
-        increment_swaps()
         k += 1
     while i < len(L):
+        yield WRITE, k, L[i], left, right
         array[k] = L[i]
         i += 1
         k += 1
-        increment_swaps()
     while j < len(R):
+        yield WRITE, k, R[j], left, right
         array[k] = R[j]
         j += 1
         k += 1
-        increment_swaps()
 
@@ -1,14 +1,14 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def swap(array, i, j):
     """
     Swaps the elements of the array at the given indices.
     """
 
+    yield SWAP, i, j, -1, -1
     temp = array[i]
     array[i] = array[j]
     array[j] = temp
-    increment_swaps()
 
 def oddevenSort(array, *args):
     """
@@ -24,15 +24,13 @@ def oddevenSort(array, *args):
     while not sorted:
         sorted = True
         for i in range(1, len(array) - 1, 2):
-            yield array, i, i + 1, -1, -1
-            increment_comparisons()
+            yield COMPARE, i, i + 1, -1, -1
             if array[i] > array[i + 1]:
-                swap(array, i, i + 1)
+                yield from swap(array, i, i + 1)
                 sorted = False
 
         for i in range(0, len(array) - 1, 2):
-            yield array, i, i + 1, -1, -1
-            increment_comparisons()
+            yield COMPARE, i, i + 1, -1, -1
             if array[i] > array[i + 1]:
-                swap(array, i, i + 1)
+                yield from swap(array, i, i + 1)
                 sorted = False
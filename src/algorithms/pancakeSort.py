@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def pancakeSort(array, *args):
     """
@@ -14,24 +14,20 @@ def pancakeSort(array, *args):
         max_index = 0
         max_val = array[0]
         for j in range(len(array) - i):
-            increment_comparisons()
+            yield COMPARE, j, max_index, -1, len(array) - 1 - i
             if array[j] > max_val:
                 max_val = array[j]
                 max_index = j
-        yield array, max_index, -1, -1, -1
-        flip(array, max_index)
-        increment_swaps()
-        yield array, 0, -1, -1, -1
-        flip(array, len(array) - 1 - i)
-        increment_swaps()
-        yield array, -1 , -1, len(array) - 1 - i, -1
+        yield from flip(array, max_index)
+        yield from flip(array, len(array) - 1 - i)
 
 
 def flip(array, n):
     """
-    Flips the first n elements of an array.
+    Flips the first n + 1 elements of an array, yielding a SWAP per pair.
     """
     for i in range(n):
         if i >= n - i:
             break
+        yield SWAP, i, n - i, -1, n
         array[n - i], array[i] = array[i], array[n - i]
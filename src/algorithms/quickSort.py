@@ -1,8 +1,7 @@
 import random
-from random import randint
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
-def quickSort(array, left, right):
+def quickSort(array, left, right, rng=random):
     """
     QuickSort works by selecting a pivot element from the array and partitioning the other 
     elements into two sub-arrays, according to whether they are less than or greater 
@@ -10,23 +9,26 @@ def quickSort(array, left, right):
     contain only one element or are empty. The sub-arrays are then combined to form the final 
     sorted array. 
 
-    Time complexity: O(nlog²n).
+    Time complexity: O(n log n) on average, O(n^2) in the worst case, which the
+    random pivot makes very unlikely for any input.
+
+    Pivots are drawn from `rng` (a random.Random, or the random module by
+    default), so a seeded rng makes the run reproducible.
     """
     if left >= right:
         return
     index = left
-    random_index = randint(left, right)
+    random_index = rng.randint(left, right)
+    yield SWAP, right, random_index, left, right
     array[right], array[random_index] = array[random_index], array[right]
-    increment_swaps()
     
     for j in range(left, right):
-        yield array, j, right, index, -1
-        increment_comparisons()
+        yield COMPARE, j, right, index, -1
         if array[j] < array[right]:
+            yield SWAP, j, index, index, -1
             array[j], array[index] = array[index], array[j]
-            increment_swaps()
             index += 1
+    yield SWAP, index, right, left, right
     array[index], array[right] = array[right], array[index]
-    increment_swaps()
-    yield from quickSort(array, index + 1, right)
-    yield from quickSort(array, left, index - 1)
+    yield from quickSort(array, index + 1, right, rng)
+    yield from quickSort(array, left, index - 1, rng)
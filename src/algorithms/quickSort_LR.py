@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def quickSort_LR(array, low, high):
     """
@@ -8,12 +8,12 @@ def quickSort_LR(array, low, high):
     subarrays, such that all elements to the left of the pivot are less than or equal to the pivot, 
     and all elements to the right are greater than or equal to the pivot.
 
-    Time complexity: O(nlog²n).
+    Time complexity: O(n log n) on average, O(n^2) in the worst case. The pivot
+    is the first element, so already sorted or reversed input is the worst case.
     """
 
     if low < high:
-        p = partition(array, low, high)
-        yield array, p, high, low, -1
+        p = yield from partition(array, low, high)
         yield from quickSort_LR(array, low, p)
         yield from quickSort_LR(array, p + 1, high)
 
@@ -21,6 +21,9 @@ def partition(array, low, high):
     """
     Partitions the array into two subarrays around a pivot element and returns the pivot index.
 
+    It is a generator: it yields the partition's events and returns the index,
+    so callers use `p = yield from partition(array, low, high)`.
+
     Returns:
         An integer index of the pivot element after partitioning the array.
     """
@@ -31,18 +34,18 @@ def partition(array, low, high):
 
     while True:
         i += 1
-        increment_comparisons()
+        yield COMPARE, i, -1, low, high
         while array[i] < pivot:
             i += 1
-            increment_comparisons()
+            yield COMPARE, i, -1, low, high
 
         j -= 1
-        increment_comparisons()
+        yield COMPARE, j, -1, low, high
         while array[j] > pivot:
             j -= 1
-            increment_comparisons()
+            yield COMPARE, j, -1, low, high
 
         if i >= j:
             return j
+        yield SWAP, i, j, low, high
         array[i], array[j] = array[j], array[i]
-        increment_swaps()
@@ -1,4 +1,4 @@
-from counters import increment_swaps
+from events import READ, WRITE
 
 def counting_Sort(array, exp1):
     """
@@ -20,10 +20,9 @@ def counting_Sort(array, exp1):
     i = n - 1
     while i >= 0:
         index = (array[i] / exp1)
-        yield output, count[int(index % 10)]-1, -1, int(index % 10), -1
+        yield READ, i, -1, count[int(index % 10)]-1, -1
         output[count[int(index % 10)] - 1] = array[i]
         count[int(index % 10)] -= 1
-        increment_swaps()
         i -= 1
     i = 0
     if(array != output):
@@ -31,6 +30,7 @@ def counting_Sort(array, exp1):
     else:
         return 0
     for i in range(0, len(array)):
+        yield WRITE, i, output[i], -1, -1
         array[i] = output[i]
     del(output)
 
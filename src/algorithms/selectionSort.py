@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def selectionSort(array, *args):
     """
@@ -14,10 +14,9 @@ def selectionSort(array, *args):
     for i in range(size-1):
         smallIndex = i
         for j in range(i, size):
-            yield array, j, -1, i, -1
-            increment_comparisons()
+            yield COMPARE, j, smallIndex, i, -1
             if array[j] < array[smallIndex]:
                 smallIndex = j
         if smallIndex != i:
+            yield SWAP, i, smallIndex, -1, -1
             array[i], array[smallIndex] = array[smallIndex], array[i]
-            increment_swaps()
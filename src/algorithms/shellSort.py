@@ -1,5 +1,5 @@
 from math import ceil, floor
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, WRITE
 
 
 def getShellGaps(N):
@@ -90,13 +90,13 @@ def shellSort(array, *args, gapType="ciura"):
         for i in range(gap, len(array)):
             temp, j = array[i], i
             while j >= gap:
-                yield array, j, j - gap, -1, -1
-                increment_comparisons()
+                yield COMPARE, j - gap, -1, i, j
                 if array[j - gap] > temp:
+                    yield WRITE, j, array[j - gap], i, j
                     array[j] = array[j - gap]
-                    increment_swaps()
                     j -= gap
                 else:
                     break
-            yield array, -1, -1, i, j
-            array[j] = temp
+            if j != i:
+                yield WRITE, j, temp, i, j
+                array[j] = temp
@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def slowSort(array, *args):
     """
@@ -21,11 +21,10 @@ def slowSort(array, *args):
 
         yield from recursiveSlowSort(array, middle_idx + 1, end)
 
-        increment_comparisons()
+        yield COMPARE, middle_idx, end, start, -1
         if array[end] < array[middle_idx]:
+            yield SWAP, middle_idx, end, start, -1
             array[end], array[middle_idx] = array[middle_idx], array[end]
-            increment_swaps()
-            yield array, start, middle_idx, end, -1
 
         yield from recursiveSlowSort(array, start, end - 1)
 
@@ -1,5 +1,5 @@
 from math import floor
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, SWAP
 
 def stoogeSort(arr, l, h):
     """
@@ -14,14 +14,13 @@ def stoogeSort(arr, l, h):
     if l >= h:
         return
 
-    increment_comparisons()
+    middle = floor((h + l) / 2)
+    yield COMPARE, l, h, middle, -1
     if arr[l] > arr[h]:
-        middle = floor((h + l) / 2)
-        yield arr, l, h, middle, -1
+        yield SWAP, l, h, middle, -1
         t = arr[l]
         arr[l] = arr[h]
         arr[h] = t
-        increment_swaps()
 
     if h-l + 1 > 2:
         t = (int)((h-l + 1)/3)
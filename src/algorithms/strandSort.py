@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, WRITE
 
 def merge(array, left, mid, right):
     """
@@ -14,27 +14,27 @@ def merge(array, left, mid, right):
     j = 0
     k = left
     while i < len(L) and j < len(R):
-        # The two lines below is not part of the algorithm
-        yield array, left+i, mid+j, left, right
-        increment_comparisons()
+        # L[i] is only held in L; R[j] still sits at mid+1+j
+        yield COMPARE, mid+1+j, -1, left, right
         if L[i] < R[j]:
+            yield WRITE, k, L[i], left, right
             array[k] = L[i]
             i += 1
         else:
+            yield WRITE, k, R[j], left, right
             array[k] = R[j]
             j += 1
-        increment_swaps()
         k += 1
     while i < len(L):
+        yield WRITE, k, L[i], left, right
         array[k] = L[i]
         i += 1
         k += 1
-        increment_swaps()
     while j < len(R):
+        yield WRITE, k, R[j], left, right
         array[k] = R[j]
         j += 1
         k += 1
-        increment_swaps()
 
              
 def helper(arr,n,start):
@@ -50,12 +50,16 @@ def helper(arr,n,start):
     count=start+1
 
     while i<n:
-        #next line not a part of algo
-        yield arr,i,count-1,start,n-1
-        increment_comparisons()
+        yield COMPARE,i,count-1,start,n-1
         if arr[i]>arr[count-1]:
-            arr.insert(count,arr.pop(i))
-            increment_swaps()
+            # Move arr[i] to the end of the strand, shifting the rest up
+            value=arr[i]
+            for m in range(i,count,-1):
+                yield WRITE,m,arr[m-1],start,n-1
+                arr[m]=arr[m-1]
+            if i!=count:
+                yield WRITE,count,value,start,n-1
+                arr[count]=value
             count+=1
         i+=1
     if start!=0:
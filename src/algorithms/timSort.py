@@ -1,5 +1,5 @@
 from algorithms.binaryinsertionSort import binary_search
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, WRITE
 
 
 def calculate_min_run(n):
@@ -33,13 +33,14 @@ def binaryinsertionSort(arr, start, end):
     """
     for i in range(start, end + 1):
         val = arr[i]
-        j   = binary_search(arr, val, start, i - 1)
-        yield arr, start, i-1, j, i
-        # Count swaps for shifting elements
+        j   = yield from binary_search(arr, val, start, i - 1, i)
+        # Shift the sorted part right of j up by one
         for k in range(i, j, -1):
+            yield WRITE, k, arr[k-1], start, i
             arr[k] = arr[k-1]
-            increment_swaps()
-        arr[j] = val
+        if j != i:
+            yield WRITE, j, val, start, i
+            arr[j] = val
 
 
 def merge(arr, left, mid, right):
@@ -54,26 +55,27 @@ def merge(arr, left, mid, right):
 
     k, i, j = left, 0, 0
     while i < left_arr_size and j < right_arr_size:
-        yield arr, left + i, mid + j, left, right
-        increment_comparisons()
+        # left_arr[i] is only held in the copy; right_arr[j] still sits at mid+1+j
+        yield COMPARE, mid + 1 + j, -1, left, right
 
         if left_arr[i] <= right_arr[j]:
+            yield WRITE, k, left_arr[i], left, right
             arr[k] = left_arr[i]
             i += 1
 
         else:
+            yield WRITE, k, right_arr[j], left, right
             arr[k] = right_arr[j]
             j += 1
 
-        increment_swaps()
         k += 1
 
-    if i < left_arr_size:
-        arr[k:right + 1] = left_arr[i:]
-        increment_swaps()
-    else:
-        arr[k:right + 1] = right_arr[j:]
-        increment_swaps()
+    # Copy the rest of whichever side is left over
+    rest = left_arr[i:] if i < left_arr_size else right_arr[j:]
+    for value in rest:
+        yield WRITE, k, value, left, right
+        arr[k] = value
+        k += 1
 
 
 def timSort(arr, beginning, ending):
@@ -85,7 +87,8 @@ def timSort(arr, beginning, ending):
     and the worst-case time complexity of Merge Sort to achieve good performance on both
     small and large lists.
 
-    Time complexity: O(nlog²n).
+    Time complexity: O(n log n); the insertion-sorted runs are at most
+    min_run (32 to 64) long, so their quadratic cost stays a constant factor.
 
     """
     arr_len = len(arr)
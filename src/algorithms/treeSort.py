@@ -1,4 +1,4 @@
-from counters import increment_comparisons, increment_swaps
+from events import COMPARE, WRITE, HIGHLIGHT
 
 class Node:
     def __init__(self, val, pos):
@@ -36,27 +36,26 @@ def treeSort(array, *args):
     for i in range(len(array)):
         if root is None:
             root = Node(array[i], i)
-            yield array, i, -1, -1, -1
+            yield HIGHLIGHT, i, -1, -1, -1
             continue
         current = root
         while True:
-            increment_comparisons()
+            yield COMPARE, i, current.pos, -1, -1
             if current.val > array[i]:
                 if current.l:
                     current = current.l
                     continue
                 current.l = Node(array[i], i)
-                increment_swaps()
-                yield array, i, current.pos, -1, -1
                 break
-            increment_comparisons()
             if current.r:
                 current = current.r
                 continue
             current.r = Node(array[i], i)
-            increment_swaps()
-            yield array, i, current.pos, -1, -1
             break
+    if root is None:
+        return
     res = []
     root.display(res)
-    yield res, -1, -1, -1, -1
+    for i, value in enumerate(res):
+        yield WRITE, i, value, -1, -1
+        array[i] = value
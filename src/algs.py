@@ -1,32 +1,291 @@
-from algorithms import *
-
-# Map sorting algorithm names to their respective implementations
-algorithmsDict = {
-    'insertionSort'       : insertionSort,
-    'bubbleSort'          : bubbleSort,
-    'selectionSort'       : selectionSort,
-    'mergeSort'           : mergeSort,
-    'quickSort'           : quickSort,
-    'countingSort'        : countingSort,
-    'cocktailSort'        : cocktailSort,
-    'cycleSort'           : cycleSort,
-    'bogoSort'            : bogoSort,
-    'heapSort'            : heapSort,
-    'radixSort'           : radixSort,
-    'shellSort'           : shellSort,
-    'gnomeSort'           : gnomeSort,
-    'combSort'            : combSort,
-    'bitonicSort'         : bitonicSort,
-    'pancakeSort'         : pancakeSort,
-    'binaryInsertionSort': binaryinsertionSort,
-    'bucketSort'          : bucketSort,
-    'timSort'             : timSort,
-    'stoogeSort'          : stoogeSort,
-    'strandSort'          : strandSort,
-    'oddEvenSort'        : oddevenSort,
-    'pigeonholeSort'      : pigeonholeSort,
-    'exchangeSort'        : exchangeSort,
-    'treeSort'            : treeSort,
-    'slowSort'            : slowSort,
-}
+"""
+The algorithm registry.
 
+REGISTRY maps every algorithm name to an AlgorithmInfo: where its
+event-yielding function lives and whether the GUI offers it. Nothing is
+imported until an algorithm is first looked up in one of the dicts below,
+so listing the names (the dropdowns, `benchmark --list`) is free and a run
+only pays for the modules it uses.
+
+Besides the built-ins in algorithms/, the registry picks up plugins the
+first time it is listed or misses a name:
+
+    * every *.py file in src/plugins/ and in the directories named by the
+      SORT_PLUGINS environment variable (os.pathsep separated), defining a
+      generator function named after the file, e.g. plugins/beadSort.py
+      defines beadSort(array, start, end);
+    * every entry point in the ENTRY_POINT_GROUP group of an installed
+      distribution, e.g. `beadSort = "mysorts.bead:beadSort"`.
+
+Plugins follow the same event protocol as the built-ins (see events.py)
+and may not reuse a built-in name.
+"""
+
+import functools
+import importlib
+import os
+import random
+import sys
+import warnings
+from collections import namedtuple
+from collections.abc import Mapping
+
+from events import framed
+
+# module: import path, or the path of a plugin file; function: the name of
+# the generator function in it (the built-ins are attributes of the lazy
+# algorithms package, which imports algorithms/<function>.py on access);
+# listed: offered in the GUI dropdowns; origin: 'builtin', 'plugin' or
+# 'entry point'
+AlgorithmInfo = namedtuple('AlgorithmInfo', 'name module function listed origin')
+
+PLUGIN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'plugins')
+PLUGIN_PATH_ENV = 'SORT_PLUGINS'
+ENTRY_POINT_GROUP = 'sorting_visualizer.algorithms'
+
+# name -> AlgorithmInfo, in menu order
+REGISTRY = {}
+
+
+def register(name: str, module: str, function: str = None,
+             listed: bool = True, origin: str = 'plugin') -> AlgorithmInfo:
+    """
+    Add an algorithm to the registry without importing it.
+
+    Parameters
+    ----------
+    name : str
+        Name shown in the GUI and accepted by the headless tools.
+    module : str
+        Import path of the module that defines the algorithm, or the path
+        of a .py file.
+    function : str, optional
+        Name of the generator function in that module; defaults to `name`.
+    listed : bool
+        Whether the GUI offers it; unlisted algorithms can still be run
+        headless (benchmark, sweep).
+    origin : str
+        Where the entry came from, for messages.
+
+    Raises ValueError if the name is already taken.
+    """
+    if name in REGISTRY:
+        raise ValueError(f'algorithm {name!r} is already registered '
+                         f'({REGISTRY[name].origin}: {REGISTRY[name].module})')
+    info = REGISTRY[name] = AlgorithmInfo(name, module, function or name, listed, origin)
+    return info
+
+
+for _name, _function in (
+        ('insertionSort',       'insertionSort'),
+        ('bubbleSort',          'bubbleSort'),
+        ('selectionSort',       'selectionSort'),
+        ('mergeSort',           'mergeSort'),
+        ('quickSort',           'quickSort'),
+        ('countingSort',        'countingSort'),
+        ('cocktailSort',        'cocktailSort'),
+        ('cycleSort',           'cycleSort'),
+        ('bogoSort',            'bogoSort'),
+        ('heapSort',            'heapSort'),
+        ('radixSort',           'radixSort'),
+        ('shellSort',           'shellSort'),
+        ('gnomeSort',           'gnomeSort'),
+        ('combSort',            'combSort'),
+        ('bitonicSort',         'bitonicSort'),
+        ('pancakeSort',         'pancakeSort'),
+        ('binaryInsertionSort', 'binaryinsertionSort'),
+        ('bucketSort',          'bucketSort'),
+        ('timSort',             'timSort'),
+        ('stoogeSort',          'stoogeSort'),
+        ('strandSort',          'strandSort'),
+        ('oddEvenSort',         'oddevenSort'),
+        ('pigeonholeSort',      'pigeonholeSort'),
+        ('exchangeSort',        'exchangeSort'),
+        ('treeSort',            'treeSort'),
+        ('slowSort',            'slowSort')):
+    register(_name, 'algorithms', _function, origin='builtin')
+# Not offered in the GUI but can be run headless
+register('quickSort_LR', 'algorithms', listed=False, origin='builtin')
+
+
+_discovered = False
+
+
+def _plugin_dirs():
+    dirs = [PLUGIN_DIR]
+    dirs += [path for path in os.environ.get(PLUGIN_PATH_ENV, '').split(os.pathsep) if path]
+    return dirs
+
+
+def _declares_group(path):
+    header = f'[{ENTRY_POINT_GROUP}]'
+    try:
+        with open(path, encoding='utf-8') as f:
+            return header in f.read()
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def _entry_points():
+    # importlib.metadata takes longer to import than everything else a
+    # headless run needs, so look for a distribution that declares the
+    # group at all before asking it
+    declared = any(
+        _declares_group(os.path.join(directory, name, 'entry_points.txt'))
+        for directory in sys.path if directory and os.path.isdir(directory)
+        for name in os.listdir(directory) if name.endswith(('.dist-info', '.egg-info')))
+    if not declared:
+        return []
+    from importlib.metadata import entry_points
+    try:
+        return entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:
+        # Python < 3.10: a dict of group -> entry points
+        return entry_points().get(ENTRY_POINT_GROUP, [])
+
+
+def discover_plugins():
+    """
+    Register the plugins (see the module docstring), once. Only file names
+    and entry point metadata are read; the plugins are imported when first
+    used. A plugin whose name is taken is skipped with a warning.
+    """
+    global _discovered
+    if _discovered:
+        return
+    _discovered = True
+
+    found = []      # (name, module, function, origin)
+    for directory in _plugin_dirs():
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            stem, ext = os.path.splitext(filename)
+            if ext == '.py' and stem.isidentifier() and not stem.startswith('_'):
+                found.append((stem, os.path.join(directory, filename), stem, 'plugin'))
+    for entry in _entry_points():
+        module, _, function = entry.value.partition(':')
+        found.append((entry.name, module.strip(), function.strip() or entry.name, 'entry point'))
+
+    for name, module, function, origin in found:
+        try:
+            register(name, module, function, origin=origin)
+        except ValueError as e:
+            warnings.warn(f'{origin} {module} skipped: {e}', stacklevel=2)
+
+
+def get_info(name: str) -> AlgorithmInfo:
+    """The registry entry of `name`; KeyError if there is none, even among the plugins."""
+    if name not in REGISTRY:
+        discover_plugins()
+    return REGISTRY[name]
+
+
+def _import(info: AlgorithmInfo):
+    if info.module.endswith('.py'):
+        # Plugin file: a top-level module of its own, so that fastalgs and
+        # inspect find it in sys.modules like any other
+        module_name = f'sort_plugin_{info.function}'
+        module = sys.modules.get(module_name)
+        if module is None:
+            from importlib.util import module_from_spec, spec_from_file_location
+            spec = spec_from_file_location(module_name, info.module)
+            module = module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                del sys.modules[module_name]
+                raise
+    else:
+        module = importlib.import_module(info.module)
+    return getattr(module, info.function)
+
+
+@functools.lru_cache(maxsize=None)
+def load(name: str):
+    """The event-yielding function of algorithm `name`, imported on first call."""
+    return _import(get_info(name))
+
+
+class _Algorithms(Mapping):
+    """
+    Read-only mapping from algorithm name to its (optionally wrapped)
+    function, over REGISTRY.
+
+    Iterating lists the names without importing anything; each algorithm
+    is imported the first time it is looked up.
+    """
+
+    def __init__(self, listed: bool = None, wrap=None):
+        self._listed = listed       # True / False: only (un)listed algorithms, None: all
+        self._wrap = wrap
+        self._cache = {}
+
+    def _names(self):
+        discover_plugins()
+        return [name for name, info in REGISTRY.items()
+                if self._listed is None or info.listed == self._listed]
+
+    def __getitem__(self, name):
+        value = self._cache.get(name)
+        if value is None:
+            if name not in self:
+                raise KeyError(name)
+            value = load(name)
+            if self._wrap is not None:
+                value = self._wrap(value)
+            self._cache[name] = value
+        return value
+
+    def __contains__(self, name):
+        try:
+            info = get_info(name)
+        except (KeyError, TypeError):
+            return False
+        return self._listed is None or info.listed == self._listed
+
+    def __iter__(self):
+        return iter(self._names())
+
+    def __len__(self):
+        return len(self._names())
+
+
+# Map sorting algorithm names to their event-yielding implementations
+eventsDict = _Algorithms(listed=True)
+
+# The same algorithms as (array, red1, red2, blue1, blue2) frame generators
+# that count into the current counter; this is what the visualizer, the
+# trace recorder and the benchmark drive.
+algorithmsDict = _Algorithms(listed=True, wrap=framed)
+
+# Implementations that are not offered in the GUI but can be run headless
+# (benchmark, sweep); allAlgorithmsDict has them next to algorithmsDict
+unlistedEventsDict = _Algorithms(listed=False)
+allAlgorithmsDict = _Algorithms(wrap=framed)
+
+
+def _make_fast(sort):
+    # fastalgs needs ast and inspect, which only pay off once a variant is compiled
+    from fastalgs import make_fast
+    return make_fast(sort)
+
+
+# Uninstrumented variants (no yields, no counters) generated from the same
+# source by fastalgs, for measuring pure algorithm time. Compiled on first use.
+fastAlgorithmsDict = _Algorithms(wrap=_make_fast)
+
+
+def seeded(sort, seed):
+    """
+    Give `sort` its own random.Random(seed) if it takes an `rng` argument.
+
+    Algorithms that use randomness (quickSort's pivots, bogoSort's shuffles)
+    accept `rng=`; the others are returned unchanged. Call this once per
+    run so every run starts from the same random state.
+    """
+    import inspect
+    if 'rng' in inspect.signature(sort).parameters:
+        return functools.partial(sort, rng=random.Random(seed))
+    return sort
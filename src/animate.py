@@ -0,0 +1,346 @@
+"""
+Offscreen export of a sort run as an animated GIF, PNG frames or raw video.
+
+Usage (from the src/ directory):
+
+    python -m animate bubbleSort --size 60 --seed 1 -o bubble_sort.gif
+    python -m animate mergeSort -n 2000 --every 10 -o frames/       # PNG files
+    python -m animate quickSort -n 500 -o - | ffmpeg -f rawvideo -pix_fmt rgb24 \\
+        -s 900x400 -r 30 -i - quick_sort.mp4
+
+The run is recorded once with optrace, without drawing anything, so it
+takes about as long as the benchmark. Frame decimation keeps every
+`every`-th frame (by default just enough of them to stay within
+MAX_FRAMES), plus the first and the sorted last one. The kept frames are
+split into consecutive chunks that a pool of worker processes rasterizes
+in parallel: each worker continues the replay from a TracePlayer.state()
+taken at the start of its chunk and draws with the renderer's bar
+renderers, in the GUI's colours, on a plain pygame.Surface under SDL's
+dummy video driver. No window is opened.
+
+Runs predicted to take more steps than the step budget (see algmeta) are
+refused, like in the benchmark; --step-budget 0 allows them.
+
+GIF output needs Pillow (optional, like NumPy for the renderer). Any other
+output is a directory of PNG files, or '-' for raw RGB24 frames on stdout.
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Surfaces only; never open a window, even where a display exists
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame
+
+try:
+    from PIL import Image
+except ImportError:     # optional, only needed for GIF output
+    Image = None
+
+from algmeta import DEFAULT_STEP_BUDGET, STEP_BUDGET, STEP_BUDGET_ENV, check_size
+from algs import allAlgorithmsDict, seeded
+from benchmark import spec_argument
+from distributions import DISTRIBUTION_NAMES, canonical, make_input
+from optrace import TracePlayer, record
+from renderer import _heat_color, blue, green, grey, make_bar_renderer, red, white
+
+HAVE_PIL = Image is not None
+
+DEFAULT_WIDTH, DEFAULT_HEIGHT = 900, 400    # the size of the GIFs in res/
+DEFAULT_FPS = 30
+MAX_FRAMES = 600            # frames kept when --every is not given
+MAX_STEPS = 2_000_000       # recorded frames before a run is cut short
+HOLD_MS = 1500              # how long a GIF shows the sorted array
+CHUNKS_PER_WORKER = 4       # smaller chunks balance the pool better
+
+# GIF palette: the bar colours, then the swap-heat gradient in as many
+# steps as fit into 256 entries
+_BASE_COLORS = (white, grey, red, blue, green)
+_PALETTE = list(_BASE_COLORS) + [_heat_color(level, 255 - len(_BASE_COLORS))
+                                 for level in range(256 - len(_BASE_COLORS))]
+
+
+def frame_positions(length: int, every: int = None, max_frames: int = MAX_FRAMES) -> list:
+    """
+    The TracePlayer positions to draw for a trace of `length` frames.
+
+    Keeps position 0 (the input), every `every`-th frame after it and the
+    last one; without `every`, the step is the smallest that keeps the
+    count within `max_frames`.
+    """
+    if every is None:
+        every = max(1, math.ceil(length / max(max_frames - 1, 1)))
+    positions = list(range(0, length + 1, every))
+    if positions[-1] != length:
+        positions.append(length)
+    return positions
+
+
+def _chunks(positions: list, count: int) -> list:
+    size = max(1, math.ceil(len(positions) / count))
+    return [positions[i:i + size] for i in range(0, len(positions), size)]
+
+
+class _Rasterizer:
+    """
+    Draws frames of one trace to bytes, in one process.
+
+    mode is 'gif' (palette indices for the GIF palette), 'raw' (RGB24) or
+    'png' (written to `directory`; returns the file names).
+    """
+
+    def __init__(self, trace, size, mode, heat=False, directory=None):
+        self.trace = trace
+        self.size = size
+        self.mode = mode
+        self.heat = heat
+        self.directory = directory
+        self.max_value = max(trace.initial, default=1) or 1
+        self.heat_threshold = max(len(trace.initial) * 1.5, 1)
+        if mode == 'gif':
+            self._palette = Image.new('P', (1, 1))
+            self._palette.putpalette([c for color in _PALETTE for c in color])
+
+    def render(self, job) -> list:
+        """Draw the positions of one chunk, starting from `state` at its first."""
+        return list(self.frames(job))
+
+    def frames(self, job):
+        """Like render(), but yields each frame as it is drawn."""
+        state, positions = job
+        player = TracePlayer(self.trace, heat=self.heat)
+        player.restore(state)
+        bars = make_bar_renderer((0, 0) + self.size, len(player.array), self.max_value)
+        finished_at = len(self.trace) if self.trace.finished else None
+        for position in positions:
+            player.seek(position)
+            bars.draw(*player.frame(), finished=position == finished_at,
+                      swap_heat=player.heat, heat_threshold=self.heat_threshold,
+                      changed=player.take_changes())
+            yield self._encode(bars.surface, position)
+
+    def _encode(self, surface, position):
+        if self.mode == 'png':
+            path = os.path.join(self.directory, f'frame_{position:08d}.png')
+            pygame.image.save(surface, path)
+            return path
+        if self.mode == 'raw':
+            return pygame.image.tobytes(surface, 'RGB')
+        # RGBX is a straight copy of the surface's pixels, RGB a conversion
+        image = Image.frombytes('RGB', self.size, pygame.image.tobytes(surface, 'RGBX'),
+                                'raw', 'RGBX')
+        return image.quantize(palette=self._palette, dither=Image.Dither.NONE).tobytes()
+
+
+_rasterizer = None      # the worker process' _Rasterizer
+
+
+def _init_worker(*args):
+    global _rasterizer
+    _rasterizer = _Rasterizer(*args)
+
+
+def _render_job(job):
+    return _rasterizer.render(job)
+
+
+def output_mode(output: str) -> str:
+    """'gif', 'raw' or 'png' for an output path."""
+    if output == '-':
+        return 'raw'
+    return 'gif' if output.lower().endswith('.gif') else 'png'
+
+
+def export_run(algorithm: str, output: str, size: int = 100, seed: int = None,
+               distribution: str = 'random', every: int = None,
+               max_frames: int = MAX_FRAMES, frame_size: tuple = (DEFAULT_WIDTH, DEFAULT_HEIGHT),
+               fps: float = DEFAULT_FPS, heat: bool = False, workers: int = None,
+               max_steps: int = MAX_STEPS, log=None) -> dict:
+    """
+    Record one run of `algorithm` and write it as an animation.
+
+    Parameters
+    ----------
+    algorithm : str
+        A key of algs.allAlgorithmsDict.
+    output : str
+        A .gif file (needs Pillow), a directory for PNG frames, or '-' for
+        raw RGB24 frames on stdout.
+    size, seed, distribution
+        The input, as for the benchmark; a seed is drawn if None.
+    every, max_frames
+        Frame decimation, see frame_positions().
+    frame_size : (int, int)
+        Width and height of the frames in pixels.
+    fps : float
+        GIF playback speed.
+    heat : bool
+        Colour the bars by how often they were swapped, as the solo view does.
+    workers : int or None
+        Rasterizing processes; None uses every core, 1 draws in this process.
+    max_steps : int
+        Frames recorded before the run is cut short (bogoSort).
+    log : callable or None
+        Called with progress messages.
+
+    Returns a summary dict.
+    """
+    mode = output_mode(output)
+    if mode == 'gif' and not HAVE_PIL:
+        raise RuntimeError('GIF output needs Pillow (pip install pillow); '
+                           'give a directory for PNG frames instead')
+    log = log or (lambda message: None)
+    seed = seed if seed is not None else random.randrange(2 ** 32)
+    distribution = canonical(distribution, size)
+
+    start = time.perf_counter()
+    values = make_input(distribution, size, seed)
+    trace = record(seeded(allAlgorithmsDict[algorithm], seed), values, 0, size - 1,
+                   max_steps=max_steps)
+    recorded = time.perf_counter()
+    log(f'{algorithm}: {len(trace):,} frames recorded in {recorded - start:.2f}s'
+        + ('' if trace.finished else f' (cut short at {max_steps:,})'))
+
+    positions = frame_positions(len(trace), every, max_frames)
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(positions, workers * CHUNKS_PER_WORKER if workers > 1 else 1)
+    # Replay once to hand every chunk the state at its first position
+    player = TracePlayer(trace, heat=heat)
+    jobs = []
+    for chunk in chunks:
+        player.seek(chunk[0])
+        jobs.append((player.state(), chunk))
+
+    if mode == 'png':
+        os.makedirs(output, exist_ok=True)
+    args = (trace, tuple(frame_size), mode, heat, output if mode == 'png' else None)
+    # Frames are written as they arrive, so the output is never held whole:
+    # in process each one is drawn when the writer asks for it
+    if workers == 1 or len(jobs) == 1:
+        rasterizer = _Rasterizer(*args)
+        results = map(rasterizer.frames, jobs)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=args)
+        results = pool.map(_render_job, jobs)
+    try:
+        if mode == 'raw':
+            out = sys.stdout.buffer
+            for frames in results:
+                out.writelines(frames)
+            out.flush()
+        elif mode == 'gif':
+            _write_gif(output, (frame for frames in results for frame in frames),
+                       len(positions), tuple(frame_size), fps)
+        else:
+            for _ in results:
+                pass
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    elapsed = time.perf_counter() - recorded
+    log(f'{len(positions):,} frames drawn on {min(workers, len(jobs))} worker(s) '
+        f'in {elapsed:.2f}s -> {output}')
+
+    return {
+        'algorithm': algorithm, 'size': size, 'seed': seed, 'distribution': distribution,
+        'recorded_frames': len(trace), 'finished': trace.finished,
+        'frames': len(positions), 'output': output,
+        'record_s': recorded - start, 'render_s': elapsed,
+    }
+
+
+def _write_gif(path: str, frames, count: int, size: tuple, fps: float):
+    # `frames` is an iterator of `count` frames, each made an Image only
+    # when Pillow comes to write it
+    palette = [c for color in _PALETTE for c in color]
+
+    def decode():
+        for data in frames:
+            image = Image.frombytes('P', size, data)
+            image.putpalette(palette)
+            yield image
+
+    images = decode()
+    # GIF delays count in hundredths of a second
+    delay = max(20, round(1000 / fps, -1))
+    durations = [delay] * (count - 1) + [HOLD_MS]
+    next(images).save(path, save_all=True, append_images=images, duration=durations,
+                      loop=0, optimize=False)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m animate',
+        description='Export a sort run as an animated GIF, PNG frames or raw RGB video, '
+                    'without opening a window.')
+    parser.add_argument('algorithm', help='Algorithm name (see python -m benchmark --list).')
+    parser.add_argument('-o', '--output', required=True,
+                        help="A .gif file, a directory for PNG frames, or '-' for raw "
+                             'RGB24 frames on stdout.')
+    parser.add_argument('-n', '--size', type=int, default=100,
+                        help='Array size (default: 100).')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for the input array (default: random).')
+    parser.add_argument('-d', '--distribution', type=spec_argument, default='random',
+                        help='Input distribution: one of ' + ', '.join(DISTRIBUTION_NAMES)
+                             + ' or a spec (default: random).')
+    parser.add_argument('-e', '--every', type=int, default=None,
+                        help=f'Keep every EVERY-th frame (default: as few as keep '
+                             f'--max-frames).')
+    parser.add_argument('--max-frames', type=int, default=MAX_FRAMES,
+                        help=f'Most frames to keep when --every is not given '
+                             f'(default: {MAX_FRAMES}).')
+    parser.add_argument('--width', type=int, default=DEFAULT_WIDTH,
+                        help=f'Frame width in pixels (default: {DEFAULT_WIDTH}).')
+    parser.add_argument('--height', type=int, default=DEFAULT_HEIGHT,
+                        help=f'Frame height in pixels (default: {DEFAULT_HEIGHT}).')
+    parser.add_argument('--fps', type=float, default=DEFAULT_FPS,
+                        help=f'GIF frames per second (default: {DEFAULT_FPS}).')
+    parser.add_argument('--heat', action='store_true',
+                        help='Colour bars by swap count, as the solo view does.')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help=f'Rasterizing processes (default: {os.cpu_count()}).')
+    parser.add_argument('--max-steps', type=int, default=MAX_STEPS,
+                        help=f'Stop recording after this many frames (default: {MAX_STEPS:,}).')
+    parser.add_argument('--step-budget', type=int, default=STEP_BUDGET, metavar='STEPS',
+                        help='Refuse runs predicted to take more steps; 0 for no limit '
+                             f'(default: ${STEP_BUDGET_ENV}, else {DEFAULT_STEP_BUDGET:,}).')
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.algorithm not in allAlgorithmsDict:
+        print(f'Unknown algorithm: {args.algorithm}', file=sys.stderr)
+        return 2
+    if (args.size < 1 or args.width < 1 or args.height < 1 or args.fps <= 0
+            or (args.every is not None and args.every < 1) or args.max_frames < 1):
+        print('--size, --width, --height, --fps, --every and --max-frames must be positive',
+              file=sys.stderr)
+        return 2
+    warning = check_size(args.algorithm, args.size, args.step_budget)
+    if warning:
+        print(warning, file=sys.stderr)
+        return 2
+    try:
+        export_run(args.algorithm, args.output, args.size, args.seed, args.distribution,
+                   every=args.every, max_frames=args.max_frames,
+                   frame_size=(args.width, args.height), fps=args.fps, heat=args.heat,
+                   workers=args.workers, max_steps=args.max_steps,
+                   log=lambda message: print(message, file=sys.stderr))
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""
+Headless benchmark runner for the sorting algorithms.
+
+Drives the generators in algs.allAlgorithmsDict as fast as possible, without
+pygame and without a render loop, and reports the operation counters,
+wall time and yields per second of each run. With --fast it also times the
+uninstrumented variant from algs.fastAlgorithmsDict on the same input.
+
+Usage (from the src/ directory):
+
+    python -m benchmark quickSort --size 1000 --seed 1 --repeat 10
+    python -m benchmark bubbleSort -n 500 --distribution reversed --format json
+    python -m benchmark insertionSort -n 500 -d nearly_sorted:k=10
+    python -m benchmark timSort -n 5000 --fast
+    python -m benchmark --record 42 --profile     # replay leaderboard row 42
+    python -m benchmark --list
+
+Algorithms whose predicted step count at --size exceeds the step budget
+(see algmeta) are skipped with a warning; --step-budget 0 runs them anyway.
+"""
+
+import argparse
+import gc
+import json
+import math
+import random
+import sys
+import time
+
+from algmeta import DEFAULT_STEP_BUDGET, STEP_BUDGET, STEP_BUDGET_ENV, check_size
+from algs import algorithmsDict, allAlgorithmsDict, fastAlgorithmsDict, seeded
+from counters import counting
+from distributions import DISTRIBUTION_NAMES, canonical, make_input, parse_spec
+
+
+def spec_argument(text: str) -> str:
+    """argparse type for a distribution spec such as 'nearly_sorted:k=5'."""
+    try:
+        parse_spec(text)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc))
+    return text
+
+
+def run_once(algorithm: str, array: list, seed: int = None) -> dict:
+    """
+    Drain one generator to completion and return its measurements.
+
+    The array is sorted in place. The run counts into a Counter of its
+    own, so its values belong to this run only. Algorithms that use
+    randomness get a random.Random(seed) of their own (see algs.seeded()).
+    """
+    sort = seeded(allAlgorithmsDict[algorithm], seed)
+    with counting() as counter:
+        start = time.perf_counter()
+        steps = 0
+        for _ in sort(array, 0, len(array) - 1):
+            steps += 1
+        elapsed = time.perf_counter() - start
+    return {
+        'comparisons': counter.comparisons,
+        'swaps':       counter.swaps,
+        'steps':       steps,
+        'elapsed_ms':  elapsed * 1000,
+        'steps_per_s': steps / elapsed if elapsed > 0 else float('inf'),
+        'sorted':      all(array[i] <= array[i + 1] for i in range(len(array) - 1)),
+    }
+
+
+def run_fast_once(algorithm: str, array: list, seed: int = None) -> float:
+    """Sort `array` with the uninstrumented variant and return the wall time in ms."""
+    sort = seeded(fastAlgorithmsDict[algorithm], seed)
+    start = time.perf_counter()
+    sort(array, 0, len(array) - 1)
+    return (time.perf_counter() - start) * 1000
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def benchmark(algorithm: str, size: int, seed: int = None,
+              distribution: str = 'random', repeat: int = 5,
+              warmup: int = 1, disable_gc: bool = False,
+              fast: bool = False) -> dict:
+    """
+    Run `warmup` untimed runs followed by `repeat` timed runs.
+
+    Every run sorts a fresh copy of the same input array, and algorithms
+    that use randomness get a fresh random.Random(seed) each time, so all
+    trials see identical work. When `disable_gc` is set the cyclic garbage
+    collector is switched off for the duration of each trial and a full
+    collection is done between trials instead. With `fast` set, the
+    uninstrumented variant is timed the same way and reported as 'fast_ms'.
+
+    The input comes from distributions.make_input(distribution, size, seed);
+    the summary records the canonical spec, so together with 'size' and
+    'seed' it regenerates the same input.
+
+    Returns a summary dict with the per-trial results under 'trials'.
+    """
+    if algorithm not in allAlgorithmsDict:
+        raise KeyError(f'Unknown algorithm: {algorithm}')
+
+    distribution = canonical(distribution, size)
+    base = make_input(distribution, size, seed)
+
+    for _ in range(warmup):
+        run_once(algorithm, base[:], seed)
+        if fast:
+            run_fast_once(algorithm, base[:], seed)
+
+    trials = _timed_trials(run_once, algorithm, base, seed, repeat, disable_gc)
+    times = [t['elapsed_ms'] for t in trials]
+    rates = [t['steps_per_s'] for t in trials]
+    summary = {
+        'algorithm':    algorithm,
+        'size':         size,
+        'seed':         seed,
+        'distribution': distribution,
+        'warmup':       warmup,
+        'repeat':       repeat,
+        'gc':           'disabled' if disable_gc else 'enabled',
+        'comparisons':  trials[-1]['comparisons'],
+        'swaps':        trials[-1]['swaps'],
+        'steps':        trials[-1]['steps'],
+        'sorted':       all(t['sorted'] for t in trials),
+        'elapsed_ms': {
+            'min':    min(times),
+            'median': percentile(times, 50),
+            'p95':    percentile(times, 95),
+            'mean':   sum(times) / len(times),
+        },
+        'steps_per_s': {
+            'median': percentile(rates, 50),
+        },
+        'trials': trials,
+    }
+
+    if fast:
+        fast_times = _timed_trials(run_fast_once, algorithm, base, seed, repeat, disable_gc)
+        summary['fast_ms'] = {
+            'min':    min(fast_times),
+            'median': percentile(fast_times, 50),
+            'p95':    percentile(fast_times, 95),
+            'mean':   sum(fast_times) / len(fast_times),
+        }
+        # How much of the instrumented run is yields + counting
+        summary['overhead'] = summary['elapsed_ms']['median'] / summary['fast_ms']['median'] \
+            if summary['fast_ms']['median'] > 0 else None
+    return summary
+
+
+def _timed_trials(run, algorithm: str, base: list, seed: int, repeat: int,
+                  disable_gc: bool) -> list:
+    """Call run(algorithm, copy_of_base, seed) `repeat` times with optional GC control."""
+    gc_was_enabled = gc.isenabled()
+    results = []
+    for _ in range(repeat):
+        array = base[:]
+        if disable_gc:
+            gc.collect()
+            gc.disable()
+        try:
+            results.append(run(algorithm, array, seed))
+        finally:
+            if disable_gc and gc_was_enabled:
+                gc.enable()
+    return results
+
+
+def profile(algorithm: str, size: int, seed: int = None,
+            distribution: str = 'random', limit: int = 25) -> tuple:
+    """
+    Run `algorithm` once under cProfile on the input of (distribution, size, seed).
+
+    Returns (run_once() result, profile report sorted by cumulative time,
+    `limit` lines).
+    """
+    import cProfile
+    import io
+    import pstats
+
+    array = make_input(canonical(distribution, size), size, seed)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = run_once(algorithm, array, seed)
+    finally:
+        profiler.disable()
+    report = io.StringIO()
+    pstats.Stats(profiler, stream=report).sort_stats('cumulative').print_stats(limit)
+    return result, report.getvalue()
+
+
+def format_table(results: list) -> str:
+    """Render a list of benchmark summaries as a fixed-width text table."""
+    with_fast = any('fast_ms' in r for r in results)
+    header = (f"{'Algorithm':<20} {'Size':>8} {'Comparisons':>12} {'Swaps':>12} "
+              f"{'Steps':>10} {'Median ms':>11} {'p95 ms':>11} {'Steps/s':>12} {'Sorted':>6}")
+    if with_fast:
+        header += f" {'Fast ms':>11} {'Overhead':>8}"
+    lines = [header, '-' * len(header)]
+    for r in results:
+        line = (
+            f"{r['algorithm']:<20} {r['size']:>8} {r['comparisons']:>12} {r['swaps']:>12} "
+            f"{r['steps']:>10} {r['elapsed_ms']['median']:>11.3f} {r['elapsed_ms']['p95']:>11.3f} "
+            f"{r['steps_per_s']['median']:>12.0f} {'yes' if r['sorted'] else 'NO':>6}"
+        )
+        if with_fast:
+            overhead = f"{r['overhead']:.1f}x" if r.get('overhead') else '-'
+            line += f" {r['fast_ms']['median']:>11.3f} {overhead:>8}"
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmark',
+        description='Run sorting algorithms headless and report counters and timings.')
+    parser.add_argument('algorithms', nargs='*',
+                        help="Algorithm names (see --list), or 'all' for those in the GUI.")
+    parser.add_argument('-n', '--size', type=int, default=100,
+                        help='Array size (default: 100).')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for the input array (default: random).')
+    parser.add_argument('-d', '--distribution', type=spec_argument, default='random',
+                        help='Input distribution: one of ' + ', '.join(DISTRIBUTION_NAMES)
+                             + ", optionally with parameters as in 'nearly_sorted:k=5' "
+                             '(default: random).')
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='Number of timed trials (default: 5).')
+    parser.add_argument('-w', '--warmup', type=int, default=1,
+                        help='Number of untimed warmup runs (default: 1).')
+    parser.add_argument('--no-gc', action='store_true',
+                        help='Disable the garbage collector during timed trials.')
+    parser.add_argument('--fast', action='store_true',
+                        help='Also time the uninstrumented variant of each algorithm.')
+    parser.add_argument('-f', '--format', choices=('table', 'json'), default='table',
+                        help='Output format (default: table).')
+    parser.add_argument('--record', type=int, metavar='ID',
+                        help='Re-run leaderboard record ID with its algorithm, size, '
+                             'distribution and seed (overrides those options).')
+    parser.add_argument('--profile', action='store_true',
+                        help='Run once under cProfile and print the report instead of timing.')
+    parser.add_argument('--step-budget', type=int, default=STEP_BUDGET, metavar='STEPS',
+                        help='Skip algorithms predicted to take more steps at --size; '
+                             f'0 for no limit (default: ${STEP_BUDGET_ENV}, else '
+                             f'{DEFAULT_STEP_BUDGET:,}). Not applied to --record.')
+    parser.add_argument('--db', metavar='PATH',
+                        help='Leaderboard database file for --record (default: $LEADERBOARD_DB, '
+                             'else src/leaderboard.db).')
+    parser.add_argument('--list', action='store_true',
+                        help='List the available algorithms and exit.')
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.db:
+        from database import set_db_path
+        set_db_path(args.db)
+
+    if args.list:
+        print('\n'.join(allAlgorithmsDict.keys()))
+        return 0
+
+    record = None
+    if args.record is not None:
+        from database import get_record
+        record = get_record(args.record)
+        if record is None:
+            print(f'No leaderboard record with id {args.record}', file=sys.stderr)
+            return 2
+        if record['seed'] is None:
+            print(f'Record {args.record} has no seed (saved before runs were seeded); '
+                  'it cannot be reproduced', file=sys.stderr)
+            return 2
+        args.algorithms = [record['algorithm']]
+        args.size = record['array_size']
+        args.seed = record['seed']
+        args.distribution = record['distribution'] or 'random'
+        print(f"Record {record['id']}: {record['algorithm']}, size {record['array_size']}, "
+              f"{args.distribution}, seed {record['seed']}", file=sys.stderr)
+
+    names = args.algorithms
+    if not names:
+        build_parser().print_usage(sys.stderr)
+        return 2
+    if names == ['all']:
+        names = list(algorithmsDict.keys())
+
+    unknown = [n for n in names if n not in allAlgorithmsDict]
+    if unknown:
+        print(f"Unknown algorithm(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    if args.size < 1 or args.repeat < 1 or args.warmup < 0:
+        print('--size and --repeat must be positive, --warmup non-negative', file=sys.stderr)
+        return 2
+
+    # A recorded run is known to finish
+    if record is None:
+        warnings = {name: check_size(name, args.size, args.step_budget) for name in names}
+        for warning in filter(None, warnings.values()):
+            print(f'Skipped: {warning}', file=sys.stderr)
+        names = [name for name in names if not warnings[name]]
+        if not names:
+            return 2
+
+    # A fixed seed keeps every algorithm on the same input when several are
+    # benchmarked together.
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+
+    if args.profile:
+        for name in names:
+            result, report = profile(name, args.size, seed, args.distribution)
+            print(f"{name}: {result['comparisons']} comparisons, {result['swaps']} swaps, "
+                  f"{result['steps']} steps, seed {seed}")
+            if record is not None:
+                same = (result['comparisons'], result['swaps']) == \
+                    (record['comparisons'], record['swaps'])
+                print('Counts match the record.' if same else
+                      f"Counts differ from the record ({record['comparisons']} comparisons, "
+                      f"{record['swaps']} swaps).")
+            print(report)
+        return 0
+
+    results = []
+    failed = False
+    for name in names:
+        try:
+            results.append(
+                benchmark(name, args.size, seed=seed, distribution=args.distribution,
+                          repeat=args.repeat, warmup=args.warmup, disable_gc=args.no_gc,
+                          fast=args.fast))
+        except Exception as exc:
+            # Keep going so one broken algorithm does not hide the others
+            print(f'{name}: {type(exc).__name__}: {exc}', file=sys.stderr)
+            failed = True
+
+    if args.format == 'json':
+        print(json.dumps(results if len(names) > 1 else results[0] if results else None,
+                         indent=2))
+    else:
+        print(format_table(results))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Empirical growth curves: fit complexity models to measured runs.
+
+Given (n, y) points for one algorithm, where y is a measured cost such as
+its comparisons, swaps or wall time at array size n, fit() tries every
+candidate model
+
+    n, n log n, n log² n, n²     y = c * f(n) + b * g(n)
+    n^k                          y = c * n^k
+
+and ranks them. g is the next lower order term (n log n - n comparisons
+for mergeSort, n²/4 + n for insertionSort); without it a plain power law
+fits such counts better over the few decades a sweep covers. The errors
+are relative, so a run at n = 10 weighs as much as one at n = 100000.
+Every model has two parameters and gets an Akaike weight, the probability
+that it is the best of the candidates given the data; n^k wins when no
+named model fits, as for stoogeSort (k ≈ 2.7) or shellSort.
+
+The points come from the leaderboard database, mostly from sweep runs:
+
+    python -m complexity                               # every algorithm
+    python -m complexity bubbleSort mergeSort --metric swaps
+    python -m complexity all --metric time --budget 1000   # n within 1 s
+"""
+
+import argparse
+import math
+import sys
+from collections import namedtuple
+
+# name -> (f, g): leading term and lower order term, slowest growing first
+MODELS = {
+    'n':         (lambda n: n,                     lambda n: 1),
+    'n log n':   (lambda n: n * math.log2(n),      lambda n: n),
+    'n log² n':  (lambda n: n * math.log2(n) ** 2, lambda n: n * math.log2(n)),
+    'n²':        (lambda n: n * n,                 lambda n: n),
+}
+POWER = 'n^k'
+
+# Which value of a database measurement each metric is
+METRICS = {
+    'comparisons': lambda size, comparisons, swaps, elapsed_ms: comparisons,
+    'swaps':       lambda size, comparisons, swaps, elapsed_ms: swaps,
+    'steps':       lambda size, comparisons, swaps, elapsed_ms: comparisons + swaps,
+    'time':        lambda size, comparisons, swaps, elapsed_ms: elapsed_ms,
+}
+
+MIN_SIZES = 3       # distinct sizes needed before anything is fitted
+
+# model: name from MODELS or POWER; constant: c, the leading constant;
+# lower: b (0 for n^k); exponent: k (None for the named models); rms: root
+# mean square of the relative errors (0.1 is a 10% typical error); weight:
+# Akaike weight among all candidates
+Fit = namedtuple('Fit', 'model constant lower exponent rms weight')
+
+
+def _model_fit(points, f, g):
+    """
+    Least squares c, b of y = c * f(n) + b * g(n) relative to y, and the
+    relative residuals. The lower order term is dropped when it outweighs
+    the leading one at the largest size: the fit is then really the lower
+    order model, which has a candidate of its own.
+    """
+    u = [f(n) / y for n, y in points]
+    v = [g(n) / y for n, y in points]
+    suu = sum(x * x for x in u)
+    svv = sum(x * x for x in v)
+    suv = sum(x * z for x, z in zip(u, v))
+    det = suu * svv - suv * suv
+    c = b = 0.0
+    if det > 1e-12 * suu * svv:
+        c = (sum(u) * svv - sum(v) * suv) / det
+        b = (sum(v) * suu - sum(u) * suv) / det
+    largest = max(n for n, _ in points)
+    if c <= 0 or c * f(largest) < abs(b * g(largest)):
+        c, b = sum(u) / suu, 0.0
+    return c, b, [1 - c * x - b * z for x, z in zip(u, v)]
+
+
+def _power_fit(points):
+    """Least squares line through (log n, log y): (c, k, residuals)."""
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(y) for _, y in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    k = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+    log_c = my - k * mx
+    # Log residuals are relative errors to first order
+    return math.exp(log_c), k, [y - log_c - k * x for x, y in zip(xs, ys)]
+
+
+def fit(points) -> list:
+    """
+    Fit every candidate model to `points`, best first.
+
+    Parameters
+    ----------
+    points : iterable of (n, y)
+        Array sizes and the measured cost at each; repeated sizes are fine.
+        Points with n < 2 or y <= 0 carry no growth information on a log
+        scale and are dropped.
+
+    Returns a list of Fit, sorted by decreasing weight, or an empty list
+    when the points span fewer than MIN_SIZES distinct sizes.
+    """
+    points = [(n, y) for n, y in points if n >= 2 and y > 0]
+    if len({n for n, _ in points}) < MIN_SIZES:
+        return []
+    m = len(points)
+
+    candidates = []     # (model, c, b, k, residuals)
+    for name, (f, g) in MODELS.items():
+        c, b, res = _model_fit(points, f, g)
+        candidates.append((name, c, b, None, res))
+    c, k, res = _power_fit(points)
+    candidates.append((POWER, c, 0.0, k, res))
+
+    # Akaike information criterion for least squares, AIC = m ln(RSS/m) + 2p
+    # with p = 2 everywhere, so only the residuals decide. The floor keeps
+    # exact fits finite.
+    mse = [max(sum(r * r for r in cand[-1]) / m, 1e-12) for cand in candidates]
+    aic = [m * math.log(e) for e in mse]
+    best = min(aic)
+    rel = [math.exp((best - a) / 2) for a in aic]
+    total = sum(rel)
+
+    fits = [Fit(name, c, b, k, math.sqrt(e), w / total)
+            for (name, c, b, k, _), e, w in zip(candidates, mse, rel)]
+    return sorted(fits, key=lambda fit: -fit.weight)
+
+
+def best_fit(points):
+    """The most likely model for `points`, or None if they are too few."""
+    fits = fit(points)
+    return fits[0] if fits else None
+
+
+def predict(fit: Fit, n: int) -> float:
+    """The cost the fitted model expects at size n."""
+    if fit.model == POWER:
+        return fit.constant * n ** fit.exponent
+    f, g = MODELS[fit.model]
+    return fit.constant * f(n) + fit.lower * g(n)
+
+
+def max_size(fit: Fit, budget: float, limit: int = 10 ** 12) -> int:
+    """Largest n (up to `limit`) whose predicted cost stays within `budget`."""
+    if predict(fit, 2) > budget:
+        return 0
+    lo, hi = 2, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if predict(fit, mid) <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def describe(fit: Fit) -> str:
+    """Short text for a fit, e.g. 'n log n ×1.3 (97%)'."""
+    model = f'n^{fit.exponent:.2f}' if fit.model == POWER else fit.model
+    return f'{model} ×{fit.constant:.3g} ({fit.weight:.0%})'
+
+
+def fit_measurements(measurements, metric: str = 'comparisons'):
+    """
+    best_fit() of database.get_measurements() rows for one metric.
+
+    Returns (fit or None, number of runs used).
+    """
+    value = METRICS[metric]
+    points = [(row[0], value(*row)) for row in measurements]
+    return best_fit(points), len(points)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m complexity',
+        description='Fit complexity models to the runs in the leaderboard database.')
+    parser.add_argument('algorithms', nargs='*', default=['all'],
+                        help="Algorithm names, or 'all' (default).")
+    parser.add_argument('-m', '--metric', choices=list(METRICS), default='comparisons',
+                        help='Measured cost to fit (default: comparisons).')
+    parser.add_argument('-d', '--distribution', default='random',
+                        help="Input distribution name (default: random).")
+    parser.add_argument('--budget', type=float, default=None,
+                        help='Also print the largest size whose predicted cost stays '
+                             'within this budget (milliseconds for --metric time).')
+    parser.add_argument('--db', metavar='PATH',
+                        help='Leaderboard database file (default: $LEADERBOARD_DB, '
+                             'else src/leaderboard.db).')
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    from database import get_algorithms, get_measurements, set_db_path
+    if args.db:
+        set_db_path(args.db)
+
+    names = get_algorithms() if args.algorithms == ['all'] else args.algorithms
+    print(f"{'algorithm':<20} {'runs':>5} {'best fit':<28} {'k':>5} {'rms':>6}"
+          + (f" {'max n':>14}" if args.budget is not None else ''))
+    for name in names:
+        rows = get_measurements(name, args.distribution)
+        points = [(row[0], METRICS[args.metric](*row)) for row in rows]
+        fits = fit(points)
+        if not fits:
+            print(f'{name:<20} {len(points):>5} (needs nonzero values at {MIN_SIZES}+ sizes)')
+            continue
+        k = next(f.exponent for f in fits if f.model == POWER)
+        line = f'{name:<20} {len(points):>5} {describe(fits[0]):<28} {k:>5.2f} {fits[0].rms:>6.3f}'
+        if args.budget is not None:
+            line += f' {max_size(fits[0], args.budget):>14,}'
+        print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
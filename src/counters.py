@@ -1,128 +1,192 @@
 """
-Global counters for tracking sorting algorithm operations.
-Supports both single global counters and named counter instances for arena mode.
+Counters for tracking sorting algorithm operations.
+
+Every run counts into a Counter object. The counter that increment_*()
+updates is the current one, selected through a contextvars.ContextVar, so
+each thread (and each asyncio task) has its own selection and several sorts
+can count at the same time without touching each other's numbers.
+
+Typical use:
+
+    counter = Counter()
+    with counting(counter):
+        for _ in sort(array, 0, len(array) - 1):
+            pass
+    counter.comparisons, counter.swaps
+
+or, around single steps of a generator that is resumed in between others:
+
+    token = set_counter(counter)
+    try:
+        next(iterator)
+    finally:
+        reset_counter(token)
+
+The older API on top of it still works: named counter instances for arena
+mode ('algo1', 'algo2') selected with set_current_instance(), and a global
+counter used when nothing else is selected.
 """
 
-# Global counters
-_comparisons = 0
-_swaps = 0
+import contextvars
+from contextlib import contextmanager
+
+
+class Counter:
+    """Comparison and swap counts of one sorting run."""
+
+    __slots__ = ('comparisons', 'swaps', 'name')
+
+    def __init__(self, name=None):
+        self.comparisons = 0
+        self.swaps = 0
+        self.name = name
+
+    def reset(self):
+        """Set both counts back to zero."""
+        self.comparisons = 0
+        self.swaps = 0
+
+    def snapshot(self) -> tuple:
+        """Return the counts as a (comparisons, swaps) tuple."""
+        return self.comparisons, self.swaps
+
+    def restore(self, snapshot):
+        """Set the counts from a tuple returned by snapshot()."""
+        self.comparisons, self.swaps = snapshot
+
+    def __repr__(self):
+        return (f'Counter(name={self.name!r}, comparisons={self.comparisons}, '
+                f'swaps={self.swaps})')
+
+
+# Counter used when no other counter is selected
+_global_counter = Counter()
 
 # Named counter instances for arena mode (e.g., 'algo1', 'algo2')
 _counter_instances = {}
 
-# Current active instance for context-based counting
-_current_instance = None
+# Counter that increment_*() updates in the current context
+_current_counter = contextvars.ContextVar('current_counter', default=_global_counter)
+_get_current = _current_counter.get
+
+
+def current_counter() -> Counter:
+    """Return the counter selected in the current context."""
+    return _get_current()
+
+
+def set_counter(counter: Counter) -> contextvars.Token:
+    """Select `counter` in the current context; pass the token to reset_counter()."""
+    return _current_counter.set(counter)
+
+
+def reset_counter(token: contextvars.Token):
+    """Undo the set_counter() call that returned `token`."""
+    _current_counter.reset(token)
+
+
+@contextmanager
+def counting(counter: Counter = None):
+    """Count into `counter` (a new Counter if omitted) inside the with block."""
+    if counter is None:
+        counter = Counter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+def _instance(instance_name) -> Counter:
+    """Return the named counter instance, creating it on first use."""
+    counter = _counter_instances.get(instance_name)
+    if counter is None:
+        counter = _counter_instances[instance_name] = Counter(instance_name)
+    return counter
+
+
+def _target(instance_name) -> Counter:
+    return _get_current() if instance_name is None else _instance(instance_name)
+
 
 def reset_counters(instance_name=None):
     """Reset both comparison and swap counters to zero.
-    
+
     Args:
         instance_name: If provided, reset counters for that named instance.
                       If None, reset global counters.
     """
-    global _comparisons, _swaps
     if instance_name is None:
-        _comparisons = 0
-        _swaps = 0
+        _global_counter.reset()
     else:
-        _counter_instances[instance_name] = {'comparisons': 0, 'swaps': 0}
+        _instance(instance_name).reset()
 
 def set_current_instance(instance_name):
     """Set the current active instance for counter operations.
-    
+
     Args:
         instance_name: Name of the instance to use, or None for global counters.
     """
-    global _current_instance
-    _current_instance = instance_name
+    _current_counter.set(_global_counter if instance_name is None
+                         else _instance(instance_name))
 
 def get_current_instance():
-    """Get the current active instance name."""
-    return _current_instance
+    """Get the current active instance name (None for the global or an unnamed counter)."""
+    return _get_current().name
 
 def increment_comparisons(instance_name=None):
     """Increment the comparison counter by 1.
-    
+
     Args:
         instance_name: If provided, increment counter for that named instance.
-                      If None and a current instance is set, use current instance.
-                      Otherwise increment global counter.
+                      Otherwise increment the current counter.
     """
-    global _comparisons
-    target = instance_name if instance_name is not None else _current_instance
-    
-    if target is None:
-        _comparisons += 1
+    if instance_name is None:
+        _get_current().comparisons += 1
     else:
-        if target not in _counter_instances:
-            _counter_instances[target] = {'comparisons': 0, 'swaps': 0}
-        _counter_instances[target]['comparisons'] += 1
+        _instance(instance_name).comparisons += 1
 
 def increment_swaps(instance_name=None):
     """Increment the swap counter by 1.
-    
+
     Args:
         instance_name: If provided, increment counter for that named instance.
-                      If None and a current instance is set, use current instance.
-                      Otherwise increment global counter.
+                      Otherwise increment the current counter.
     """
-    global _swaps
-    target = instance_name if instance_name is not None else _current_instance
-    
-    if target is None:
-        _swaps += 1
+    if instance_name is None:
+        _get_current().swaps += 1
     else:
-        if target not in _counter_instances:
-            _counter_instances[target] = {'comparisons': 0, 'swaps': 0}
-        _counter_instances[target]['swaps'] += 1
+        _instance(instance_name).swaps += 1
 
 def get_comparisons(instance_name=None):
     """Get the current number of comparisons.
-    
+
     Args:
         instance_name: If provided, get comparisons for that named instance.
-                      If None and a current instance is set, use current instance.
-                      If None and no current instance, get global comparisons.
+                      If None, get the current counter's comparisons.
     """
-    target = instance_name if instance_name is not None else _current_instance
-    
-    if target is None:
-        return _comparisons
-    else:
-        if target not in _counter_instances:
-            return 0
-        return _counter_instances[target]['comparisons']
+    return _target(instance_name).comparisons
 
 def get_swaps(instance_name=None):
     """Get the current number of swaps.
-    
+
     Args:
         instance_name: If provided, get swaps for that named instance.
-                      If None and a current instance is set, use current instance.
-                      If None and no current instance, get global swaps.
+                      If None, get the current counter's swaps.
     """
-    target = instance_name if instance_name is not None else _current_instance
-    
-    if target is None:
-        return _swaps
-    else:
-        if target not in _counter_instances:
-            return 0
-        return _counter_instances[target]['swaps']
+    return _target(instance_name).swaps
 
 def get_counters(instance_name=None):
     """Get both counters as a tuple (comparisons, swaps).
-    
+
     Args:
         instance_name: If provided, get counters for that named instance.
-                      If None and a current instance is set, use current instance.
-                      If None and no current instance, get global counters.
+                      If None, get the current counter's values.
     """
-    return get_comparisons(instance_name), get_swaps(instance_name)
+    return _target(instance_name).snapshot()
 
 def reset_all_counters():
     """Reset all counters (global and all instances)."""
-    global _comparisons, _swaps
-    _comparisons = 0
-    _swaps = 0
-    _counter_instances.clear()
+    _global_counter.reset()
+    for counter in _counter_instances.values():
+        counter.reset()
@@ -1,26 +1,179 @@
 """
 SQLite database module for the Sorting Algorithms Visualizer.
 Tracks solo-mode sort sessions: algorithm, array size, swaps,
-comparisons, and elapsed time.
+comparisons, and elapsed time, plus the seed and input distribution spec
+that reproduce the run (see algs.seeded() and distributions.make_input()).
+
+Each thread keeps one connection open for its lifetime instead of
+connecting per call. The database runs in WAL mode, so the GUI can read
+while a benchmark or sweep is writing, and writers wait up to
+BUSY_TIMEOUT_MS for each other instead of failing with "database is
+locked". Each sortable column has an index of its own and one behind
+algorithm, for the filtered views. Importing the module touches no file:
+the first connection creates or migrates the schema. The file is
+leaderboard.db next to this module unless $LEADERBOARD_DB or
+set_db_path() names another. Forked worker processes open connections of
+their own.
+
+The GUI saves its runs with save_record_async(), which queues the row for
+a writer thread and returns at once; the writer inserts whatever has
+queued up in one transaction.
+
+The run_stats table summarises the runs of each (algorithm, array size,
+distribution): how many there are and the min, max, mean, standard
+deviation, p50 and p95 of their time, swaps and comparisons (see
+aggregates.py). Every insert updates it in its own transaction, so
+get_stats() reads one row per group however many runs it has.
 """
 
+import atexit
+import json
+import queue
 import sqlite3
 import os
+import threading
+from concurrent.futures import Future
+
+from aggregates import Aggregate
+
+# The database file: $LEADERBOARD_DB if set, else leaderboard.db next to
+# this source file; set_db_path() changes it at run time
+DB_PATH_ENV = 'LEADERBOARD_DB'
+_DB_PATH = os.environ.get(DB_PATH_ENV) or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'leaderboard.db')
+
+# Columns added after the first release, with their declarations; init_db()
+# adds the ones an existing database is missing
+_ADDED_COLUMNS = (
+    ('seed',         'INTEGER'),
+    ('distribution', 'TEXT'),
+)
 
-# Place the database file next to this source file
-_DB_PATH = os.path.join(os.path.dirname(__file__), 'leaderboard.db')
+_RECORD_COLUMNS = ('id, algorithm, array_size, swaps, comparisons, '
+                   'elapsed_ms, created_at, seed, distribution')
+
+# Columns get_records() and RecordQuery can sort by
+_SORTABLE_COLUMNS = {'elapsed_ms', 'swaps', 'comparisons',
+                     'array_size', 'algorithm', 'created_at', 'id'}
+
+# The sortable columns that get an index, alone and after algorithm; id
+# needs none, and algorithm alone is served by the latter
+_SORT_INDEXED = ('elapsed_ms', 'swaps', 'comparisons', 'array_size', 'created_at')
+
+# The measurements run_stats summarises, and the statistics of each
+_STATS_METRICS = ('elapsed_ms', 'swaps', 'comparisons')
+_STATS_FIELDS = ('min', 'max', 'mean', 'stdev', 'p50', 'p95')
+_STATS_COLUMNS = ('algorithm', 'array_size', 'distribution', 'runs') + tuple(
+    f'{metric}_{field}' for metric in _STATS_METRICS for field in _STATS_FIELDS)
+
+BUSY_TIMEOUT_MS = 5000
+WRITER_BATCH_SIZE = 256     # most rows the writer thread puts in one transaction
+
+_INSERT_SQL = """
+    INSERT INTO leaderboard (algorithm, array_size, swaps, comparisons, elapsed_ms,
+                             seed, distribution)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# The connection of each thread (sqlite3 connections stay in their thread)
+_local = threading.local()
+_open_connections = []
+_open_lock = threading.Lock()
+
+# Database files whose schema is up to date; the first connection to each
+# creates or migrates it, not the import
+_schema_ready = set()
+_schema_lock = threading.Lock()
 
 
 def _get_connection():
-    """Return a new connection to the SQLite database."""
-    conn = sqlite3.connect(_DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """
+    Return the calling thread's connection to the SQLite database, opening
+    it on first use.
+
+    Use it as `with _get_connection() as conn:`, which commits (or rolls
+    back) on exit but leaves the connection open.
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is not None and _local.path != _DB_PATH:
+        # set_db_path() was called since this thread connected
+        close_connection()
+        conn = None
+    if conn is None:
+        path = _DB_PATH
+        conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_MS / 1000)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        # In WAL mode NORMAL only syncs at checkpoints; a crash can lose
+        # the last commits but never corrupts the database
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute(f'PRAGMA busy_timeout={BUSY_TIMEOUT_MS}')
+        _local.conn, _local.path = conn, path
+        with _open_lock:
+            _open_connections.append(conn)
+        _ensure_schema(conn, path)
     return conn
 
 
+def _ensure_schema(conn, path):
+    if path in _schema_ready:
+        return
+    with _schema_lock:
+        if path not in _schema_ready:
+            _create_schema(conn)
+            _schema_ready.add(path)
+
+
+def get_db_path() -> str:
+    """The database file the next connection opens."""
+    return _DB_PATH
+
+
+def set_db_path(path):
+    """
+    Use the database file at `path` from now on, creating it if needed.
+
+    Rows already queued by save_record_async() are written to the previous
+    file first. Every thread reconnects on its next query; note that
+    ':memory:' gives each thread a database of its own.
+    """
+    global _DB_PATH
+    flush_writes()
+    _DB_PATH = os.fspath(path)
+
+
+def close_connection():
+    """Close the calling thread's connection, if it has one."""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        _local.conn = None
+        with _open_lock:
+            _open_connections.remove(conn)
+        conn.close()
+
+
+@atexit.register
+def _close_all():
+    # Closing the last connection checkpoints the WAL into the main file.
+    # Registered before shutdown_writer, so atexit runs it after that.
+    with _open_lock:
+        for conn in _open_connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass    # belongs to another, still running thread
+        _open_connections.clear()
+
+
 def init_db():
-    """Create the leaderboard table if it does not already exist."""
-    with _get_connection() as conn:
+    """Create the leaderboard table if it does not already exist, and
+    migrate an older one by adding the columns it lacks. The first
+    connection does this on its own; calling it again is harmless."""
+    _create_schema(_get_connection())
+
+
+def _create_schema(conn):
+    with conn:
         conn.execute("""
             CREATE TABLE IF NOT EXISTS leaderboard (
                 id          INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -32,28 +185,282 @@ def init_db():
                 created_at  TEXT    NOT NULL DEFAULT (datetime('now','localtime'))
             )
         """)
+        existing = {row['name'] for row in conn.execute('PRAGMA table_info(leaderboard)')}
+        for name, declaration in _ADDED_COLUMNS:
+            if name not in existing:
+                conn.execute(f'ALTER TABLE leaderboard ADD COLUMN {name} {declaration}')
+        for column in _SORT_INDEXED:
+            conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{column} '
+                         f'ON leaderboard ({column})')
+            conn.execute(f'CREATE INDEX IF NOT EXISTS idx_algorithm_{column} '
+                         f'ON leaderboard (algorithm, {column})')
+
+        has_stats = conn.execute("SELECT 1 FROM sqlite_master "
+                                 "WHERE type = 'table' AND name = 'run_stats'").fetchone()
+        metric_columns = ''.join(
+            f',\n                {metric}_{field} REAL'
+            for metric in _STATS_METRICS for field in _STATS_FIELDS)
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS run_stats (
+                algorithm    TEXT    NOT NULL,
+                array_size   INTEGER NOT NULL,
+                distribution TEXT    NOT NULL,
+                runs         INTEGER NOT NULL{metric_columns},
+                state        TEXT    NOT NULL,
+                PRIMARY KEY (algorithm, array_size, distribution)
+            )
+        """)
+        if not has_stats:
+            # A database from before run_stats: summarise the runs it has
+            _rebuild_stats(conn)
         conn.commit()
 
 
+# ── Aggregate statistics ──────────────────────────────────────────────
+
+def _stats_key(algorithm: str, array_size: int, distribution: str) -> tuple:
+    """
+    The run_stats group of a run: its algorithm, size and distribution
+    name without parameters ('random' for runs saved before distributions
+    were recorded, as in get_measurements()).
+    """
+    name = distribution.split(':', 1)[0] if distribution else 'random'
+    return algorithm, array_size, name
+
+
+class _StatsUpdate:
+    """
+    Folds runs into the run_stats groups they belong to, loading each
+    group's state from the database the first time one of its runs
+    arrives, and writes the changed groups back with store().
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+        self._groups = {}       # key -> {metric: Aggregate}
+
+    def add(self, row):
+        """Fold in one row in save_record() argument order."""
+        algorithm, array_size, swaps, comparisons, elapsed_ms = row[:5]
+        key = _stats_key(algorithm, array_size, row[6] if len(row) > 6 else None)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = self._load(key)
+        group['elapsed_ms'].add(elapsed_ms)
+        group['swaps'].add(swaps)
+        group['comparisons'].add(comparisons)
+
+    def added(self, rows):
+        """Yield `rows` unchanged, folding in each as it passes."""
+        for row in rows:
+            self.add(row)
+            yield row
+
+    def _load(self, key):
+        row = self._conn.execute(
+            'SELECT state FROM run_stats '
+            'WHERE algorithm = ? AND array_size = ? AND distribution = ?', key).fetchone()
+        if row is None:
+            return {metric: Aggregate() for metric in _STATS_METRICS}
+        state = json.loads(row['state'])
+        return {metric: Aggregate.from_state(state[metric]) for metric in _STATS_METRICS}
+
+    def store(self):
+        rows = []
+        for key, group in self._groups.items():
+            values = [group['elapsed_ms'].count]
+            for metric in _STATS_METRICS:
+                agg = group[metric]
+                values += [agg.min, agg.max, agg.mean, agg.stdev, agg.p50, agg.p95]
+            state = json.dumps({metric: agg.to_state() for metric, agg in group.items()})
+            rows.append((*key, *values, state))
+        self._conn.executemany(
+            f"INSERT OR REPLACE INTO run_stats ({', '.join(_STATS_COLUMNS)}, state) "
+            f"VALUES ({', '.join('?' * (len(_STATS_COLUMNS) + 1))})", rows)
+        self._groups = {}
+
+
+def _rebuild_stats(conn, key: tuple = None):
+    """
+    Recompute run_stats from the leaderboard rows, for the one group `key`
+    or, when it is None, for every group.
+    """
+    query = ('SELECT algorithm, array_size, swaps, comparisons, elapsed_ms, seed, '
+             'distribution FROM leaderboard')
+    params = ()
+    if key is None:
+        conn.execute('DELETE FROM run_stats')
+    else:
+        conn.execute('DELETE FROM run_stats '
+                     'WHERE algorithm = ? AND array_size = ? AND distribution = ?', key)
+        algorithm, array_size, distribution = key
+        query += (" WHERE algorithm = ? AND array_size = ? "
+                  "AND (distribution = ? OR distribution LIKE ? || ':%'"
+                  + (' OR distribution IS NULL)' if distribution == 'random' else ')'))
+        params = (algorithm, array_size, distribution, distribution)
+    update = _StatsUpdate(conn)
+    for row in conn.execute(query + ' ORDER BY id', params).fetchall():
+        update.add(tuple(row))
+    update.store()
+
+
 def save_record(algorithm: str, array_size: int, swaps: int,
-                comparisons: int, elapsed_ms: float) -> int:
+                comparisons: int, elapsed_ms: float,
+                seed: int = None, distribution: str = None) -> int:
     """
     Insert a completed sort session into the database.
 
+    `seed` and `distribution` (a canonical distribution spec) are what is
+    needed to run the same sort again; leave them None if unknown.
+
     Returns the row-id of the newly inserted record.
     """
+    row = (algorithm, array_size, swaps, comparisons, elapsed_ms, seed, distribution)
     with _get_connection() as conn:
-        cur = conn.execute(
-            """
-            INSERT INTO leaderboard (algorithm, array_size, swaps, comparisons, elapsed_ms)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (algorithm, array_size, swaps, comparisons, elapsed_ms),
-        )
+        cur = conn.execute(_INSERT_SQL, row)
+        update = _StatsUpdate(conn)
+        update.add(row)
+        update.store()
         conn.commit()
         return cur.lastrowid
 
 
+def save_records(records) -> int:
+    """
+    Insert many completed sort sessions in one transaction.
+
+    Parameters
+    ----------
+    records : iterable of tuple
+        (algorithm, array_size, swaps, comparisons, elapsed_ms, seed,
+        distribution) per row, in the same order as the arguments of
+        save_record(). A generator is consumed without building a list.
+
+    Returns the number of rows inserted.
+    """
+    with _get_connection() as conn:
+        # The run_stats groups are read while the rows stream in: take the
+        # write lock first, or another writer committing after that first
+        # read makes the upgrade fail at once instead of waiting
+        # BUSY_TIMEOUT_MS
+        conn.execute('BEGIN IMMEDIATE')
+        update = _StatsUpdate(conn)
+        cur = conn.executemany(_INSERT_SQL, update.added(records))
+        update.store()
+        conn.commit()
+    return cur.rowcount
+
+
+class _Writer:
+    """
+    Inserts queued rows on a daemon thread of its own, up to
+    WRITER_BATCH_SIZE rows per transaction.
+
+    The thread starts with the first row and runs until shutdown(); a row
+    submitted after that starts a new one. Every thread has a queue of its
+    own, so rows queued before a shutdown are written by the thread that
+    is stopping.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0           # rows submitted and not yet written
+        self._queue = None
+        self._thread = None
+
+    def submit(self, row: tuple) -> Future:
+        future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._queue = queue.Queue()
+                self._thread = threading.Thread(target=self._run, args=(self._queue,),
+                                                name='leaderboard-writer', daemon=True)
+                self._thread.start()
+            self._pending += 1
+            self._queue.put((row, future))
+        return future
+
+    def _run(self, jobs):
+        running = True
+        while running:
+            batch = [jobs.get()]
+            while len(batch) < WRITER_BATCH_SIZE:
+                try:
+                    batch.append(jobs.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:       # the shutdown sentinel comes last
+                batch.remove(None)
+                running = False
+            if batch:
+                self._write(batch)
+        close_connection()
+
+    def _write(self, batch):
+        try:
+            with _get_connection() as conn:
+                ids = [conn.execute(_INSERT_SQL, row).lastrowid for row, _ in batch]
+                update = _StatsUpdate(conn)
+                for row, _ in batch:
+                    update.add(row)
+                update.store()
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+        else:
+            for (_, future), row_id in zip(batch, ids):
+                future.set_result(row_id)
+        with self._lock:
+            self._pending -= len(batch)
+            self._idle.notify_all()
+
+    def flush(self, timeout: float = None) -> bool:
+        with self._lock:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def shutdown(self, timeout: float = None):
+        with self._lock:
+            thread, jobs = self._thread, self._queue
+            self._thread = self._queue = None
+            if thread is not None:
+                jobs.put(None)
+        if thread is not None:
+            thread.join(timeout)
+
+
+_writer = _Writer()
+
+
+def save_record_async(algorithm: str, array_size: int, swaps: int,
+                      comparisons: int, elapsed_ms: float,
+                      seed: int = None, distribution: str = None) -> Future:
+    """
+    Queue a completed sort session for the writer thread and return at once.
+
+    Takes the arguments of save_record(). The returned
+    concurrent.futures.Future resolves to the row-id of the record once it
+    is written, or to the exception that prevented it, e.g. a database
+    that stayed locked for longer than BUSY_TIMEOUT_MS.
+    """
+    return _writer.submit(
+        (algorithm, array_size, swaps, comparisons, elapsed_ms, seed, distribution))
+
+
+def flush_writes(timeout: float = None) -> bool:
+    """
+    Wait until every queued record is written (or has failed).
+
+    Returns False if `timeout` seconds passed first.
+    """
+    return _writer.flush(timeout)
+
+
+def shutdown_writer(timeout: float = None):
+    """Write the queued records and stop the writer thread."""
+    _writer.shutdown(timeout)
+
+
 def get_records(filter_algorithm: str = None,
                 sort_by: str = 'elapsed_ms',
                 sort_asc: bool = True,
@@ -73,9 +480,7 @@ def get_records(filter_algorithm: str = None,
     limit : int
         Maximum number of rows to return.
     """
-    valid_columns = {'elapsed_ms', 'swaps', 'comparisons',
-                     'array_size', 'algorithm', 'created_at', 'id'}
-    if sort_by not in valid_columns:
+    if sort_by not in _SORTABLE_COLUMNS:
         sort_by = 'elapsed_ms'
 
     direction = 'ASC' if sort_asc else 'DESC'
@@ -84,8 +489,7 @@ def get_records(filter_algorithm: str = None,
         if filter_algorithm and filter_algorithm != 'All':
             rows = conn.execute(
                 f"""
-                SELECT id, algorithm, array_size, swaps, comparisons,
-                       elapsed_ms, created_at
+                SELECT {_RECORD_COLUMNS}
                 FROM leaderboard
                 WHERE algorithm = ?
                 ORDER BY {sort_by} {direction}
@@ -96,8 +500,7 @@ def get_records(filter_algorithm: str = None,
         else:
             rows = conn.execute(
                 f"""
-                SELECT id, algorithm, array_size, swaps, comparisons,
-                       elapsed_ms, created_at
+                SELECT {_RECORD_COLUMNS}
                 FROM leaderboard
                 ORDER BY {sort_by} {direction}
                 LIMIT ?
@@ -108,6 +511,182 @@ def get_records(filter_algorithm: str = None,
     return [dict(r) for r in rows]
 
 
+def count_records(filter_algorithm: str = None) -> int:
+    """Number of records, of one algorithm when filter_algorithm is set."""
+    with _get_connection() as conn:
+        if filter_algorithm and filter_algorithm != 'All':
+            return conn.execute('SELECT COUNT(*) FROM leaderboard WHERE algorithm = ?',
+                                (filter_algorithm,)).fetchone()[0]
+        return conn.execute('SELECT COUNT(*) FROM leaderboard').fetchone()[0]
+
+
+class RecordQuery:
+    """
+    A filtered, sorted view of the leaderboard that reads its rows on demand.
+
+    It behaves like a read-only list of record dicts: len() is a COUNT(*)
+    made once and cached, and indexing or slicing reads only the pages of
+    `page_size` rows it touches, keeping the `cached_pages` most recently
+    used ones. Call refresh() to see rows written since.
+
+    Pages are read by keyset pagination: the rows are ordered by the sort
+    column with id as a tie breaker, and a page next to one already read
+    starts from the key of that page's last (or first) row, which the
+    (algorithm, column) indexes find directly, however deep in the table.
+    A page far from any page read so far is located by skipping index
+    entries from the nearest end of the table, reading only the key
+    columns of one row.
+    """
+
+    PAGE_SIZE = 64
+    CACHED_PAGES = 16
+
+    def __init__(self, filter_algorithm: str = None, sort_by: str = 'elapsed_ms',
+                 sort_asc: bool = True, page_size: int = PAGE_SIZE,
+                 cached_pages: int = CACHED_PAGES):
+        if sort_by not in _SORTABLE_COLUMNS:
+            sort_by = 'elapsed_ms'
+        self.filter_algorithm = (filter_algorithm
+                                 if filter_algorithm and filter_algorithm != 'All' else None)
+        self.sort_by = sort_by
+        self.sort_asc = sort_asc
+        self.page_size = page_size
+        self.cached_pages = cached_pages
+        # A unique order; algorithm ties are broken by time, as in its index
+        if sort_by == 'id':
+            self._key_columns = ('id',)
+        elif sort_by == 'algorithm':
+            self._key_columns = ('algorithm', 'elapsed_ms', 'id')
+        else:
+            self._key_columns = (sort_by, 'id')
+        self.refresh()
+
+    def refresh(self):
+        """Forget the cached count and pages."""
+        self._count = None
+        self._pages = {}        # page number -> rows, least recently used first
+        self._last_keys = {}    # page number -> key of its last row
+        self._first_keys = {}   # page number -> key of its first row
+
+    def __len__(self):
+        if self._count is None:
+            self._count = count_records(self.filter_algorithm)
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if start >= stop:
+                return []
+            first = start // self.page_size
+            rows = []
+            for page in range(first, (stop - 1) // self.page_size + 1):
+                rows.extend(self._page(page))
+            offset = first * self.page_size
+            return rows[start - offset:stop - offset:step]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('record index out of range')
+        return self._page(index // self.page_size)[index % self.page_size]
+
+    # ------------------------------------------------------------------
+    # Paging
+    # ------------------------------------------------------------------
+    def _page(self, page: int) -> list:
+        rows = self._pages.pop(page, None)
+        if rows is None:
+            rows = self._fetch(page)
+            if rows:
+                self._first_keys[page] = self._key(rows[0])
+                self._last_keys[page] = self._key(rows[-1])
+        self._pages[page] = rows
+        while len(self._pages) > self.cached_pages:
+            del self._pages[next(iter(self._pages))]
+        return rows
+
+    def _fetch(self, page: int) -> list:
+        size = self.page_size
+        if page == 0:
+            return self._select(None, True, limit=size)
+        if page - 1 in self._last_keys:
+            return self._select(self._last_keys[page - 1], True, limit=size)
+        if page + 1 in self._first_keys:
+            return self._select(self._first_keys[page + 1], False, limit=size)[::-1]
+
+        # A jump: find the key next to the page, counting from the nearer
+        # end of the table or from the nearest page read before it
+        start = page * size
+        if start >= len(self):
+            return []
+        after = max((p for p in self._last_keys if p < page), default=None)
+        from_start = start if after is None else start - (after + 1) * size
+        from_end = len(self) - start - size
+        if from_end <= 0:       # the last page
+            return self._select(None, False, limit=len(self) - start)[::-1]
+        if from_end < from_start:
+            key = self._select(None, False, limit=1, offset=from_end - 1, keys_only=True)
+            return self._select(key[0], False, limit=size)[::-1] if key else []
+        anchor = None if after is None else self._last_keys[after]
+        key = self._select(anchor, True, limit=1, offset=from_start - 1, keys_only=True)
+        return self._select(key[0], True, limit=size) if key else []
+
+    def _key(self, record: dict) -> tuple:
+        return tuple(record[column] for column in self._key_columns)
+
+    def _select(self, key, forward: bool, limit: int, offset: int = 0,
+                keys_only: bool = False) -> list:
+        """
+        Rows after `key` in the view's order when `forward`, else the rows
+        before it nearest first; from the start (or end) when key is None.
+        """
+        ascending = self.sort_asc == forward
+        columns = ', '.join(self._key_columns)
+        where, params = [], []
+        if self.filter_algorithm:
+            where.append('algorithm = ?')
+            params.append(self.filter_algorithm)
+        if key is not None:
+            where.append(f"({columns}) {'>' if ascending else '<'} "
+                         f"({', '.join('?' * len(key))})")
+            params.extend(key)
+        direction = 'ASC' if ascending else 'DESC'
+        query = (f"SELECT {columns if keys_only else _RECORD_COLUMNS} FROM leaderboard"
+                 + (f" WHERE {' AND '.join(where)}" if where else '')
+                 + f" ORDER BY {', '.join(f'{c} {direction}' for c in self._key_columns)}"
+                 + ' LIMIT ? OFFSET ?')
+        with _get_connection() as conn:
+            rows = conn.execute(query, (*params, limit, offset)).fetchall()
+        return [tuple(r) for r in rows] if keys_only else [dict(r) for r in rows]
+
+
+def get_record(record_id: int) -> dict:
+    """Return one record by its id, or None if there is no such row."""
+    with _get_connection() as conn:
+        row = conn.execute(
+            f'SELECT {_RECORD_COLUMNS} FROM leaderboard WHERE id = ?',
+            (record_id,),
+        ).fetchone()
+    return dict(row) if row else None
+
+
+def get_measurements(algorithm: str, distribution: str = 'random') -> list:
+    """
+    Return (array_size, comparisons, swaps, elapsed_ms) of every run of
+    `algorithm` on inputs of the named distribution, whatever its
+    parameters. Rows saved before distributions were recorded count as
+    'random', the only input they had.
+    """
+    query = ('SELECT array_size, comparisons, swaps, elapsed_ms FROM leaderboard '
+             "WHERE algorithm = ? AND (distribution = ? OR distribution LIKE ? || ':%'")
+    if distribution == 'random':
+        query += ' OR distribution IS NULL'
+    with _get_connection() as conn:
+        rows = conn.execute(query + ') ORDER BY array_size',
+                            (algorithm, distribution, distribution)).fetchall()
+    return [tuple(r) for r in rows]
+
+
 def get_algorithms() -> list:
     """Return a sorted list of all distinct algorithm names in the DB."""
     with _get_connection() as conn:
@@ -120,10 +699,185 @@ def get_algorithms() -> list:
 def delete_record(record_id: int):
     """Delete a single record by its id."""
     with _get_connection() as conn:
+        row = conn.execute('SELECT algorithm, array_size, distribution FROM leaderboard '
+                           'WHERE id = ?', (record_id,)).fetchone()
         conn.execute("DELETE FROM leaderboard WHERE id = ?", (record_id,))
+        if row is not None:
+            # Quantile sketches cannot forget a value: recount the group
+            _rebuild_stats(conn, _stats_key(*row))
         conn.commit()
 
 
+def get_stats(filter_algorithm: str = None,
+              sort_by: str = 'elapsed_ms_mean',
+              sort_asc: bool = True) -> list:
+    """
+    Return the run_stats groups as dicts.
+
+    Each has the group's algorithm, array_size and distribution name, its
+    number of runs, and <metric>_<statistic> for every metric of
+    'elapsed_ms', 'swaps', 'comparisons' and statistic of 'min', 'max',
+    'mean', 'stdev', 'p50', 'p95'. The percentiles are P² estimates, exact
+    up to five runs.
+
+    Parameters
+    ----------
+    filter_algorithm : str or None
+        When set, only return groups of that algorithm name.
+    sort_by : str
+        Any of the returned columns; ties are ordered by algorithm, size
+        and distribution.
+    sort_asc : bool
+        True → ascending, False → descending.
+    """
+    if sort_by not in _STATS_COLUMNS:
+        sort_by = 'elapsed_ms_mean'
+    direction = 'ASC' if sort_asc else 'DESC'
+    query = f"SELECT {', '.join(_STATS_COLUMNS)} FROM run_stats"
+    params = ()
+    if filter_algorithm and filter_algorithm != 'All':
+        query += ' WHERE algorithm = ?'
+        params = (filter_algorithm,)
+    query += f' ORDER BY {sort_by} {direction}, algorithm, array_size, distribution'
+    with _get_connection() as conn:
+        rows = conn.execute(query, params).fetchall()
+    return [dict(r) for r in rows]
+
+
+EXPORT_FORMATS = ('csv', 'csv.gz', 'jsonl')
+EXPORT_BATCH_SIZE = 1000    # rows per fetchmany() while exporting
+
+_EXPORT_FIELDS = ['id', 'algorithm', 'array_size', 'swaps',
+                  'comparisons', 'elapsed_s', 'created_at', 'seed', 'distribution']
+
+
+def iter_records(filter_algorithm: str = None,
+                 sort_by: str = 'elapsed_ms',
+                 sort_asc: bool = True,
+                 limit: int = None,
+                 batch_size: int = EXPORT_BATCH_SIZE):
+    """
+    Yield records like get_records(), without a default limit, reading
+    them from the cursor `batch_size` rows at a time.
+
+    Runs on the calling thread's own connection, so it can be consumed on
+    a background thread; in WAL mode it reads a consistent snapshot while
+    other threads write.
+    """
+    if sort_by not in _SORTABLE_COLUMNS:
+        sort_by = 'elapsed_ms'
+    query = f'SELECT {_RECORD_COLUMNS} FROM leaderboard'
+    params = []
+    if filter_algorithm and filter_algorithm != 'All':
+        query += ' WHERE algorithm = ?'
+        params.append(filter_algorithm)
+    query += f" ORDER BY {sort_by} {'ASC' if sort_asc else 'DESC'}"
+    if limit is not None:
+        query += ' LIMIT ?'
+        params.append(limit)
+    cur = _get_connection().execute(query, params)
+    try:
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+    finally:
+        cur.close()
+
+
+def export_format(filepath: str) -> str:
+    """The export format a file name asks for: 'csv.gz', 'jsonl' or 'csv'."""
+    for fmt in sorted(EXPORT_FORMATS, key=len, reverse=True):
+        if filepath.endswith('.' + fmt):
+            return fmt
+    return 'csv'
+
+
+def export_records(filepath: str,
+                   filter_algorithm: str = None,
+                   sort_by: str = 'elapsed_ms',
+                   sort_asc: bool = True,
+                   limit: int = None,
+                   fmt: str = None,
+                   progress=None,
+                   cancel=None) -> int:
+    """
+    Stream leaderboard records into a file, a batch at a time.
+
+    Parameters
+    ----------
+    filepath : str
+        Destination. The rows go to a temporary file next to it, which
+        replaces it only once the export is complete.
+    filter_algorithm, sort_by, sort_asc, limit
+        As for get_records(); limit None exports every matching row.
+    fmt : str or None
+        One of EXPORT_FORMATS; None picks it from the file name. CSV rows
+        have the time in seconds as `elapsed_s`, JSON Lines rows the
+        record's fields as stored, `elapsed_ms` included.
+    progress : callable or None
+        Called as progress(rows_written, rows_total) after every batch.
+    cancel : threading.Event or None
+        Checked before every batch; once set, the export stops and the
+        temporary file is removed. Set after the last row it is too late,
+        and the export completes.
+
+    Returns the number of rows written, or None if cancelled.
+    """
+    import csv
+    import gzip
+    import json
+
+    fmt = fmt or export_format(filepath)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f'Unknown export format: {fmt}')
+    total = count_records(filter_algorithm)
+    if limit is not None:
+        total = min(total, limit)
+
+    tmp_path = filepath + '.part'
+    if fmt == 'csv.gz':
+        f = gzip.open(tmp_path, 'wt', newline='', encoding='utf-8')
+    else:
+        f = open(tmp_path, 'w', newline='', encoding='utf-8')
+    written = 0
+    cancelled = False
+    try:
+        with f:
+            if fmt == 'jsonl':
+                write = lambda rec: f.write(json.dumps(rec) + '\n')
+            else:
+                writer = csv.DictWriter(f, fieldnames=_EXPORT_FIELDS, extrasaction='ignore')
+                writer.writeheader()
+
+                def write(rec):
+                    rec['elapsed_s'] = f"{rec['elapsed_ms'] / 1000:.3f}"
+                    writer.writerow(rec)
+
+            for rec in iter_records(filter_algorithm, sort_by, sort_asc, limit):
+                # Only while rows remain: a finished export is kept
+                if written % EXPORT_BATCH_SIZE == 0 and cancel is not None and cancel.is_set():
+                    cancelled = True
+                    break
+                write(rec)
+                written += 1
+                if written % EXPORT_BATCH_SIZE == 0 and progress:
+                    progress(written, total)
+        if cancelled:
+            os.remove(tmp_path)
+            return None
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if progress:
+        progress(written, total)
+    return written
+
+
 def export_csv(filepath: str,
                filter_algorithm: str = None,
                sort_by: str = 'elapsed_ms',
@@ -135,36 +889,82 @@ def export_csv(filepath: str,
     Parameters match get_records() for consistent filtering/sorting.
     Returns the number of rows written.
     """
-    import csv
+    return export_records(filepath, filter_algorithm, sort_by, sort_asc, limit, fmt='csv')
+
+
+class ExportJob:
+    """
+    export_records() running on a thread of its own.
+
+    Poll `written`, `total` and `done()` from the render loop; after it is
+    done, `result` is the number of rows written (None if cancelled) and
+    `error` the exception that stopped it, if any.
+    """
+
+    def __init__(self, filepath: str, **options):
+        self.filepath = filepath
+        self.written = 0
+        self.total = 0
+        self.result = None
+        self.error = None
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(options,),
+                                        name='leaderboard-export', daemon=True)
+        self._thread.start()
+
+    def _run(self, options):
+        try:
+            self.result = export_records(self.filepath, progress=self._progress,
+                                         cancel=self._cancel, **options)
+        except Exception as exc:
+            self.error = exc
+        finally:
+            close_connection()
+
+    def _progress(self, written, total):
+        self.written, self.total = written, total
+
+    def cancel(self):
+        """Ask the export to stop after its current batch, unless it was the last."""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once the export has stopped because of cancel()."""
+        return self.done() and self.error is None and self.result is None
+
+    def done(self) -> bool:
+        return not self._thread.is_alive()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Wait for the export to finish; False if `timeout` passed first."""
+        self._thread.join(timeout)
+        return self.done()
+
+
+# A daemon thread dies with the interpreter; write what it still holds
+atexit.register(shutdown_writer)
+
+
+# The connections a forked child inherited from its parent. They are kept
+# here, unused, for the life of the child: dropping the last reference
+# would close them, and closing touches the parent's locks on the file.
+_inherited_connections = []
+
+
+def _after_fork_in_child():
+    # SQLite connections must not cross a fork, and the writer thread does
+    # not: a forked worker starts over with none of either. The parent's
+    # connections, the writer's among them, move to _inherited_connections
+    # and are never used or closed.
+    global _open_lock, _schema_lock
+    _inherited_connections.extend(_open_connections)
+    _local.conn = None
+    _open_connections.clear()
+    _open_lock = threading.Lock()
+    _schema_lock = threading.Lock()
+    _writer.__init__()
+
 
-    # If limit is None, we pass a very large number to get_records
-    # (or we could update get_records to handle None for limit)
-    fetch_limit = limit if limit is not None else 1_000_000
-
-    records = get_records(filter_algorithm=filter_algorithm,
-                          sort_by=sort_by,
-                          sort_asc=sort_asc,
-                          limit=fetch_limit)
-
-    fieldnames = ['id', 'algorithm', 'array_size', 'swaps',
-                  'comparisons', 'elapsed_s', 'created_at']
-
-    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for rec in records:
-            writer.writerow({
-                'id':          rec['id'],
-                'algorithm':   rec['algorithm'],
-                'array_size':  rec['array_size'],
-                'swaps':       rec['swaps'],
-                'comparisons': rec['comparisons'],
-                'elapsed_s':   f"{rec['elapsed_ms'] / 1000:.3f}",
-                'created_at':  rec['created_at'],
-            })
-
-    return len(records)
-
-
-# Initialise the schema on first import
-init_db()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -1,12 +1,51 @@
 import pygame
+from collections import OrderedDict
 from math import ceil
 from time import time
 from abc import ABC, abstractmethod
 
+_TEXT_CACHE_SIZE = 512
+_text_cache = OrderedDict()     # (font, text, color) -> Surface, least recently used first
+
+
+def _render_text(font, text, color):
+    """font.render(text, True, color), remembering the most recent results."""
+    key = (font, text, color)
+    surface = _text_cache.pop(key, None)
+    if surface is None:
+        surface = font.render(text, True, color)
+        if len(_text_cache) >= _TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    _text_cache[key] = surface
+    return surface
+
+
 class Window:
-    def __init__(self, screen):
+    """
+    The widgets of one screen, drawn in retained mode.
+
+    render() compares each widget's look() with the one it last drew and
+    repaints only the widgets that changed, clearing the area they cover
+    (and redrawing whatever else overlaps it) with `background`. It
+    returns the screen rects it touched, for pygame.display.update(rects).
+    The text the widgets draw is rendered once and kept (_render_text), so
+    a widget that did change costs little more than a blit.
+
+    A full redraw repaints every widget on a screen the caller has cleared,
+    so it can draw things of its own under the widgets first; anything it
+    draws every frame must stay clear of the widgets' bounds().
+    needs_full_redraw() says when one is due: on the first frame, after
+    invalidate(), and while a dropdown panel floats over the other
+    widgets, plus one frame after it closes.
+    """
+
+    def __init__(self, screen, background=(250, 250, 250)):
         self.screen = screen
+        self.background = background
         self.widgets = {}
+        self._drawn = {}        # widget_id -> (widget, look, bounds) last drawn
+        self._full = True
+        self._overlay_was_open = False
 
     def add_widget(self, widget_id, widget):
         self.widgets[widget_id] = widget
@@ -17,16 +56,71 @@ class Window:
     def set_widget_value(self, widget_id, value):
         return self.widgets[widget_id].set_value(value)
 
-    def render(self):
-        """Two-pass render: base widgets first, then open dropdown overlays on top."""
-        for widget in self.widgets.values():
-            widget.render(self.screen)
+    def invalidate(self):
+        """Make the next render() a full redraw, e.g. when the screen was drawn over."""
+        self._full = True
 
-        # Second pass: re-render any open DropdownBox so its panel floats above
-        # every other widget (including tables that were added later).
+    def needs_full_redraw(self):
+        return self._full or self._overlay_was_open or self.overlay_open()
+
+    def render(self, full=None):
+        """
+        Draw the widgets that changed, or all of them if `full` (by default
+        needs_full_redraw()), then any open dropdown panel on top of them.
+
+        Returns the list of screen rects drawn, the whole screen when full.
+        """
+        if full is None:
+            full = self.needs_full_redraw()
+        screen_rect = self.screen.get_rect()
+
+        # Widgets whose look changed, and the areas they covered or cover now
+        redraw, cleared = {}, []
+        for widget_id, widget in self.widgets.items():
+            look = widget.look()
+            drawn = self._drawn.get(widget_id)
+            if full or drawn is None or drawn[0] is not widget or drawn[1] != look:
+                bounds = widget.bounds().clip(screen_rect)
+                redraw[widget_id] = (widget, look, bounds)
+                cleared.append(bounds if drawn is None else drawn[2].union(bounds))
+
+        if not full:
+            # Clearing an area erases every widget that overlaps it
+            grown = bool(redraw)
+            while grown:
+                grown = False
+                for widget_id, drawn in self._drawn.items():
+                    if widget_id not in redraw and drawn[2].collidelist(cleared) != -1:
+                        redraw[widget_id] = drawn
+                        cleared.append(drawn[2])
+                        grown = True
+            for rect in cleared:
+                self.screen.fill(self.background, rect)
+
+        clip = self.screen.get_clip()
+        for widget_id in self.widgets:
+            if widget_id in redraw:
+                widget, _, bounds = self._drawn[widget_id] = redraw[widget_id]
+                self.screen.set_clip(bounds)
+                widget.render(self.screen)
+        self.screen.set_clip(clip)
+
+        # Open dropdown panels float above every other widget
+        self._overlay_was_open = False
         for widget in self.widgets.values():
             if isinstance(widget, DropdownBox) and widget.openDropdown:
                 widget.render_overlay(self.screen)
+                self._overlay_was_open = True
+
+        self._full = False
+        if full:
+            return [screen_rect]
+        return cleared
+
+    def overlay_open(self):
+        """True while a dropdown panel is drawn over the rest of the window."""
+        return any(isinstance(widget, DropdownBox) and widget.openDropdown
+                   for widget in self.widgets.values())
 
     def update(self, event):
         for widget in self.widgets.values():
@@ -37,6 +131,18 @@ class Box:
     def __init__(self, rect):
         self.isActive = False
         self.rect     = pygame.Rect(rect)
+        self.hovered  = False
+
+    def look(self):
+        """
+        Everything render() draws from, as a comparable value; the Window
+        redraws the widget when it differs from the one last drawn.
+        """
+        return None
+
+    def bounds(self):
+        """The screen area render() draws in."""
+        return self.rect
     
     def update(self, event):
         self.mousePos = pygame.mouse.get_pos()
@@ -52,10 +158,22 @@ class InputBox(ABC, Box):
         self.font = font
         
     def render(self, screen):
-        label = self.font.render(self.label, True, self.color)
+        label = _render_text(self.font, self.label, self.color)
         screen.blit(label, (self.rect.x + (self.rect.w - label.get_width()) / 2, self.rect.y - 32))
         pygame.draw.rect(screen, self.color, self.rect, 2)
 
+    def look(self):
+        return self.label
+
+    def bounds(self):
+        """The box and its label above it."""
+        if not self.label:
+            return self.rect
+        width, height = self.font.size(self.label)
+        label_rect = pygame.Rect(self.rect.x + (self.rect.w - width) // 2, self.rect.y - 32,
+                                 width + 1, height)
+        return self.rect.union(label_rect)
+
     @abstractmethod
     def get_value(self):
         pass
@@ -72,9 +190,12 @@ class TextBox(InputBox):
     
     def render(self, screen):
         super().render(screen)
-        surface = self.font.render(self.text, True, self.color)
+        surface = _render_text(self.font, self.text, self.color)
         screen.blit(surface, surface.get_rect(center=self.rect.center))
 
+    def look(self):
+        return self.label, self.text
+
     def update(self, event):
         super().update(event)
         if self.hovered and event.type == pygame.KEYDOWN:
@@ -101,8 +222,11 @@ class SlideBox(InputBox):
     def render(self, screen):
         super().render(screen)
         pygame.draw.rect(screen, self.color, self.rect, 2)
-        pygame.draw.line(screen, self.color, (self.start, self.rect.y + 25), (self.end, self.rect.y + 25), 2)
-        pygame.draw.line(screen, self.color, (self.value, self.rect.y + 5), (self.value, self.rect.y + 45), 12)
+        pygame.draw.line(screen, self.color, (self.start, self.rect.centery), (self.end, self.rect.centery), 2)
+        pygame.draw.line(screen, self.color, (self.value, self.rect.y + 5), (self.value, self.rect.bottom - 5), 12)
+
+    def look(self):
+        return self.label, self.value
 
     def update(self, event):
         super().update(event)
@@ -135,9 +259,10 @@ class SlideBox(InputBox):
 class ButtonBox(Box):
     def __init__(self, rect, inactive_img_path, active_img_path):
         super().__init__(rect)
-        self.inactive_img = pygame.image.load(inactive_img_path)
+        # Converted to the display's pixel format once, not on every blit
+        self.inactive_img = pygame.image.load(inactive_img_path).convert_alpha()
         self.inactive_img = pygame.transform.scale(self.inactive_img, (rect[2], rect[3]))
-        self.active_img = pygame.image.load(active_img_path)
+        self.active_img = pygame.image.load(active_img_path).convert_alpha()
         self.active_img = pygame.transform.scale(self.active_img, (rect[2], rect[3]))
         self.active = False
     
@@ -145,6 +270,9 @@ class ButtonBox(Box):
         img = self.active_img if self.active else self.inactive_img
         screen.blit(img, (self.rect.x, self.rect.y))
 
+    def look(self):
+        return self.active
+
     def update(self, event):
         super().update(event)
         if self.clicked:
@@ -169,16 +297,24 @@ class CounterBox(Box):
     
     def render(self, screen):
         # Draw label above the counter
-        label_surface = self.font.render(self.label, True, self.color)
+        label_surface = _render_text(self.font, self.label, self.color)
         screen.blit(label_surface, (self.rect.x, self.rect.y - 25))
         
         # Draw the counter value box
         pygame.draw.rect(screen, self.color, self.rect, 2)
         
         # Render the value
-        value_text = self.font.render(str(self.value), True, self.color)
+        value_text = _render_text(self.font, str(self.value), self.color)
         text_rect = value_text.get_rect(center=self.rect.center)
         screen.blit(value_text, text_rect)
+
+    def look(self):
+        return self.label, self.value
+
+    def bounds(self):
+        """The box and its label above it."""
+        width, height = self.font.size(self.label)
+        return self.rect.union((self.rect.x, self.rect.y - 25, width, height))
     
     def update(self, event):
         super().update(event)
@@ -209,9 +345,12 @@ class ModeButtonBox(Box):
         pygame.draw.rect(screen, (50, 50, 50), self.rect, 2, border_radius=10)
         
         # Render label
-        label_surface = self.font.render(self.label, True, (250, 250, 250))
+        label_surface = _render_text(self.font, self.label, (250, 250, 250))
         text_rect = label_surface.get_rect(center=self.rect.center)
         screen.blit(label_surface, text_rect)
+
+    def look(self):
+        return self.selected
     
     def update(self, event):
         super().update(event)
@@ -226,21 +365,36 @@ class ModeButtonBox(Box):
 
 
 class LabelBox(Box):
-    """A simple label display box."""
+    """A simple label display box; the text is centred unless align='left'."""
     
-    def __init__(self, rect, text, color, font, bg_color=None):
+    def __init__(self, rect, text, color, font, bg_color=None, align='center'):
         super().__init__(rect)
         self.text = text
         self.color = color
         self.font = font
         self.bg_color = bg_color
+        self.align = align
     
     def render(self, screen):
         if self.bg_color:
             pygame.draw.rect(screen, self.bg_color, self.rect)
-        label_surface = self.font.render(self.text, True, self.color)
-        text_rect = label_surface.get_rect(center=self.rect.center)
-        screen.blit(label_surface, text_rect)
+        label_surface = _render_text(self.font, self.text, self.color)
+        screen.blit(label_surface, self._text_rect(label_surface.get_size()))
+
+    def _text_rect(self, size):
+        text_rect = pygame.Rect((0, 0), size)
+        if self.align == 'left':
+            text_rect.midleft = self.rect.midleft
+        else:
+            text_rect.center = self.rect.center
+        return text_rect
+
+    def look(self):
+        return self.text, self.color, self.bg_color
+
+    def bounds(self):
+        """The box, and the text where it is wider or taller than that."""
+        return self.rect.union(self._text_rect(self.font.size(self.text)))
     
     def update(self, event):
         super().update(event)
@@ -293,9 +447,12 @@ class StepButtonBox(Box):
 
         pygame.draw.rect(screen, bg, self.rect, border_radius=6)
         pygame.draw.rect(screen, (30, 30, 30), self.rect, 2, border_radius=6)
-        surf = self.font.render(self.symbol, True, fg)
+        surf = _render_text(self.font, self.symbol, fg)
         screen.blit(surf, surf.get_rect(center=self.rect.center))
 
+    def look(self):
+        return self.symbol, self.disabled, self.hovered
+
     def update(self, event):
         super().update(event)
         # Reset the fired flag every frame so callers see at most one True
@@ -330,9 +487,12 @@ class ToggleButtonBox(Box):
         color = self.color_on if self.active else self.color_off
         pygame.draw.rect(screen, color, self.rect, border_radius=6)
         pygame.draw.rect(screen, (30, 30, 30), self.rect, 2, border_radius=6)
-        surf = self.font.render(self.label, True, self.text_color)
+        surf = _render_text(self.font, self.label, self.text_color)
         screen.blit(surf, surf.get_rect(center=self.rect.center))
 
+    def look(self):
+        return self.label, self.active
+
     def update(self, event):
         super().update(event)
         if self.clicked:
@@ -350,9 +510,23 @@ class LeaderboardTable(Box):
     A scrollable table widget that renders leaderboard rows.
 
     Columns displayed (fixed order):
-        Rank | Algorithm | Size | Swaps | Comparisons | Time (ms) | Date
+        Rank | Algorithm | Size | Swaps | Comparisons | Time (ms) | Date | Input | Seed
+
+    Clicking a row selects it (clicking it again clears the selection);
+    get_selected() returns its record.
+
+    The records can be a list or a lazy sequence such as
+    database.RecordQuery: the table only takes len() and slices of the
+    visible rows, so a view of any length costs one page per frame. The
+    scrollbar can be clicked or dragged to jump anywhere in it.
+
+    Each row is drawn once onto a Surface of its own, kept in a cache of
+    the ROW_CACHE_SIZE most recently shown rows and keyed by its text and
+    colour, so a frame only renders text for the rows it has not drawn
+    before; the header is drawn once.
     """
 
+    # The widths leave SCROLLBAR_WIDTH of the table's 900 px for the scrollbar
     COLUMNS = [
         ('Rank',        40),
         ('Algorithm',  160),
@@ -361,9 +535,13 @@ class LeaderboardTable(Box):
         ('Comparisons', 100),
         ('Time (s)',     90),
         ('Date',        150),
+        ('Input',       140),
+        ('Seed',         82),
     ]
     ROW_HEIGHT = 28
     HEADER_HEIGHT = 32
+    SCROLLBAR_WIDTH = 8
+    ROW_CACHE_SIZE = 256
 
     def __init__(self, rect, font, header_font,
                  bg_color=(240, 240, 255),
@@ -372,7 +550,8 @@ class LeaderboardTable(Box):
                  header_color=(30, 30, 120),
                  border_color=(100, 100, 100),
                  text_color=(20, 20, 20),
-                 header_text_color=(250, 250, 250)):
+                 header_text_color=(250, 250, 250),
+                 selected_color=(255, 225, 150)):
         super().__init__(rect)
         self.font = font
         self.header_font = header_font
@@ -383,10 +562,15 @@ class LeaderboardTable(Box):
         self.border_color = border_color
         self.text_color = text_color
         self.header_text_color = header_text_color
+        self.selected_color = selected_color
 
-        self.records = []          # list of dicts from database.get_records()
+        self.records = []          # sequence of record dicts (list or RecordQuery)
         self.scroll_offset = 0    # first visible row index
+        self.selected_index = None  # index into records of the selected row
         self._visible_rows = 0    # computed each render
+        self._dragging = False    # the scrollbar thumb is being dragged
+        self._row_cache = OrderedDict()   # (cells, colour) -> row Surface, LRU last
+        self._header = None       # the header row Surface
 
     # ------------------------------------------------------------------
     # Public helpers
@@ -394,19 +578,54 @@ class LeaderboardTable(Box):
     def set_records(self, records: list):
         self.records = records
         self.scroll_offset = 0
+        self.selected_index = None
+
+    def get_selected(self):
+        """Return the selected record, or None."""
+        if self.selected_index is None:
+            return None
+        return self.records[self.selected_index]
 
     def get_value(self):
         return self.records
 
     def set_value(self, value):
-        """Set the table records. Expects a list of dictionaries."""
+        """Set the table records: a list of dicts or a RecordQuery."""
         self.set_records(value)
 
+    def look(self):
+        return self.records, self.scroll_offset, self.selected_index
+
+    def _scrollbar(self):
+        """(track top, track height, thumb height), or None without a scrollbar."""
+        total = len(self.records)
+        if total <= self._visible_rows or self._visible_rows <= 0:
+            return None
+        track_h = self.rect.height - self.HEADER_HEIGHT
+        thumb_h = max(20, int(track_h * self._visible_rows / total))
+        return self.rect.y + self.HEADER_HEIGHT, track_h, thumb_h
+
+    def _scroll_to(self, y):
+        """Scroll so that the thumb's centre follows the mouse at height y."""
+        bar = self._scrollbar()
+        if bar is None:
+            return
+        top, track_h, thumb_h = bar
+        fraction = (y - top - thumb_h / 2) / max(1, track_h - thumb_h)
+        max_offset = len(self.records) - self._visible_rows
+        self.scroll_offset = round(min(1.0, max(0.0, fraction)) * max_offset)
+
     # ------------------------------------------------------------------
     # Interaction
     # ------------------------------------------------------------------
     def update(self, event):
         super().update(event)
+        if self._dragging:
+            if event.type == pygame.MOUSEMOTION:
+                self._scroll_to(self.mousePos[1])
+            elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                self._dragging = False
+            return
         if not self.rect.collidepoint(pygame.mouse.get_pos()):
             return
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -415,6 +634,16 @@ class LeaderboardTable(Box):
             elif event.button == 5:  # scroll down
                 max_offset = max(0, len(self.records) - self._visible_rows)
                 self.scroll_offset = min(self.scroll_offset + 1, max_offset)
+            elif event.button == 1:  # select / deselect a row
+                body_y = self.rect.y + self.HEADER_HEIGHT
+                if (self.mousePos[0] >= self.rect.right - self.SCROLLBAR_WIDTH
+                        and self.mousePos[1] >= body_y and self._scrollbar()):
+                    self._dragging = True
+                    self._scroll_to(self.mousePos[1])
+                elif self.mousePos[1] >= body_y:
+                    row_idx = self.scroll_offset + (self.mousePos[1] - body_y) // self.ROW_HEIGHT
+                    if row_idx < len(self.records):
+                        self.selected_index = None if row_idx == self.selected_index else row_idx
 
     # ------------------------------------------------------------------
     # Rendering
@@ -432,66 +661,116 @@ class LeaderboardTable(Box):
         y_header = self.rect.y
 
         # --- Header row ---
-        pygame.draw.rect(screen, self.header_color,
-                         (x_start, y_header, self.rect.width, self.HEADER_HEIGHT))
-        x = x_start
-        for col_name, col_w in self.COLUMNS:
-            surf = self.header_font.render(col_name, True, self.header_text_color)
-            screen.blit(surf, (x + 4, y_header + (self.HEADER_HEIGHT - surf.get_height()) // 2))
-            x += col_w
-            # vertical divider
-            pygame.draw.line(screen, self.border_color,
-                             (x - 1, y_header), (x - 1, y_header + self.HEADER_HEIGHT))
+        if self._header is None:
+            self._header = self._render_header()
+        screen.blit(self._header, (x_start, y_header))
 
         # --- Data rows ---
         body_y = y_header + self.HEADER_HEIGHT
         available_h = self.rect.height - self.HEADER_HEIGHT
         self._visible_rows = available_h // self.ROW_HEIGHT
 
-        for i in range(self._visible_rows):
+        visible = self.records[self.scroll_offset:self.scroll_offset + self._visible_rows]
+        for i, rec in enumerate(visible):
             row_idx = self.scroll_offset + i
-            if row_idx >= len(self.records):
-                break
-            rec = self.records[row_idx]
-            row_y = body_y + i * self.ROW_HEIGHT
-            row_color = self.row_color if i % 2 == 0 else self.alt_row_color
-            pygame.draw.rect(screen, row_color,
-                             (x_start, row_y, self.rect.width, self.ROW_HEIGHT))
-
-            values = [
-                str(row_idx + 1),
-                rec.get('algorithm', ''),
-                str(rec.get('array_size', '')),
-                str(rec.get('swaps', '')),
-                str(rec.get('comparisons', '')),
-                f"{rec.get('elapsed_ms', 0) / 1000:.3f}",
-                rec.get('created_at', '')[:16],   # trim seconds
-            ]
-            x = x_start
-            for val, (_, col_w) in zip(values, self.COLUMNS):
+            row_color = self.row_color if row_idx % 2 == 0 else self.alt_row_color
+            if row_idx == self.selected_index:
+                row_color = self.selected_color
+            screen.blit(self._row_surface(tuple(self._row_values(row_idx, rec)), row_color),
+                        (x_start, body_y + i * self.ROW_HEIGHT))
+
+        # --- Scrollbar ---
+        bar = self._scrollbar()
+        if bar:
+            _, sb_h, thumb_h = bar
+            sb_x = self.rect.right - self.SCROLLBAR_WIDTH
+            max_offset = len(self.records) - self._visible_rows
+            thumb_y = body_y + int((sb_h - thumb_h) * self.scroll_offset / max_offset)
+            pygame.draw.rect(screen, (180, 180, 200), (sb_x, body_y, self.SCROLLBAR_WIDTH, sb_h))
+            pygame.draw.rect(screen, self.header_color,
+                             (sb_x, thumb_y, self.SCROLLBAR_WIDTH, thumb_h))
+
+        screen.set_clip(clip_rect)
+
+    def _render_header(self):
+        surface = pygame.Surface((self.rect.width, self.HEADER_HEIGHT))
+        surface.fill(self.header_color)
+        x = 0
+        for col_name, col_w in self.COLUMNS:
+            surf = self.header_font.render(col_name, True, self.header_text_color)
+            surface.blit(surf, (x + 4, (self.HEADER_HEIGHT - surf.get_height()) // 2))
+            x += col_w
+            # vertical divider
+            pygame.draw.line(surface, self.border_color, (x - 1, 0), (x - 1, self.HEADER_HEIGHT))
+        return surface
+
+    def _row_surface(self, cells: tuple, row_color) -> pygame.Surface:
+        """The row showing `cells` on `row_color`, from the cache if drawn before."""
+        key = (cells, row_color)
+        surface = self._row_cache.pop(key, None)
+        if surface is None:
+            surface = pygame.Surface((self.rect.width, self.ROW_HEIGHT))
+            surface.fill(row_color)
+            x = 0
+            for val, (_, col_w) in zip(cells, self.COLUMNS):
                 surf = self.font.render(val, True, self.text_color)
-                screen.blit(surf, (x + 4, row_y + (self.ROW_HEIGHT - surf.get_height()) // 2))
+                surface.blit(surf, (x + 4, (self.ROW_HEIGHT - surf.get_height()) // 2))
                 x += col_w
-                pygame.draw.line(screen, self.border_color,
-                                 (x - 1, row_y), (x - 1, row_y + self.ROW_HEIGHT))
-
+                pygame.draw.line(surface, self.border_color, (x - 1, 0), (x - 1, self.ROW_HEIGHT))
             # horizontal row divider
-            pygame.draw.line(screen, self.border_color,
-                             (x_start, row_y + self.ROW_HEIGHT - 1),
-                             (x_start + self.rect.width, row_y + self.ROW_HEIGHT - 1))
+            pygame.draw.line(surface, self.border_color,
+                             (0, self.ROW_HEIGHT - 1), (self.rect.width, self.ROW_HEIGHT - 1))
+            if len(self._row_cache) >= self.ROW_CACHE_SIZE:
+                self._row_cache.popitem(last=False)
+        self._row_cache[key] = surface
+        return surface
+
+    def _row_values(self, row_idx: int, rec: dict) -> list:
+        """The text of each column for the record shown at row_idx."""
+        return [
+            str(row_idx + 1),
+            rec.get('algorithm', ''),
+            str(rec.get('array_size', '')),
+            str(rec.get('swaps', '')),
+            str(rec.get('comparisons', '')),
+            f"{rec.get('elapsed_ms', 0) / 1000:.3f}",
+            rec.get('created_at', '')[:16],   # trim seconds
+            (rec.get('distribution') or '').split(':')[0],   # name only
+            '' if rec.get('seed') is None else str(rec['seed']),
+        ]
+
+
+class StatsTable(LeaderboardTable):
+    """
+    A LeaderboardTable of database.get_stats() groups instead of runs: one
+    row per algorithm, array size and input distribution, with the number
+    of runs and the summary statistics of their times and counts.
+    """
 
-        # --- Scrollbar ---
-        total = len(self.records)
-        if total > self._visible_rows and self._visible_rows > 0:
-            sb_x = self.rect.right - 8
-            sb_h = available_h
-            thumb_h = max(20, int(sb_h * self._visible_rows / total))
-            max_offset = total - self._visible_rows
-            thumb_y = body_y + int((sb_h - thumb_h) * self.scroll_offset / max_offset) if max_offset else body_y
-            pygame.draw.rect(screen, (180, 180, 200), (sb_x, body_y, 8, sb_h))
-            pygame.draw.rect(screen, self.header_color, (sb_x, thumb_y, 8, thumb_h))
+    COLUMNS = [
+        ('Algorithm',   150),
+        ('Size',         60),
+        ('Input',       100),
+        ('Runs',         60),
+        ('Time (s) ±sd', 130),
+        ('p50 (s)',      80),
+        ('p95 (s)',      80),
+        ('Comparisons', 120),
+        ('Swaps',       112),
+    ]
 
-        screen.set_clip(clip_rect)
+    def _row_values(self, row_idx: int, rec: dict) -> list:
+        return [
+            rec['algorithm'],
+            str(rec['array_size']),
+            rec['distribution'],
+            f"{rec['runs']:,}",
+            f"{rec['elapsed_ms_mean'] / 1000:.3f} ±{rec['elapsed_ms_stdev'] / 1000:.3f}",
+            f"{rec['elapsed_ms_p50'] / 1000:.3f}",
+            f"{rec['elapsed_ms_p95'] / 1000:.3f}",
+            f"{rec['comparisons_mean']:,.0f}",
+            f"{rec['swaps_mean']:,.0f}",
+        ]
 
 
 class DropdownBox(InputBox):
@@ -499,14 +778,17 @@ class DropdownBox(InputBox):
     VISIBLE_OPTIONS = 8
 
     def __init__(self, rect, label, color, font, options, options_background_color,
-                 direction='up'):
+                 direction='up', detail_font=None):
         """
         direction : 'up'   – list expands above the box (default, original behaviour)
                     'down' – list expands below the box (use when box is near the top)
+        detail_font : font of the line set_details() adds under each option
         """
         super().__init__(rect, label, color, font)
         self.openDropdown = False
         self.options = options
+        self.details = None     # one line per option drawn under it, see set_details()
+        self.detail_font = detail_font
         self.options_background_color = options_background_color
         self.direction = direction
 
@@ -538,14 +820,36 @@ class DropdownBox(InputBox):
         super().render(screen)
 
         # Render the selected option in the input box
-        option_text = self.font.render(self.options[self.selected_option], 1, self.color)
-        screen.blit(option_text, option_text.get_rect(center=self.rect.center))
+        self._draw_option(screen, self.rect, self.selected_option)
 
-        # For dropdowns that open upward the panel is NOT overlaid by anything,
-        # so we draw it inline here as before.  For downward dropdowns the
-        # Window's second render pass calls render_overlay() instead.
-        if self.openDropdown and self.direction != 'down':
-            self._draw_panel(screen)
+    def look(self):
+        return self.label, self.options[self.selected_option], self._detail(self.selected_option)
+
+    def set_details(self, details):
+        """
+        Show a small line under each option, e.g. what it costs; `details`
+        has one string (or None) per option, or is None for none at all.
+        Needs a detail_font.
+        """
+        self.details = details
+
+    def _detail(self, index):
+        if self.details is None or self.detail_font is None:
+            return None
+        return self.details[index]
+
+    def _draw_option(self, screen, rect, index):
+        """Option `index` centred in `rect`, above its detail line if it has one."""
+        option_text = _render_text(self.font, self.options[index], self.color)
+        detail = self._detail(index)
+        if not detail:
+            screen.blit(option_text, option_text.get_rect(center=rect.center))
+            return
+        detail_text = _render_text(self.detail_font, detail, self.color)
+        top = rect.centery - (option_text.get_height() + detail_text.get_height()) // 2
+        screen.blit(option_text, option_text.get_rect(midtop=(rect.centerx, top)))
+        screen.blit(detail_text, detail_text.get_rect(
+            midtop=(rect.centerx, top + option_text.get_height())))
 
     def render_overlay(self, screen):
         """Draw the floating panel on top of all other widgets.
@@ -572,8 +876,7 @@ class DropdownBox(InputBox):
 
             pygame.draw.rect(screen, self.options_background_color, rect)
             pygame.draw.rect(screen, self.color, rect, 1)
-            option_text = self.font.render(self.options[index], 1, self.color)
-            screen.blit(option_text, option_text.get_rect(center=rect.center))
+            self._draw_option(screen, rect, index)
 
         self.render_scrollbar(screen)
 
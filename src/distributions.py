@@ -0,0 +1,190 @@
+"""
+Input arrays for the sorting runs, in several shapes.
+
+Every input is described by a spec string, a distribution name plus its
+parameters:
+
+    random:low=10,high=400
+    nearly_sorted:low=10,high=400,k=5
+    gaussian:low=10,high=300,sigma=0.15
+
+canonical() fills in every parameter the caller left out, so a canonical
+spec together with the array size and the seed regenerates exactly the
+same array with make_input(). Store those three with a run to be able to
+reproduce it.
+
+The arrays are built with NumPy (np.random.default_rng(seed)) and returned
+as lists of Python ints, all within [low, high]. NumPy is imported by the
+first make_input() call, so the specs can be parsed without it.
+
+    random         uniform integers
+    sorted         uniform integers in ascending order
+    reversed       uniform integers in descending order
+    nearly_sorted  sorted, then k disjoint pairs of positions swapped
+    few_unique     `unique` distinct values, repeated at random
+    sawtooth       `teeth` ascending runs one after the other
+    organ_pipe     ascending to the middle, then descending
+    gaussian       normal around the middle of the range, sd = sigma * range
+    zipf           Zipf-distributed ranks with exponent a; mostly small values
+"""
+
+np = None      # numpy, imported by make_input()
+
+DEFAULT_LOW = 10
+DEFAULT_HIGH = 400
+
+
+def _random(rng, size, low, high):
+    return rng.integers(low, high, size, endpoint=True)
+
+
+def _sorted(rng, size, low, high):
+    return np.sort(_random(rng, size, low, high))
+
+
+def _reversed(rng, size, low, high):
+    return _sorted(rng, size, low, high)[::-1]
+
+
+def _nearly_sorted(rng, size, low, high, k):
+    array = _sorted(rng, size, low, high)
+    k = min(k, size // 2)
+    if k:
+        # 2k distinct positions, paired up, so the swaps do not overlap
+        pos = rng.choice(size, 2 * k, replace=False)
+        first, second = pos[:k], pos[k:]
+        array[first], array[second] = array[second], array[first].copy()
+    return array
+
+
+def _few_unique(rng, size, low, high, unique):
+    values = rng.integers(low, high, max(1, unique), endpoint=True)
+    return rng.choice(values, size)
+
+
+def _sawtooth(rng, size, low, high, teeth):
+    array = _random(rng, size, low, high)
+    for tooth in np.array_split(array, max(1, teeth)):
+        tooth.sort()
+    return array
+
+
+def _organ_pipe(rng, size, low, high):
+    ordered = _sorted(rng, size, low, high)
+    return np.concatenate((ordered[::2], ordered[1::2][::-1]))
+
+
+def _gaussian(rng, size, low, high, sigma):
+    values = rng.normal((low + high) / 2, sigma * (high - low), size)
+    return np.clip(np.rint(values), low, high).astype(np.int64)
+
+
+def _zipf(rng, size, low, high, a):
+    ranks = rng.zipf(a, size)
+    return low + np.minimum(ranks - 1, high - low)
+
+
+# name -> (generator, {parameter: default}); a default may depend on the size
+DISTRIBUTIONS = {
+    'random':        (_random, {}),
+    'sorted':        (_sorted, {}),
+    'reversed':      (_reversed, {}),
+    'nearly_sorted': (_nearly_sorted, {'k': lambda size: max(1, size // 20)}),
+    'few_unique':    (_few_unique, {'unique': 5}),
+    'sawtooth':      (_sawtooth, {'teeth': 4}),
+    'organ_pipe':    (_organ_pipe, {}),
+    'gaussian':      (_gaussian, {'sigma': 0.15}),
+    'zipf':          (_zipf, {'a': 1.5}),
+}
+
+DISTRIBUTION_NAMES = list(DISTRIBUTIONS)
+
+# Parameters whose values are floats; all others are ints
+_FLOAT_PARAMS = {'sigma', 'a'}
+
+# parameter -> (test of a usable value, what the test asks for)
+_PARAM_RANGES = {
+    'k':      (lambda value: value >= 0, '0 or more'),
+    'unique': (lambda value: value >= 1, '1 or more'),
+    'teeth':  (lambda value: value >= 1, '1 or more'),
+    'sigma':  (lambda value: value >= 0, '0 or more'),
+    'a':      (lambda value: value > 1, 'above 1'),
+}
+
+
+def parse_spec(spec: str) -> tuple:
+    """
+    Split 'name:key=value,...' into (name, {key: value}).
+
+    Raises ValueError for an unknown distribution or parameter, or for a
+    value make_input() cannot use.
+    """
+    name, _, rest = spec.strip().partition(':')
+    if name not in DISTRIBUTIONS:
+        raise ValueError(f'Unknown distribution: {name}')
+    allowed = {'low', 'high', *DISTRIBUTIONS[name][1]}
+    params = {}
+    for item in filter(None, (part.strip() for part in rest.split(','))):
+        key, sep, value = item.partition('=')
+        key = key.strip()
+        if not sep or key not in allowed:
+            raise ValueError(f'Bad parameter for {name}: {item!r}')
+        params[key] = float(value) if key in _FLOAT_PARAMS else int(value)
+        check, wanted = _PARAM_RANGES.get(key, (None, None))
+        if check is not None and not check(params[key]):
+            raise ValueError(f'Bad parameter for {name}: {key} must be {wanted}, '
+                             f'not {value.strip()}')
+    if 'low' in params and 'high' in params and params['high'] < params['low']:
+        raise ValueError(f"Bad parameters for {name}: high ({params['high']}) "
+                         f"is below low ({params['low']})")
+    return name, params
+
+
+def format_spec(name: str, params: dict) -> str:
+    """Inverse of parse_spec()."""
+    if not params:
+        return name
+    return name + ':' + ','.join(f'{key}={value:g}' if isinstance(value, float)
+                                 else f'{key}={value}' for key, value in params.items())
+
+
+def canonical(spec: str, size: int, low: int = DEFAULT_LOW, high: int = DEFAULT_HIGH) -> str:
+    """
+    Return `spec` with every parameter spelled out for an array of `size`.
+
+    `low` and `high` are only used when the spec does not set them.
+    """
+    name, given = parse_spec(spec)
+    params = {'low': given.get('low', low), 'high': given.get('high', high)}
+    for key, default in DISTRIBUTIONS[name][1].items():
+        params[key] = given[key] if key in given else (
+            default(size) if callable(default) else default)
+    return format_spec(name, params)
+
+
+def make_input(spec: str, size: int, seed: int = None) -> list:
+    """
+    Build the input array described by `spec`, `size` and `seed`.
+
+    Parameters
+    ----------
+    spec : str
+        A distribution name or spec string; missing parameters take their
+        defaults as in canonical().
+    size : int
+        Number of elements.
+    seed : int or None
+        Seed for np.random.default_rng(); None draws a fresh one, so the
+        array cannot be regenerated.
+    """
+    name, params = parse_spec(canonical(spec, size))
+    low, high = params.pop('low'), params.pop('high')
+    if high < low:
+        raise ValueError(f'high ({high}) is below low ({low})')
+    if size <= 0:
+        return []
+    global np
+    if np is None:
+        import numpy as np
+    generate = DISTRIBUTIONS[name][0]
+    return generate(np.random.default_rng(seed), size, low, high, **params).tolist()
@@ -0,0 +1,73 @@
+"""
+Operation events yielded by the sorting algorithms.
+
+An algorithm is a generator over the array it sorts. Right before each
+operation it yields one event, a 5-tuple whose first item says what is
+about to happen:
+
+    COMPARE,   i, j,     blue1, blue2   array[i] is compared with array[j]
+                                        (j is -1 when compared with a value
+                                        held outside the array)
+    SWAP,      i, j,     blue1, blue2   array[i] and array[j] are exchanged
+    WRITE,     i, value, blue1, blue2   array[i] = value
+    READ,      i, -1,    blue1, blue2   array[i] is read into a buffer
+    HIGHLIGHT, r1, r2,   blue1, blue2   nothing happens, the bars are marked
+
+and then performs the operation itself. blue1/blue2 mark context such as
+the bounds of the range being worked on (-1 for none). Plain tuples keep an
+event as cheap as the old frame tuples.
+
+Everything else is derived from the stream in one place: frames() counts
+COMPARE as a comparison and SWAP / WRITE as a swap in the current counter,
+and turns every event into the (array, red1, red2, blue1, blue2) frame the
+visualizer, the trace recorder and the bar renderers understand, with the operated
+on indices as the red bars.
+"""
+
+import functools
+
+from counters import current_counter
+
+COMPARE = 0
+SWAP = 1
+WRITE = 2
+READ = 3
+HIGHLIGHT = 4
+
+EVENT_NAMES = ('compare', 'swap', 'write', 'read', 'highlight')
+
+
+def frames(events, array):
+    """
+    Translate an event stream into (array, red1, red2, blue1, blue2) frames.
+
+    Comparisons and swaps are counted in the counter that is current when
+    each event arrives, so callers select counters exactly as they did when
+    the algorithms counted for themselves.
+    """
+    for kind, a, b, blue1, blue2 in events:
+        if kind == COMPARE:
+            current_counter().comparisons += 1
+            yield array, a, b, blue1, blue2
+        elif kind == SWAP:
+            current_counter().swaps += 1
+            yield array, a, b, blue1, blue2
+        elif kind == WRITE:
+            current_counter().swaps += 1
+            yield array, a, -1, blue1, blue2
+        else:
+            yield array, a, b, blue1, blue2
+
+
+def framed(algorithm):
+    """
+    Wrap an event-yielding algorithm so that calling it returns frames().
+
+    The wrapper keeps the algorithm's name, module and docstring (fastalgs
+    relies on them) and exposes the raw event generator as `.events`.
+    """
+    @functools.wraps(algorithm)
+    def sort(array, *args, **kwargs):
+        return frames(algorithm(array, *args, **kwargs), array)
+    sort.events = algorithm
+    return sort
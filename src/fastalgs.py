@@ -0,0 +1,116 @@
+"""
+Uninstrumented variants of the sorting algorithms.
+
+The functions in algorithms/ are generators that interleave the real work
+with `yield COMPARE, i, j, ...` operation events (see events.py). This
+module rewrites the source of each algorithm module with an AST pass so that:
+
+    * `yield <event>` statements are dropped,
+    * `yield from helper(...)` becomes a plain call `helper(...)`, also when
+      its return value is assigned (`j = yield from binary_search(...)`),
+    * the `from events import ...` line is dropped, as are increment_* calls
+      and `from counters import ...` in modules that still count by hand,
+    * `from algorithms.X import f` resolves to the fast variant of f.
+
+The result is a plain, non-generator, non-counting function that sorts the
+array in place, compiled from the current source every time the module is
+loaded, so it never drifts from the instrumented version.
+"""
+
+import ast
+import importlib
+import inspect
+
+_COUNTER_CALLS = {'increment_comparisons', 'increment_swaps'}
+
+# module name -> namespace dict of the compiled fast module
+_fast_modules = {}
+
+
+class _StripInstrumentation(ast.NodeTransformer):
+    """Remove event yields and counter calls from a module AST."""
+
+    def visit_ImportFrom(self, node):
+        if node.module in ('counters', 'events'):
+            return None
+        if node.module and node.module.startswith('algorithms.'):
+            # from algorithms.X import a, b  ->  a = _fast_import('algorithms.X', 'a')
+            return [
+                ast.Assign(
+                    targets=[ast.Name(id=alias.asname or alias.name, ctx=ast.Store())],
+                    value=ast.Call(
+                        func=ast.Name(id='_fast_import', ctx=ast.Load()),
+                        args=[ast.Constant(node.module), ast.Constant(alias.name)],
+                        keywords=[]),
+                )
+                for alias in node.names
+            ]
+        return node
+
+    def visit_Expr(self, node):
+        value = node.value
+        if isinstance(value, ast.Yield):
+            return None
+        if isinstance(value, ast.YieldFrom):
+            return ast.Expr(value=self.visit(value.value))
+        if (isinstance(value, ast.Call) and isinstance(value.func, ast.Name)
+                and value.func.id in _COUNTER_CALLS):
+            return None
+        return self.generic_visit(node)
+
+    def visit_Assign(self, node):
+        # g = yield from helper(...)  ->  g = helper(...)
+        if isinstance(node.value, ast.YieldFrom):
+            node.value = node.value.value
+        return self.generic_visit(node)
+
+    def visit_Yield(self, node):
+        raise SyntaxError('fastalgs: yield used as an expression is not supported')
+
+    def visit_YieldFrom(self, node):
+        raise SyntaxError('fastalgs: yield from used outside a statement is not supported')
+
+    def generic_visit(self, node):
+        super().generic_visit(node)
+        # Statements whose whole body was stripped still need a body
+        body = getattr(node, 'body', None)
+        if isinstance(body, list) and not body:
+            body.append(ast.Pass())
+        return node
+
+
+def _fast_import(module_name, attr):
+    """Resolve `from algorithms.X import attr` inside a fast module."""
+    return _load_fast_module(module_name)[attr]
+
+
+def _load_fast_module(module_name):
+    """Compile (once) and return the namespace of the fast copy of a module."""
+    namespace = _fast_modules.get(module_name)
+    if namespace is not None:
+        return namespace
+
+    module = importlib.import_module(module_name)
+    source = inspect.getsource(module)
+    tree = _StripInstrumentation().visit(ast.parse(source))
+    ast.fix_missing_locations(tree)
+    code = compile(tree, f'<fast {module.__file__}>', 'exec')
+
+    namespace = {
+        '__name__': f'{module_name}__fast',
+        '__file__': module.__file__,
+        '_fast_import': _fast_import,
+    }
+    _fast_modules[module_name] = namespace
+    exec(code, namespace)
+    return namespace
+
+
+def make_fast(func):
+    """
+    Return the uninstrumented variant of an algorithm generator function.
+
+    The variant takes the same arguments, sorts the array in place and
+    returns None instead of a generator.
+    """
+    return _load_fast_module(func.__module__)[func.__name__]
@@ -1,23 +1,28 @@
 import pygame
 from display import (Window, TextBox, SlideBox, DropdownBox, ButtonBox,
                      CounterBox, ModeButtonBox, LabelBox,
-                     ToggleButtonBox, LeaderboardTable, StepButtonBox)
-from algs import algorithmsDict
-from counters import reset_counters, get_comparisons, get_swaps, set_current_instance
-from database import save_record, get_records, get_algorithms, export_csv
+                     ToggleButtonBox, LeaderboardTable, StatsTable, StepButtonBox)
+from algmeta import STEP_BUDGET, expected_steps, format_steps, max_size
+from algs import algorithmsDict, allAlgorithmsDict, seeded
+from counters import Counter, set_counter, reset_counter
+from complexity import describe, fit_measurements
+from database import (save_record_async, flush_writes, shutdown_writer, RecordQuery,
+                      get_algorithms, get_measurements, get_stats, ExportJob)
+from distributions import DISTRIBUTION_NAMES, canonical, make_input, parse_spec
+from optrace import TraceRecorder, TracePlayer
+from renderer import BarRenderer, ScreenUpdater, make_bar_renderer, HAVE_NUMPY
+from playback import (StepPacer, steps_per_second, format_rate, run_steps,
+                      FRAME_RATE_CAP, SPEED_SLIDER_DEFAULT,
+                      FRAME_WORK_BUDGET, SKIP_FRAME_BUDGET)
 import os
-from random import randint
+import sys
+from random import randrange
 import time
-import math
-import copy
 
-# Initialize pygame modules
-pygame.init()
-
-# Font
-baseFont = pygame.font.SysFont('Arial', 24)
-smallFont = pygame.font.SysFont('Arial', 18)
-titleFont = pygame.font.SysFont('Arial', 36, bold=True)
+# Fonts and the screen, set by init_pygame(): importing this module does
+# not touch the display, the font cache or the database
+baseFont = smallFont = titleFont = tinyFont = None
+screen = None
 
 # Colors
 grey = (100, 100, 100)
@@ -31,20 +36,38 @@ light_grey = (200, 200, 200)
 arena_color = (255, 100, 100)
 solo_color = (100, 150, 255)
 
-# Additional font for leaderboard table
-tinyFont = pygame.font.SysFont('Arial', 14)
-
 # ── Solo-mode visualization geometry ────────────────────────────────────────
-# A 45 px control strip occupies the far-left of the screen.
+# A 45 px control strip occupies the far-left of the screen and the timeline
+# slider a 34 px strip along the top.
 # All bar drawing is offset to start at x=45 and uses the remaining width.
 VIZ_X_OFFSET  = 45    # left edge of the bar area
 VIZ_WIDTH     = 855   # width available for bars  (900 - VIZ_X_OFFSET)
-VIZ_MAX_H     = 400   # maximum bar height (pixels)
-VIZ_Y_OFFSET  = 0     # top of bar area
-
-# Maximum number of snapshots kept in the step-back history.
-# Each snapshot stores two small lists (array + heat) → ~1 KB for 200 bars.
-HISTORY_LIMIT = 500
+VIZ_MAX_H     = 366   # maximum bar height (pixels)
+VIZ_Y_OFFSET  = 34    # top of bar area
+SOLO_MAX_VALUE = 400  # largest value in a solo array, drawn VIZ_MAX_H tall
+
+# ── Array size caps ─────────────────────────────────────────────────────────
+# With NumPy installed, arrays with more bars than pixel columns are drawn by
+# the vectorized renderer and stay interactive far beyond the per-bar limits.
+# Override with the SOLO_MAX_BARS / ARENA_MAX_BARS environment variables.
+SOLO_MAX_BARS  = int(os.environ.get('SOLO_MAX_BARS',  100_000 if HAVE_NUMPY else 200))
+ARENA_MAX_BARS = int(os.environ.get('ARENA_MAX_BARS', 10_000 if HAVE_NUMPY else 100))
+
+# ── Solo trace size ─────────────────────────────────────────────────────────
+# Solo mode keeps every step in its trace so the run can be rewound, about
+# 42 bytes a step, so its runs are held to SOLO_MAX_TRACE_STEPS predicted
+# steps (~210 MB) even where the step budget allows more. The cost models
+# are for random inputs; a reversed one can take a few times as many steps.
+SOLO_MAX_TRACE_STEPS = int(os.environ.get('SOLO_MAX_TRACE_STEPS', 5_000_000))
+SOLO_STEP_BUDGET = min(STEP_BUDGET, SOLO_MAX_TRACE_STEPS) if STEP_BUDGET > 0 \
+    else SOLO_MAX_TRACE_STEPS
+
+# ── Arena-mode geometry ─────────────────────────────────────────────────────
+# The panes end above the counters' labels (y=355): widgets are only redrawn
+# when they change, so nothing may overlap the bars drawn every frame.
+ARENA_PANE1 = (50, 55, 400, 300)
+ARENA_PANE2 = (470, 55, 400, 300)
+ARENA_MAX_VALUE = 300  # largest value in an arena array, drawn full pane height
 
 # Game modes
 MODE_SELECTION = 0
@@ -52,13 +75,26 @@ SOLO_MODE = 1
 ARENA_MODE = 2
 LEADERBOARD_MODE = 3
 
-pygame.display.set_caption('Sorting Algorithms Visualizer')
-screen = pygame.display.set_mode((900, 500))
-
 # Global state
 game_mode = MODE_SELECTION
 solo_window = None
 arena_window = None
+# Leaderboard record to run again when solo mode opens (set by Re-run)
+pending_rerun = None
+
+
+def init_pygame():
+    """Initialize pygame, load the fonts and open the window."""
+    global baseFont, smallFont, titleFont, tinyFont, screen
+    pygame.init()
+    baseFont = pygame.font.SysFont('Arial', 24)
+    smallFont = pygame.font.SysFont('Arial', 18)
+    titleFont = pygame.font.SysFont('Arial', 36, bold=True)
+    # For the leaderboard table
+    tinyFont = pygame.font.SysFont('Arial', 14)
+    pygame.display.set_caption('Sorting Algorithms Visualizer')
+    screen = pygame.display.set_mode((900, 500))
+
 
 def init_solo_mode():
     """Initialize the solo mode window and widgets."""
@@ -70,13 +106,14 @@ def init_solo_mode():
         widget=TextBox((30, 440, 100, 50), 'Size', grey, baseFont, '100')
     )
     window.add_widget(
-        widget_id='delay_slider',
-        widget=SlideBox((140, 440, 150, 50), 'Delay', grey, baseFont)
+        widget_id='speed_slider',
+        widget=SlideBox((140, 440, 150, 50), 'Speed', grey, baseFont)
     )
+    window.set_widget_value('speed_slider', SPEED_SLIDER_DEFAULT)
     window.add_widget(
         widget_id='algorithm_input',
         widget=DropdownBox((300, 440, 200, 50), 'Algorithm', grey, baseFont,
-                           list(algorithmsDict.keys()), white)
+                           list(algorithmsDict.keys()), white, detail_font=tinyFont)
     )
     window.add_widget(
         widget_id='play_button',
@@ -124,11 +161,36 @@ def init_solo_mode():
         widget_id='step_fwd_btn',
         widget=StepButtonBox((2, 280, 40, 40), '▶', baseFont)
     )
+    # Skip to end  ⏭  (finishes the sort without drawing the steps)
+    window.add_widget(
+        'skip_label',
+        LabelBox((2, 325, 40, 15), 'End', grey, tinyFont)
+    )
+    window.add_widget(
+        widget_id='skip_btn',
+        widget=StepButtonBox((2, 340, 40, 40), '⏭', baseFont)
+    )
+
+    # ── Timeline (top strip): drag to seek to any recorded step ────────────
+    window.add_widget(
+        widget_id='timeline_slider',
+        widget=SlideBox((VIZ_X_OFFSET + 5, 4, 470, 26), '', grey, baseFont)
+    )
+    window.add_widget(
+        'timeline_label',
+        LabelBox((VIZ_X_OFFSET + 480, 4, 140, 26), '', grey, tinyFont)
+    )
+    # Input distribution of the next run
+    window.add_widget(
+        widget_id='input_dropdown',
+        widget=DropdownBox((VIZ_X_OFFSET + 625, 4, 145, 26), '', grey, smallFont,
+                           DISTRIBUTION_NAMES, white, direction='down')
+    )
 
     # ── Navigation ──────────────────────────────────────────────────────────
     window.add_widget(
         widget_id='back_button',
-        widget=LabelBox((820, 10, 70, 30), 'Back', white, smallFont, grey)
+        widget=LabelBox((820, 4, 70, 26), 'Back', white, smallFont, grey)
     )
 
     return window
@@ -136,6 +198,16 @@ def init_solo_mode():
 def init_arena_mode():
     """Initialize the arena mode window and widgets."""
     window = Window(screen)
+
+    # Names of the algorithms above their panes, set when a battle starts
+    window.add_widget(
+        widget_id='algo1_name',
+        widget=LabelBox((50, 33, 240, 22), '', dark_blue, smallFont, align='left')
+    )
+    window.add_widget(
+        widget_id='algo2_name',
+        widget=LabelBox((470, 33, 240, 22), '', dark_blue, smallFont, align='left')
+    )
     
     # Top controls - Size, Play, Back
     window.add_widget(
@@ -146,6 +218,10 @@ def init_arena_mode():
         widget_id='play_button',
         widget=ButtonBox((150, 10, 40, 40), 'res/playButton.png', 'res/stopButton.png')
     )
+    window.add_widget(
+        widget_id='skip_btn',
+        widget=StepButtonBox((200, 10, 40, 40), '⏭', baseFont)
+    )
     window.add_widget(
         widget_id='back_button',
         widget=LabelBox((820, 10, 70, 30), 'Back', white, smallFont, grey)
@@ -180,17 +256,26 @@ def init_arena_mode():
     # Algorithm selection dropdowns (below counters)
     window.add_widget(
         widget_id='algo1_dropdown',
-        widget=DropdownBox((50, 430, 180, 40), 'Algo 1', grey, smallFont, list(algorithmsDict.keys()), white)
+        widget=DropdownBox((50, 430, 180, 40), 'Algo 1', grey, smallFont, list(algorithmsDict.keys()), white,
+                           detail_font=tinyFont)
     )
     window.add_widget(
         widget_id='algo2_dropdown',
-        widget=DropdownBox((470, 430, 180, 40), 'Algo 2', grey, smallFont, list(algorithmsDict.keys()), white)
+        widget=DropdownBox((470, 430, 180, 40), 'Algo 2', grey, smallFont, list(algorithmsDict.keys()), white,
+                           detail_font=tinyFont)
     )
     
-    # Delay slider (bottom center)
+    # Speed slider (bottom center)
     window.add_widget(
-        widget_id='delay_slider',
-        widget=SlideBox((280, 430, 150, 40), 'Delay', grey, smallFont)
+        widget_id='speed_slider',
+        widget=SlideBox((280, 430, 150, 40), 'Speed', grey, smallFont)
+    )
+    window.set_widget_value('speed_slider', SPEED_SLIDER_DEFAULT)
+
+    # Input distribution shared by both competitors (bottom right)
+    window.add_widget(
+        widget_id='input_dropdown',
+        widget=DropdownBox((690, 430, 180, 40), 'Input', grey, smallFont, DISTRIBUTION_NAMES, white)
     )
     
     return window
@@ -222,64 +307,6 @@ def init_mode_selection():
 
     return window
 
-def _heat_color(heat_value, heat_threshold):
-    """
-    Return an RGB color on a green → orange → red gradient.
-
-    heat_value    : accumulated heat for this bar (float)
-    heat_threshold: value at which the bar is fully red
-    """
-    t = min(heat_value / max(heat_threshold, 1), 1.0)   # 0.0 … 1.0
-    if t < 0.5:
-        # green (0,200,80)  →  orange (255,140,0)
-        s = t * 2
-        r = int(0   + s * 255)
-        g = int(200 + s * (140 - 200))
-        b = int(80  + s * (0   - 80))
-    else:
-        # orange (255,140,0)  →  red (220,30,30)
-        s = (t - 0.5) * 2
-        r = int(255 + s * (220 - 255))
-        g = int(140 + s * (30  - 140))
-        b = int(0   + s * 30)
-    return (r, g, b)
-
-
-def drawBars(screen, array, redBar1, redBar2, blueBar1, blueBar2,
-             greenRows={}, x_offset=0, width=900, max_height=400, y_offset=0,
-             swap_heat=None, heat_threshold=100):
-    """Draw the bars and control their colors.
-
-    swap_heat      : optional list[float] of per-bar heat values (same length as array).
-                     When provided, bars not currently highlighted use a green→orange→red
-                     gradient instead of flat grey.
-    heat_threshold : heat value that maps to fully red (default 100).
-    """
-    numBars = len(array)
-    if numBars == 0:
-        return
-    
-    bar_width = width / numBars
-    ceil_width = math.ceil(bar_width)
-    
-    for num in range(numBars):
-        if num in (redBar1, redBar2):
-            color = red
-        elif num in (blueBar1, blueBar2):
-            color = blue
-        elif num in greenRows:
-            color = green
-        elif swap_heat is not None:
-            color = _heat_color(swap_heat[num], heat_threshold)
-        else:
-            color = grey
-        
-        x_pos = x_offset + num * bar_width
-        bar_height = array[num]
-        y_pos = y_offset + max_height - bar_height
-        
-        pygame.draw.rect(screen, color, (x_pos, y_pos, ceil_width, bar_height))
-
 def draw_dashed_line(screen, color, start_pos, end_pos, dash_length=5):
     """Draw a dashed line on the screen."""
     x1, y1 = start_pos
@@ -292,37 +319,44 @@ def draw_dashed_line(screen, color, start_pos, end_pos, dash_length=5):
         for x in range(x1, x2, dash_length * 2):
             pygame.draw.line(screen, color, (x, y1), (min(x + dash_length, x2), y1))
 
-def _make_snapshot(numbers, redBar1, redBar2, blueBar1, blueBar2,
-                   swap_heat, comparisons, swaps, elapsed_ms):
-    """Return a lightweight snapshot of the current visualizer state.
+def _read_size(window, cap, default):
+    """The array size typed into the window's size_input, clamped to 5..cap."""
+    try:
+        return max(5, min(cap, int(window.get_widget_value('size_input'))))
+    except ValueError:
+        return default
+
 
-    All mutable objects are deep-copied so the snapshot is independent of
-    any later mutations made to the live arrays.
+def _step_details(size, budget=None):
     """
-    return {
-        'numbers':    numbers[:],
-        'redBar1':    redBar1,
-        'redBar2':    redBar2,
-        'blueBar1':   blueBar1,
-        'blueBar2':   blueBar2,
-        'swap_heat':  swap_heat[:],
-        'comparisons': comparisons,
-        'swaps':      swaps,
-        'elapsed_ms': elapsed_ms,
-    }
-
-
-def _restore_snapshot(snap, numbers, swap_heat):
-    """Copy snapshot data back into the live state lists in-place.
-
-    Returns (redBar1, redBar2, blueBar1, blueBar2, comparisons, swaps, elapsed_ms).
+    The algorithm dropdowns' detail lines: the steps each listed algorithm
+    is expected to take on `size` elements, or the largest size within
+    `budget` (default: the step budget) when it would exceed it (Play
+    clamps to that size).
     """
-    numbers[:] = snap['numbers']
-    swap_heat[:] = snap['swap_heat']
-    return (snap['redBar1'], snap['redBar2'],
-            snap['blueBar1'], snap['blueBar2'],
-            snap['comparisons'], snap['swaps'],
-            snap['elapsed_ms'])
+    details = []
+    for name in algorithmsDict:
+        steps = expected_steps(name, size)
+        largest = max_size(name, budget)
+        if steps is None:
+            details.append(None)
+        elif largest is not None and size > largest:
+            details.append(f'over budget: n ≤ {largest:,}')
+        else:
+            details.append(f'~{format_steps(steps)} steps')
+    return details
+
+
+def _within_budget(size, names, budget=None):
+    """
+    `size`, or less if a run of any of `names` would exceed `budget`
+    (default: the step budget).
+    """
+    for name in names:
+        largest = max_size(name, budget)
+        if largest is not None:
+            size = min(size, max(5, largest))
+    return size
 
 
 def run_solo_mode():
@@ -333,149 +367,155 @@ def run_solo_mode():
     - Play/Stop  : existing ButtonBox – starts a fresh sort / cancels it.
     - Pause/Resume : ToggleButtonBox (⏸) – freezes auto-advance while keeping
                      the iterator alive so step controls still work.
-    - Step back  ◀ : restore the previous snapshot from history[].
+    - Step back  ◀ : undo the current frame.
                      Also bound to the LEFT arrow key.
-    - Step fwd   ▶ : advance one step (from future[] if available, else from
-                     the live iterator).
+    - Step fwd   ▶ : advance one step (replayed from the trace if we stepped
+                     back earlier, else pulled from the live iterator).
                      Also bound to the RIGHT arrow key.
+    - Timeline     : SlideBox along the top spanning every step recorded so
+                     far; dragging it seeks straight to that step.
+    - Speed        : logarithmic SlideBox from 1 step/s to millions of steps/s.
+                     Frames are capped at FRAME_RATE_CAP, so at high speeds
+                     many steps are taken per frame and only the last drawn.
+    - Skip to end ⏭ : runs the rest of the sort without drawing it.
 
     History system
     --------------
-    `history`  – list of snapshots already seen, newest at the end.
-    `future`   – list of snapshots that were stepped back over; newest at end.
-                 Stepping forward re-applies them without touching the iterator.
-                 Any auto-advance or step-fwd past the future tail consumes the
-                 live iterator and clears future[] (we are now at the head).
+    `recorder` – drives the algorithm and records every frame into a compact
+                 operation trace (see optrace): only the elements that changed
+                 are stored, so the whole run can be rewound.
+    `player`   – replays that trace; its array, highlights, counters and swap
+                 heat are what gets drawn. Stepping back undoes one frame's
+                 delta; stepping forward re-applies it, and only consumes the
+                 live iterator once the player has caught up with the recorder.
+                 player.seek() jumps to any recorded step by restoring the
+                 nearest keyframe and replaying at most one keyframe interval,
+                 with counters and swap heat restored exactly.
     """
-    global game_mode, solo_window
+    global game_mode, solo_window, pending_rerun
 
     if solo_window is None:
         solo_window = init_solo_mode()
 
     window = solo_window
+    bars = BarRenderer((VIZ_X_OFFSET, VIZ_Y_OFFSET, VIZ_WIDTH, VIZ_MAX_H),
+                       max_value=SOLO_MAX_VALUE)
+    display = ScreenUpdater()
+    # The screen was drawn by another mode since the window last rendered
+    window.invalidate()
 
     # ── Live sort state ──────────────────────────────────────────────────────
     numbers: list = []
     isSorting       = False
-    sortingIterator = None
-    last_iteration  = 0.0
-    sort_finished   = False   # True once StopIteration has been raised
+    recorder        = None    # TraceRecorder driving the algorithm
+    player          = None    # TracePlayer over recorder.trace
+    skipping        = False   # running to the end without drawing
+    pacer           = StepPacer()
+    clock           = pygame.time.Clock()
 
     # Elapsed-time tracking
     sort_start_time = 0.0
     elapsed_ms      = 0.0
     current_algorithm = ''
     current_numBars   = 0
+    # Canonical distribution spec and seed that regenerate the current input
+    current_input     = ''
+    current_seed      = None
 
-    # Swap-heat coloring
-    swap_heat:     list = []
+    # Swap-heat coloring (the heat values themselves live in player.heat)
     heat_threshold: float = 100.0
-    prev_swap_count: int  = 0
 
-    # Highlighted bar indices for the current frame
-    redBar1 = redBar2 = blueBar1 = blueBar2 = -1
-
-    # ── Snapshot history ─────────────────────────────────────────────────────
-    history: list = []   # snapshots already applied, oldest → newest
-    future:  list = []   # snapshots stepped back over, oldest → newest
+    # Array size the algorithm dropdown's expected steps are for
+    details_size = None
 
     # ── Internal helpers ─────────────────────────────────────────────────────
-    def _save_to_history():
-        """Append the current frame to history (capped at HISTORY_LIMIT)."""
-        snap = _make_snapshot(numbers, redBar1, redBar2, blueBar1, blueBar2,
-                              swap_heat, get_comparisons(), get_swaps(), elapsed_ms)
-        history.append(snap)
-        if len(history) > HISTORY_LIMIT:
-            history.pop(0)
-
     def _advance_one_step():
-        """Pull one frame from the live iterator (or return False if done)."""
-        nonlocal numbers, redBar1, redBar2, blueBar1, blueBar2
-        nonlocal elapsed_ms, prev_swap_count, sort_finished
-        try:
-            numbers, redBar1, redBar2, blueBar1, blueBar2 = next(sortingIterator)
-            # Update elapsed time (wall-clock minus pause time is not tracked
-            # separately; we accumulate only while actually advancing)
-            elapsed_ms = (time.time() - sort_start_time) * 1000
-            # Accumulate swap heat for the two active bars
-            cur_swaps = get_swaps()
-            new_swaps = cur_swaps - prev_swap_count
-            if new_swaps > 0:
-                for bar_idx in (redBar1, redBar2):
-                    if 0 <= bar_idx < len(swap_heat):
-                        swap_heat[bar_idx] += new_swaps
-            prev_swap_count = cur_swaps
-            return True
-        except StopIteration:
-            sort_finished = True
-            return False
+        """Show the next frame (or return False if the run is over).
+
+        Frames already recorded are replayed from the trace; at the head the
+        recorder pulls a new frame from the live iterator first.
+        """
+        nonlocal elapsed_ms
+        if player.position == len(player.trace):
+            if recorder.finished:
+                return False
+            recorder.step()
+        player.step_forward()
+        elapsed_ms = player.elapsed_ms
+        return True
 
     def _update_counters():
         """Push current counter values to the UI widgets."""
-        window.set_widget_value('comparisons_counter', get_comparisons())
-        window.set_widget_value('swaps_counter',       get_swaps())
+        window.set_widget_value('comparisons_counter', player.comparisons)
+        window.set_widget_value('swaps_counter',       player.swaps)
         window.set_widget_value('elapsed_counter',     f'{elapsed_ms / 1000:.3f}')
 
+    def _update_timeline():
+        """Move the timeline knob and label to the player's position."""
+        recorded = len(player.trace)
+        more = '' if recorder.finished else '+'
+        window.set_widget_value('timeline_label', f'{player.position:,} / {recorded:,}{more}')
+        if not window.widgets['timeline_slider'].dragging:
+            window.set_widget_value('timeline_slider',
+                                    player.position / recorded if recorded else 0.0)
+
+    def _do_seek(fraction):
+        """Jump to the recorded step at `fraction` (0..1) of the timeline."""
+        nonlocal elapsed_ms
+        player.seek(round(fraction * len(player.trace)))
+        elapsed_ms = player.elapsed_ms
+        _update_counters()
+
     def _update_step_button_states(is_active):
         """Enable/disable the step buttons depending on whether a sort is active."""
         window.widgets['step_back_btn'].disabled = not is_active
         window.widgets['step_fwd_btn'].disabled  = not is_active
         window.widgets['pause_btn'].disabled     = not is_active
+        window.widgets['skip_btn'].disabled      = not is_active
 
     def _do_step_back():
-        """Restore the previous snapshot. Returns True if successful."""
-        nonlocal redBar1, redBar2, blueBar1, blueBar2, elapsed_ms, prev_swap_count
-        if not history:
+        """Undo the current frame. Returns True if successful."""
+        nonlocal elapsed_ms
+        if not player.step_back():
             return False
-        # Save current state to future before going back
-        future.append(_make_snapshot(numbers, redBar1, redBar2, blueBar1, blueBar2,
-                                     swap_heat, get_comparisons(), get_swaps(), elapsed_ms))
-        snap = history.pop()
-        redBar1, redBar2, blueBar1, blueBar2, comps, swps, elapsed_ms = \
-            _restore_snapshot(snap, numbers, swap_heat)
-        # Restore the global counters to the snapshot values
-        reset_counters()
-        # Manually set counters to snapshot values via repeated increment would
-        # be slow; instead we patch the private globals directly through the
-        # counters module's public API by resetting and then bulk-adding.
-        import counters as _c
-        _c._comparisons = comps
-        _c._swaps = swps
-        prev_swap_count = swps
+        elapsed_ms = player.elapsed_ms
         _update_counters()
         return True
 
     def _do_step_fwd():
-        """Advance one step, replaying from future[] if available."""
-        nonlocal redBar1, redBar2, blueBar1, blueBar2, elapsed_ms, prev_swap_count
-        if sort_finished and not future:
-            return False
-        # Save current state to history before advancing
-        _save_to_history()
-        if future:
-            # Replay a cached future snapshot (no iterator call needed)
-            snap = future.pop()
-            redBar1, redBar2, blueBar1, blueBar2, comps, swps, elapsed_ms = \
-                _restore_snapshot(snap, numbers, swap_heat)
-            import counters as _c
-            _c._comparisons = comps
-            _c._swaps = swps
-            prev_swap_count = swps
-            _update_counters()
-            return True
-        else:
-            # At the head — consume the live iterator
-            ok = _advance_one_step()
-            _update_counters()
-            return ok
+        """Advance one step, replaying from the trace when behind the head."""
+        ok = _advance_one_step()
+        _update_counters()
+        return ok
+
+    def _finish_sort():
+        """Record the completed run and reset the controls."""
+        nonlocal isSorting, skipping, elapsed_ms
+        elapsed_ms = (time.time() - sort_start_time) * 1000
+        window.set_widget_value('elapsed_counter', f'{elapsed_ms / 1000:.3f}')
+        # Written by the database's writer thread, so the frame does not wait
+        save_record_async(
+            algorithm=current_algorithm,
+            array_size=current_numBars,
+            swaps=recorder.trace.swaps,
+            comparisons=recorder.trace.comparisons,
+            elapsed_ms=elapsed_ms,
+            seed=current_seed,
+            distribution=current_input,
+        ).add_done_callback(_report_failed_save)
+        isSorting = False
+        skipping  = False
+        window.set_widget_value('play_button', False)
+        window.set_widget_value('pause_btn',   False)
+        _update_step_button_states(False)
+        # The draw loop only moves the timeline while sorting: show the end
+        _update_timeline()
 
     # ── Disable step controls until a sort starts ────────────────────────────
     _update_step_button_states(False)
 
     running_solo = True
     while running_solo:
-        screen.fill(white)
-
         # ── Collect keyboard events before widget update ─────────────────────
         step_back_key = False
         step_fwd_key  = False
@@ -494,52 +534,80 @@ def run_solo_mode():
 
             # Back button
             if event.type == pygame.MOUSEBUTTONDOWN:
-                if pygame.Rect(820, 10, 70, 30).collidepoint(pygame.mouse.get_pos()):
+                if window.widgets['back_button'].rect.collidepoint(pygame.mouse.get_pos()):
                     game_mode = MODE_SELECTION
                     return True
 
+        # ── Re-run of a leaderboard record: same algorithm, input and seed ───
+        rerun = pending_rerun
+        pending_rerun = None
+        if rerun:
+            window.set_widget_value('size_input', str(rerun['array_size']))
+            if rerun['algorithm'] in algorithmsDict:
+                window.set_widget_value('algorithm_input',
+                                        list(algorithmsDict).index(rerun['algorithm']))
+            name = rerun['distribution'].split(':')[0]
+            if name in DISTRIBUTION_NAMES:
+                window.set_widget_value('input_dropdown', DISTRIBUTION_NAMES.index(name))
+            window.set_widget_value('play_button', True)
+            isSorting = False
+
         # ── Read widget states ───────────────────────────────────────────────
-        delay     = window.get_widget_value('delay_slider') / 10
+        rate      = steps_per_second(window.get_widget_value('speed_slider'))
+        window.widgets['speed_slider'].label = f'Speed {format_rate(rate)}/s'
         isPlaying = window.get_widget_value('play_button')
         isPaused  = window.get_widget_value('pause_btn')
 
+        size = _read_size(window, SOLO_MAX_BARS, 100)
+        if size != details_size:
+            window.widgets['algorithm_input'].set_details(_step_details(size, SOLO_STEP_BUDGET))
+            details_size = size
+
         # Update pause label text to reflect state
         window.set_widget_value('pause_label', 'Run' if isPaused else 'Pause')
 
         # ── Start a new sort when Play is pressed ────────────────────────────
         if isPlaying and not isSorting:
-            reset_counters()
             window.set_widget_value('comparisons_counter', 0)
             window.set_widget_value('swaps_counter',       0)
             window.set_widget_value('elapsed_counter',     '0.000')
             elapsed_ms    = 0.0
-            sort_finished = False
-
-            # Clamp array size
-            try:
-                current_numBars = int(window.get_widget_value('size_input'))
-                current_numBars = max(5, min(200, current_numBars))
-            except ValueError:
-                current_numBars = 100
 
-            numbers = [randint(10, 400) for _ in range(current_numBars)]
-
-            current_algorithm = window.get_widget_value('algorithm_input')
-            sortingIterator   = algorithmsDict[current_algorithm](
-                numbers, 0, current_numBars - 1)
+            current_numBars = _read_size(window, SOLO_MAX_BARS, 100)
+
+            if rerun:
+                current_numBars   = rerun['array_size']
+                current_algorithm = rerun['algorithm']
+                current_input     = rerun['distribution']
+                current_seed      = rerun['seed']
+            else:
+                current_algorithm = window.get_widget_value('algorithm_input')
+                # A re-run is known to finish; a new run must fit the step
+                # budget and its trace in memory
+                allowed = _within_budget(current_numBars, [current_algorithm], SOLO_STEP_BUDGET)
+                if allowed < current_numBars:
+                    current_numBars = allowed
+                    window.set_widget_value('size_input', str(allowed))
+                current_input = canonical(window.get_widget_value('input_dropdown'),
+                                          current_numBars, high=SOLO_MAX_VALUE)
+                current_seed  = randrange(2 ** 32)
+            recorder = TraceRecorder(seeded(allAlgorithmsDict[current_algorithm], current_seed),
+                                     make_input(current_input, current_numBars, current_seed),
+                                     0, current_numBars - 1)
+            player  = TracePlayer(recorder.trace, heat=True)
+            numbers = player.array
+            # The spec of a re-run record may set a higher 'high' than the solo inputs
+            max_value = max(SOLO_MAX_VALUE, parse_spec(current_input)[1]['high'])
+            bars = make_bar_renderer((VIZ_X_OFFSET, VIZ_Y_OFFSET, VIZ_WIDTH, VIZ_MAX_H),
+                                     current_numBars, max_value=max_value)
 
             isSorting       = True
+            skipping        = False
             sort_start_time = time.time()
-            redBar1 = redBar2 = blueBar1 = blueBar2 = -1
+            pacer.reset()
 
-            # Reset swap-heat (1.5× size → fully red threshold)
-            swap_heat       = [0.0] * current_numBars
+            # Swap heat starts at zero in the player (1.5× size → fully red threshold)
             heat_threshold  = max(current_numBars * 1.5, 1)
-            prev_swap_count = 0
-
-            # Clear history / future for the new run
-            history.clear()
-            future.clear()
 
             # Reset pause toggle if it was left on
             window.set_widget_value('pause_btn', False)
@@ -549,8 +617,13 @@ def run_solo_mode():
         # ── Stop clears the sort ─────────────────────────────────────────────
         if not isPlaying:
             isSorting = False
+            skipping  = False
             _update_step_button_states(False)
 
+        # ── Skip to end ──────────────────────────────────────────────────────
+        if isSorting and window.get_widget_value('skip_btn'):
+            skipping = True
+
         # ── Step-back (button OR left-arrow key) ─────────────────────────────
         if isSorting and (window.get_widget_value('step_back_btn') or step_back_key):
             _do_step_back()
@@ -565,66 +638,53 @@ def run_solo_mode():
             if not isPaused:
                 window.set_widget_value('pause_btn', True)
                 isPaused = True
-            if not advanced and not future:
+            if not advanced:
                 # Reached the end via manual stepping — save to DB
-                elapsed_ms = (time.time() - sort_start_time) * 1000
-                window.set_widget_value('elapsed_counter', f'{elapsed_ms / 1000:.3f}')
-                save_record(
-                    algorithm=current_algorithm,
-                    array_size=current_numBars,
-                    swaps=get_swaps(),
-                    comparisons=get_comparisons(),
-                    elapsed_ms=elapsed_ms,
-                )
-                isSorting = False
-                window.set_widget_value('play_button', False)
-                window.set_widget_value('pause_btn',   False)
-                _update_step_button_states(False)
+                _finish_sort()
+
+        # ── Timeline scrubbing ───────────────────────────────────────────────
+        if isSorting and not skipping and window.widgets['timeline_slider'].dragging:
+            _do_seek(window.get_widget_value('timeline_slider'))
+            if not isPaused:
+                window.set_widget_value('pause_btn', True)
+                isPaused = True
 
         # ── Auto-advance when playing and not paused ─────────────────────────
-        if isSorting and not isPaused:
+        # Take every step due at the current speed (or, when skipping, as many
+        # as fit in SKIP_FRAME_BUDGET) and draw only the state after the last
+        if isSorting and (skipping or not isPaused):
             try:
-                if time.time() - last_iteration >= delay:
-                    # Save snapshot before advancing so we can step back to it
-                    _save_to_history()
-                    # Any auto-advance invalidates the cached future
-                    future.clear()
-                    advanced = _advance_one_step()
-                    last_iteration = time.time()
-                    _update_counters()
-
-                    if not advanced:
-                        # Sort completed naturally
-                        elapsed_ms = (time.time() - sort_start_time) * 1000
-                        window.set_widget_value('elapsed_counter', f'{elapsed_ms / 1000:.3f}')
-                        save_record(
-                            algorithm=current_algorithm,
-                            array_size=current_numBars,
-                            swaps=get_swaps(),
-                            comparisons=get_comparisons(),
-                            elapsed_ms=elapsed_ms,
-                        )
-                        isSorting = False
-                        window.set_widget_value('play_button', False)
-                        window.set_widget_value('pause_btn',   False)
-                        _update_step_button_states(False)
+                if skipping:
+                    advanced = run_steps(_advance_one_step, sys.maxsize, SKIP_FRAME_BUDGET)
+                else:
+                    advanced = run_steps(_advance_one_step, pacer.steps_due(rate),
+                                         FRAME_WORK_BUDGET)
+                _update_counters()
+
+                if not advanced:
+                    # Sort completed naturally
+                    _finish_sort()
             except Exception:
                 pass   # guard against any unexpected iterator error
 
         # ── Draw ─────────────────────────────────────────────────────────────
+        # Only the bars and widgets that changed are repainted and pushed to
+        # the display; while skipping to the end the bars are left as they were
+        full = window.needs_full_redraw()
+        if full:
+            screen.fill(white)
         if isSorting:
-            drawBars(screen, numbers, redBar1, redBar2, blueBar1, blueBar2,
-                     x_offset=VIZ_X_OFFSET, width=VIZ_WIDTH,
-                     max_height=VIZ_MAX_H,  y_offset=VIZ_Y_OFFSET,
-                     swap_heat=swap_heat, heat_threshold=heat_threshold)
+            _update_timeline()
+            bar_rects = [] if skipping else bars.draw(
+                *player.frame(), swap_heat=player.heat, heat_threshold=heat_threshold,
+                changed=player.take_changes())
         else:
-            drawBars(screen, numbers, -1, -1, -1, -1,
-                     x_offset=VIZ_X_OFFSET, width=VIZ_WIDTH,
-                     max_height=VIZ_MAX_H,  y_offset=VIZ_Y_OFFSET,
-                     greenRows=set(range(len(numbers))))
+            bar_rects = bars.draw(numbers, -1, -1, -1, -1, finished=True)
+        bars.blit(screen)
 
-        window.render()
-        pygame.display.update()
+        ui_rects = window.render(full)
+        display.present(bar_rects + ui_rects, full=full)
+        clock.tick(FRAME_RATE_CAP)
 
 def run_arena_mode():
     """Run the arena mode game loop."""
@@ -634,6 +694,11 @@ def run_arena_mode():
         arena_window = init_arena_mode()
     
     window = arena_window
+    bars1 = BarRenderer(ARENA_PANE1)
+    bars2 = BarRenderer(ARENA_PANE2)
+    display = ScreenUpdater()
+    # The screen was drawn by another mode since the window last rendered
+    window.invalidate()
     array1 = []
     array2 = []
     original_array = []
@@ -641,15 +706,51 @@ def run_arena_mode():
     isSorting = False
     iterator1 = None
     iterator2 = None
-    last_iteration = 0
     algo1_finished = False
     algo2_finished = False
     winner = None
+    counter1 = Counter('algo1')
+    counter2 = Counter('algo2')
+    skipping = False    # running both sorts to the end without drawing
+    pacer = StepPacer()
+    clock = pygame.time.Clock()
+    details_size = None     # array size the dropdowns' expected steps are for
+    
+    def _step_both():
+        """Advance each unfinished algorithm by one step; False once both are done."""
+        nonlocal array1, array2, algo1_finished, algo2_finished, winner
+        # Step algorithm 1
+        if not algo1_finished:
+            token = set_counter(counter1)
+            try:
+                array1, red1, red2, blue1, blue2 = next(iterator1)
+            except StopIteration:
+                algo1_finished = True
+                if winner is None:
+                    winner = window.get_widget_value('algo1_dropdown') + ' WINS!'
+                    window.set_widget_value('winner_label', winner)
+            finally:
+                reset_counter(token)
+        
+        # Step algorithm 2
+        if not algo2_finished:
+            token = set_counter(counter2)
+            try:
+                array2, red1, red2, blue1, blue2 = next(iterator2)
+            except StopIteration:
+                algo2_finished = True
+                if winner is None:
+                    winner = window.get_widget_value('algo2_dropdown') + ' WINS!'
+                    window.set_widget_value('winner_label', winner)
+            finally:
+                reset_counter(token)
+        
+        return not (algo1_finished and algo2_finished)
+    
+    window.widgets['skip_btn'].disabled = True
     
     running_arena = True
     while running_arena:
-        screen.fill(white)
-        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
@@ -664,132 +765,117 @@ def run_arena_mode():
                     game_mode = MODE_SELECTION
                     return True
         
-        # Get delay in seconds
-        delay = window.get_widget_value('delay_slider') / 10
+        # Steps per second from the logarithmic speed slider
+        rate = steps_per_second(window.get_widget_value('speed_slider'))
+        window.widgets['speed_slider'].label = f'Speed {format_rate(rate)}/s'
         
+        size = _read_size(window, ARENA_MAX_BARS, 50)
+        if size != details_size:
+            details = _step_details(size)
+            window.widgets['algo1_dropdown'].set_details(details)
+            window.widgets['algo2_dropdown'].set_details(details)
+            details_size = size
+
         isPlaying = window.get_widget_value('play_button')
         if isPlaying and not isSorting:
             # Reset everything for new battle
-            reset_counters('algo1')
-            reset_counters('algo2')
+            counter1.reset()
+            counter2.reset()
             window.set_widget_value('algo1_comparisons', 0)
             window.set_widget_value('algo1_swaps', 0)
             window.set_widget_value('algo2_comparisons', 0)
             window.set_widget_value('algo2_swaps', 0)
             window.set_widget_value('winner_label', '')
+            window.set_widget_value('algo1_name', window.get_widget_value('algo1_dropdown'))
+            window.set_widget_value('algo2_name', window.get_widget_value('algo2_dropdown'))
             
-            # Generate shared random array
-            try:
-                numBars = int(window.get_widget_value('size_input'))
-                if numBars < 5:
-                    numBars = 5
-                elif numBars > 100:
-                    numBars = 100
-            except ValueError:
-                numBars = 50
-            original_array = [randint(10, 300) for i in range(numBars)]
+            # Generate the shared input array, small enough for both algorithms
+            numBars = _read_size(window, ARENA_MAX_BARS, 50)
+            allowed = _within_budget(numBars, [window.get_widget_value('algo1_dropdown'),
+                                               window.get_widget_value('algo2_dropdown')])
+            if allowed < numBars:
+                numBars = allowed
+                window.set_widget_value('size_input', str(allowed))
+            arena_input = canonical(window.get_widget_value('input_dropdown'),
+                                    numBars, high=ARENA_MAX_VALUE)
+            arena_seed = randrange(2 ** 32)
+            original_array = make_input(arena_input, numBars, arena_seed)
             array1 = original_array.copy()
             array2 = original_array.copy()
+            bars1 = make_bar_renderer(ARENA_PANE1, numBars)
+            bars2 = make_bar_renderer(ARENA_PANE2, numBars)
             
             # Initialize both sorting iterators
             algo1_name = window.get_widget_value('algo1_dropdown')
             algo2_name = window.get_widget_value('algo2_dropdown')
             
-            iterator1 = algorithmsDict[algo1_name](array1, 0, numBars - 1)
-            iterator2 = algorithmsDict[algo2_name](array2, 0, numBars - 1)
+            iterator1 = seeded(algorithmsDict[algo1_name], arena_seed)(array1, 0, numBars - 1)
+            iterator2 = seeded(algorithmsDict[algo2_name], arena_seed)(array2, 0, numBars - 1)
             
             isSorting = True
+            skipping = False
             algo1_finished = False
             algo2_finished = False
             winner = None
+            pacer.reset()
+            window.widgets['skip_btn'].disabled = False
         
         if not isPlaying:
             isSorting = False
+            skipping = False
+            window.widgets['skip_btn'].disabled = True
+        
+        if isSorting and window.get_widget_value('skip_btn'):
+            skipping = True
         
         if isSorting:
-            should_update = time.time() - last_iteration >= delay
-            
-            if should_update:
-                last_iteration = time.time()
-                
-                # Step algorithm 1
-                if not algo1_finished:
-                    try:
-                        set_current_instance('algo1')
-                        array1, red1, red2, blue1, blue2 = next(iterator1)
-                        window.set_widget_value('algo1_comparisons', get_comparisons('algo1'))
-                        window.set_widget_value('algo1_swaps', get_swaps('algo1'))
-                    except StopIteration:
-                        algo1_finished = True
-                        if winner is None:
-                            winner = window.get_widget_value('algo1_dropdown') + ' WINS!'
-                            window.set_widget_value('winner_label', winner)
-                
-                # Step algorithm 2
-                if not algo2_finished:
-                    try:
-                        set_current_instance('algo2')
-                        array2, red1, red2, blue1, blue2 = next(iterator2)
-                        window.set_widget_value('algo2_comparisons', get_comparisons('algo2'))
-                        window.set_widget_value('algo2_swaps', get_swaps('algo2'))
-                    except StopIteration:
-                        algo2_finished = True
-                        if winner is None:
-                            winner = window.get_widget_value('algo2_dropdown') + ' WINS!'
-                            window.set_widget_value('winner_label', winner)
-                
-                # Reset current instance
-                set_current_instance(None)
-                
-                # Both finished
-                if algo1_finished and algo2_finished:
-                    isSorting = False
-                    window.set_widget_value('play_button', False)
-            
-            # Draw both visualizations
-            # Left side - Algorithm 1
-            drawBars(screen, array1, -1, -1, -1, -1, greenRows=set(range(len(array1))) if algo1_finished else {},
-                     x_offset=50, width=400, max_height=320, y_offset=50)
+            # Take every step due at the current speed (or, when skipping, as
+            # many as fit in SKIP_FRAME_BUDGET); only the last state is drawn
+            if skipping:
+                running = run_steps(_step_both, sys.maxsize, SKIP_FRAME_BUDGET)
+            else:
+                running = run_steps(_step_both, pacer.steps_due(rate), FRAME_WORK_BUDGET)
+            window.set_widget_value('algo1_comparisons', counter1.comparisons)
+            window.set_widget_value('algo1_swaps', counter1.swaps)
+            window.set_widget_value('algo2_comparisons', counter2.comparisons)
+            window.set_widget_value('algo2_swaps', counter2.swaps)
             
-            # Right side - Algorithm 2
-            drawBars(screen, array2, -1, -1, -1, -1, greenRows=set(range(len(array2))) if algo2_finished else {},
-                     x_offset=470, width=400, max_height=320, y_offset=50)
-            
-            # Draw divider
-            draw_dashed_line(screen, grey, (450, 50), (450, 370))
-            
-            # Draw algorithm names above visualizations
-            label1 = smallFont.render(window.get_widget_value('algo1_dropdown'), True, dark_blue)
-            screen.blit(label1, (50, 35))
-            label2 = smallFont.render(window.get_widget_value('algo2_dropdown'), True, dark_blue)
-            screen.blit(label2, (470, 35))
-            
-            window.render()
-            pygame.display.update()
+            # Both finished
+            if not running:
+                isSorting = False
+                skipping = False
+                window.set_widget_value('play_button', False)
+                window.widgets['skip_btn'].disabled = True
             
+        # Draw both visualizations; each pane repaints only the bars that
+        # changed, found by comparing against what it drew last frame, and the
+        # window only the widgets that changed. While skipping to the end the
+        # bars are left as they were.
+        full = window.needs_full_redraw()
+        if full:
+            screen.fill(white)
+            draw_dashed_line(screen, grey, (450, 55), (450, 355))
+        if skipping:
+            bar_rects = []
         else:
-            # Draw static arrays when not sorting
-            drawBars(screen, array1, -1, -1, -1, -1, greenRows=set(range(len(array1))),
-                     x_offset=50, width=400, max_height=320, y_offset=50)
-            drawBars(screen, array2, -1, -1, -1, -1, greenRows=set(range(len(array2))),
-                     x_offset=470, width=400, max_height=320, y_offset=50)
-            
-            draw_dashed_line(screen, grey, (450, 50), (450, 370))
-            
-            if array1:
-                label1 = smallFont.render(window.get_widget_value('algo1_dropdown'), True, dark_blue)
-                screen.blit(label1, (50, 35))
-            if array2:
-                label2 = smallFont.render(window.get_widget_value('algo2_dropdown'), True, dark_blue)
-                screen.blit(label2, (470, 35))
-            
-            window.render()
-            pygame.display.update()
+            finished1 = algo1_finished or not isSorting
+            finished2 = algo2_finished or not isSorting
+            bar_rects = bars1.draw(array1, -1, -1, -1, -1, finished=finished1)
+            bar_rects += bars2.draw(array2, -1, -1, -1, -1, finished=finished2)
+        bars1.blit(screen)
+        bars2.blit(screen)
+
+        ui_rects = window.render(full)
+        display.present(bar_rects + ui_rects, full=full)
+        clock.tick(FRAME_RATE_CAP)
 
 # ---------------------------------------------------------------------------
 # Leaderboard helpers
 # ---------------------------------------------------------------------------
 
+# Export format button label -> database export format
+_EXPORT_FORMATS = {'CSV': 'csv', 'CSV.gz': 'csv.gz', 'JSONL': 'jsonl'}
+
 # Maps the display label shown in the sort-by dropdown to the DB column name
 _SORT_FIELD_MAP = {
     'Time (s)':     'elapsed_ms',
@@ -802,6 +888,15 @@ _SORT_FIELD_MAP = {
 
 _SORT_FIELDS = list(_SORT_FIELD_MAP.keys())
 
+# The same labels in the Stats view, which sorts the groups by their means
+_STATS_SORT_FIELD_MAP = {
+    'Time (s)':     'elapsed_ms_mean',
+    'Swaps':        'swaps_mean',
+    'Comparisons':  'comparisons_mean',
+    'Array Size':   'array_size',
+    'Algorithm':    'algorithm',
+}
+
 
 def _build_leaderboard_window():
     """Create and return the leaderboard Window with all its widgets."""
@@ -849,10 +944,16 @@ def _build_leaderboard_window():
         LabelBox((545, 45, 80, 30), '⟳ Refresh', white, smallFont, (80, 130, 200))
     )
 
-    # Export CSV button
+    # Export button (turns into Cancel while an export runs)
     window.add_widget(
         'export_btn',
-        LabelBox((635, 45, 90, 30), '⬇ Export CSV', white, smallFont, (60, 160, 80))
+        LabelBox((635, 45, 90, 30), '⬇ Export', white, smallFont, (60, 160, 80))
+    )
+
+    # Export file format; clicking it cycles through _EXPORT_FORMATS
+    window.add_widget(
+        'export_format',
+        LabelBox((110, 8, 90, 28), 'CSV', white, smallFont, (90, 140, 90))
     )
 
     # Export status message (shown briefly after export)
@@ -867,24 +968,52 @@ def _build_leaderboard_window():
         LabelBox((820, 10, 70, 30), 'Back', white, smallFont, grey)
     )
 
+    # Re-run button: replays the selected record in solo mode
+    window.add_widget(
+        'rerun_btn',
+        LabelBox((10, 8, 90, 28), '▶ Re-run', white, smallFont, (200, 120, 40))
+    )
+
+    # Stats toggle: one row per algorithm, size and input instead of per run
+    window.add_widget(
+        'stats_view',
+        ToggleButtonBox((210, 8, 80, 28), 'Stats', smallFont,
+                        color_off=(130, 130, 130), color_on=(50, 150, 80))
+    )
+
     # Record count label
     window.add_widget(
         'record_count',
         LabelBox((730, 45, 160, 30), '', grey, smallFont)
     )
 
-    # --- Table (y=85, fills the rest of the screen) ---
-    table_rect = (0, 85, 900, 415)
+    # --- Table (y=85, down to the growth line) ---
+    table_rect = (0, 85, 900, 387)
     window.add_widget(
         'lb_table',
         LeaderboardTable(table_rect, tinyFont, smallFont)
     )
 
+    # Fitted growth curves of the filtered algorithm (see complexity.py)
+    window.add_widget(
+        'growth_label',
+        LabelBox((0, 472, 900, 28), '', dark_blue, tinyFont)
+    )
+
     return window
 
 
+def _report_failed_save(future):
+    """Done-callback of save_record_async(): a lost record should not go unnoticed."""
+    if future.exception() is not None:
+        print(f'Could not save the run to the leaderboard: {future.exception()}',
+              file=sys.stderr)
+
+
 def _refresh_leaderboard(window):
     """Read DB and push fresh records into the table widget."""
+    # Include the runs the writer thread has not stored yet
+    flush_writes(timeout=1.0)
     # Rebuild algorithm filter list from DB
     algos_in_db = get_algorithms()
     filter_options = ['All'] + algos_in_db
@@ -904,20 +1033,58 @@ def _refresh_leaderboard(window):
 
     sort_asc = window.get_widget_value('sort_asc')  # True = ASC toggle active
 
-    records = get_records(
-        filter_algorithm=selected_algo,
-        sort_by=sort_col,
-        sort_asc=sort_asc,
-    )
-    window.widgets['lb_table'].set_records(records)
-    window.set_widget_value(
-        'record_count',
-        f'{len(records)} record{"s" if len(records) != 1 else ""}'
-    )
-
-
-def _do_export(lb_window):
-    """Export current view to CSV and update the status label."""
+    # Swap in the table of the chosen view
+    stats_view = window.get_widget_value('stats_view')
+    table = window.widgets['lb_table']
+    if isinstance(table, StatsTable) != stats_view:
+        table = (StatsTable if stats_view else LeaderboardTable)(table.rect, tinyFont, smallFont)
+        window.widgets['lb_table'] = table
+
+    if stats_view:
+        groups = get_stats(
+            filter_algorithm=selected_algo,
+            sort_by=_STATS_SORT_FIELD_MAP.get(sort_label, 'elapsed_ms_mean'),
+            sort_asc=sort_asc,
+        )
+        table.set_records(groups)
+        window.set_widget_value(
+            'record_count',
+            f'{len(groups):,} group{"s" if len(groups) != 1 else ""}'
+        )
+    else:
+        # Rows are read page by page as the table scrolls
+        records = RecordQuery(
+            filter_algorithm=selected_algo,
+            sort_by=sort_col,
+            sort_asc=sort_asc,
+        )
+        table.set_records(records)
+        window.set_widget_value(
+            'record_count',
+            f'{len(records):,} record{"s" if len(records) != 1 else ""}'
+        )
+    window.set_widget_value('growth_label', _growth_text(selected_algo))
+
+
+def _growth_text(algorithm):
+    """One line with the complexity models fitted to an algorithm's random-input runs."""
+    if algorithm == 'All':
+        return 'Filter by an algorithm to see its measured growth'
+    measurements = get_measurements(algorithm)
+    comparisons, runs = fit_measurements(measurements, 'comparisons')
+    swaps, _ = fit_measurements(measurements, 'swaps')
+    if comparisons is None and swaps is None:
+        return (f'Growth: needs random-input runs at 3+ sizes '
+                f'(python -m sweep {algorithm} -d random)')
+    sizes = [row[0] for row in measurements]
+    parts = [f'{name} {describe(fit) if fit else "–"}'
+             for name, fit in (('comparisons', comparisons), ('swaps', swaps))]
+    return (f'Growth on random input, {runs} runs, n = {min(sizes)}–{max(sizes)}:  '
+            + '   '.join(parts))
+
+
+def _start_export(lb_window):
+    """Start exporting the current view on a background thread; returns the ExportJob."""
     filter_widget = lb_window.widgets['filter_algo']
     selected_algo = filter_widget.options[filter_widget.selected_option]
 
@@ -929,25 +1096,67 @@ def _do_export(lb_window):
     # Save next to the DB file, in the src/ directory
     import datetime
     timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f'leaderboard_{timestamp}.csv'
+    fmt      = _EXPORT_FORMATS[lb_window.get_widget_value('export_format')]
+    filename = f'leaderboard_{timestamp}.{fmt}'
     out_dir  = os.path.dirname(os.path.abspath(__file__))
     out_path = os.path.join(out_dir, filename)
 
-    try:
-        n = export_csv(out_path,
-                       filter_algorithm=selected_algo,
-                       sort_by=sort_col,
-                       sort_asc=sort_asc)
-        lb_window.set_widget_value('export_status', f'Saved {n} rows to {filename} ✓')
-    except Exception as exc:
-        lb_window.set_widget_value('export_status', f'Error: {exc}')
+    lb_window.set_widget_value('export_btn', '✕ Cancel')
+    lb_window.set_widget_value('export_status', 'Exporting…')
+    return ExportJob(out_path,
+                     filter_algorithm=selected_algo,
+                     sort_by=sort_col,
+                     sort_asc=sort_asc,
+                     fmt=fmt)
+
+
+def _export_status(lb_window, job):
+    """Show the progress of `job`, or its outcome once done; True when done."""
+    if not job.done():
+        if job.total:
+            lb_window.set_widget_value(
+                'export_status',
+                f'Exporting… {job.written:,} / {job.total:,} ({job.written / job.total:.0%})')
+        return False
+    filename = os.path.basename(job.filepath)
+    if job.error is not None:
+        message = f'Error: {job.error}'
+    elif job.result is None:
+        message = 'Export cancelled'
+    else:
+        message = f'Saved {job.result:,} rows to {filename} ✓'
+    lb_window.set_widget_value('export_status', message)
+    lb_window.set_widget_value('export_btn', '⬇ Export')
+    return True
+
 
-    return time.time()   # caller stores this to clear the label later
+def _rerun_selected(lb_window):
+    """
+    Return the selected record if it can be re-run in solo mode, else None.
+
+    A record can be re-run when it was saved with a seed (older rows were
+    not), its array fits on the solo screen and its steps in a solo trace
+    (SOLO_MAX_TRACE_STEPS); otherwise the reason is shown in the status
+    label.
+    """
+    record = lb_window.widgets['lb_table'].get_selected()
+    if record is None:
+        message = 'Select a row to re-run first'
+    elif record.get('seed') is None or not record['distribution']:
+        message = 'This record has no seed to re-run'
+    elif record['array_size'] > SOLO_MAX_BARS:
+        message = f"Too large to draw; try python -m benchmark --record {record['id']}"
+    elif record['comparisons'] + record['swaps'] > SOLO_MAX_TRACE_STEPS:
+        message = f"Too long to rewind; try python -m benchmark --record {record['id']}"
+    else:
+        return record
+    lb_window.set_widget_value('export_status', message)
+    return None
 
 
 def run_leaderboard():
     """Run the leaderboard screen."""
-    global game_mode
+    global game_mode, pending_rerun
 
     lb_window = _build_leaderboard_window()
     _refresh_leaderboard(lb_window)
@@ -956,18 +1165,29 @@ def run_leaderboard():
     prev_algo_idx   = lb_window.widgets['filter_algo'].selected_option
     prev_sort_idx   = lb_window.widgets['sort_field'].selected_option
     prev_asc        = lb_window.get_widget_value('sort_asc')
+    prev_stats      = lb_window.get_widget_value('stats_view')
 
     export_msg_time = 0.0   # timestamp when status message was set
+    export_job = None       # ExportJob while an export runs
+    clock = pygame.time.Clock()
 
     running_lb = True
     while running_lb:
-        screen.fill(white)
-
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
+                if export_job:
+                    # Give it a moment to stop and remove its partial file
+                    export_job.cancel()
+                    export_job.wait(2.0)
                 return False
 
+            # A click on an open dropdown's options must not select the row below
+            table = lb_window.widgets['lb_table']
+            selected = table.selected_index
+            dropdown_open = lb_window.overlay_open()
             lb_window.update(event)
+            if dropdown_open:
+                table.selected_index = selected
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()
@@ -977,6 +1197,15 @@ def run_leaderboard():
                     game_mode = MODE_SELECTION
                     return True
 
+                # Re-run button
+                if pygame.Rect(10, 8, 90, 28).collidepoint(mouse_pos):
+                    record = _rerun_selected(lb_window)
+                    if record is not None:
+                        pending_rerun = record
+                        game_mode = SOLO_MODE
+                        return True
+                    export_msg_time = time.time()
+
                 # Explicit refresh button
                 if pygame.Rect(545, 45, 80, 30).collidepoint(mouse_pos):
                     _refresh_leaderboard(lb_window)
@@ -984,9 +1213,24 @@ def run_leaderboard():
                     prev_sort_idx = lb_window.widgets['sort_field'].selected_option
                     prev_asc      = lb_window.get_widget_value('sort_asc')
 
-                # Export CSV button
+                # Export format
+                if pygame.Rect(110, 8, 90, 28).collidepoint(mouse_pos):
+                    formats = list(_EXPORT_FORMATS)
+                    current = lb_window.get_widget_value('export_format')
+                    lb_window.set_widget_value(
+                        'export_format', formats[(formats.index(current) + 1) % len(formats)])
+
+                # Export button, or Cancel while exporting
                 if pygame.Rect(635, 45, 90, 30).collidepoint(mouse_pos):
-                    export_msg_time = _do_export(lb_window)
+                    if export_job:
+                        export_job.cancel()
+                    else:
+                        export_job = _start_export(lb_window)
+
+        # Export progress; the outcome stays up for 3 seconds
+        if export_job and _export_status(lb_window, export_job):
+            export_job = None
+            export_msg_time = time.time()
 
         # Clear export status message after 3 seconds
         if export_msg_time and time.time() - export_msg_time > 3.0:
@@ -997,17 +1241,23 @@ def run_leaderboard():
         cur_algo_idx = lb_window.widgets['filter_algo'].selected_option
         cur_sort_idx = lb_window.widgets['sort_field'].selected_option
         cur_asc      = lb_window.get_widget_value('sort_asc')
+        cur_stats    = lb_window.get_widget_value('stats_view')
 
         if (cur_algo_idx != prev_algo_idx or
                 cur_sort_idx != prev_sort_idx or
-                cur_asc != prev_asc):
+                cur_asc != prev_asc or
+                cur_stats != prev_stats):
             _refresh_leaderboard(lb_window)
             prev_algo_idx = cur_algo_idx
             prev_sort_idx = cur_sort_idx
             prev_asc      = cur_asc
+            prev_stats    = cur_stats
 
-        lb_window.render()
-        pygame.display.update()
+        if lb_window.needs_full_redraw():
+            screen.fill(white)
+        pygame.display.update(lb_window.render())
+        # Leaves the CPU to a running export instead of redrawing flat out
+        clock.tick(FRAME_RATE_CAP)
 
 
 def run_mode_selection():
@@ -1015,11 +1265,10 @@ def run_mode_selection():
     global game_mode
     
     window = init_mode_selection()
+    clock = pygame.time.Clock()
     
     running_selection = True
     while running_selection:
-        screen.fill(white)
-        
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
@@ -1037,13 +1286,16 @@ def run_mode_selection():
                 game_mode = LEADERBOARD_MODE
                 return True
         
-        window.render()
-        pygame.display.update()
+        if window.needs_full_redraw():
+            screen.fill(white)
+        pygame.display.update(window.render())
+        clock.tick(FRAME_RATE_CAP)
 
 def main():
     """Main game loop with mode switching."""
     global game_mode, solo_window, arena_window
-    
+
+    init_pygame()
     running = True
     while running:
         if game_mode == MODE_SELECTION:
@@ -1055,6 +1307,7 @@ def main():
         elif game_mode == LEADERBOARD_MODE:
             running = run_leaderboard()
     
+    shutdown_writer()
     pygame.quit()
 
 
@@ -0,0 +1,567 @@
+"""
+Compact operation traces of sorting runs, and a replay engine for them.
+
+A TraceRecorder drives an algorithmsDict generator once and stores what
+happened between consecutive frames (yields) as packed opcodes:
+
+    OP_COMPARE n        n comparisons counted since the previous frame
+    OP_SWAP    n        n swaps counted since the previous frame
+    OP_WRITE   i        array[i] changed from old to new  (old, new in values)
+    OP_INSERT  i        array.insert(i, new)              (new in values)
+    OP_POP     i        array.pop(i) removed old          (old in values)
+    OP_FRAME   r1 r2 b1 b2   a yield with its four highlight indices
+
+Opcodes live in an array('B'), integer operands in an array('I') and
+element values in an array('q') (or 'd' once a float shows up), so a step
+costs a few dozen bytes instead of a copy of the whole array.
+
+A TracePlayer rebuilds any frame from the initial array plus the trace and
+can move forwards and backwards one frame at a time without re-running the
+algorithm. It keeps a full keyframe every `keyframe_interval` frames so that
+long jumps replay from the nearest keyframe instead of from the start.
+"""
+
+from array import array as packed
+import time
+
+from counters import Counter, set_counter, reset_counter
+
+OP_FRAME, OP_COMPARE, OP_SWAP, OP_WRITE, OP_INSERT, OP_POP = range(6)
+
+# Every opcode except OP_FRAME (4 operands) stores one integer operand.
+# Number of values stored in Trace.values for each opcode
+_VALUE_COUNT = {OP_FRAME: 0, OP_COMPARE: 0, OP_SWAP: 0, OP_WRITE: 2, OP_INSERT: 1, OP_POP: 1}
+
+_NO_BAR = 0   # highlight indices are stored +1 so that -1 packs as 0
+
+
+def _pack_bar(index):
+    try:
+        index = int(index)
+    except (TypeError, ValueError):
+        return _NO_BAR
+    return index + 1 if 0 <= index < 0xFFFFFFFF else _NO_BAR
+
+
+class Trace:
+    """
+    The recorded operations of one sort run.
+
+    initial        : copy of the array before the first step
+    ops/args/values: the packed operation streams described above
+    frame_index    : for frame k (1-based) the (ops, args, values) buffer
+                     positions just after its OP_FRAME, flattened 3 per frame
+    times          : seconds since the start of recording, one per frame
+    """
+
+    def __init__(self, initial):
+        self.initial = list(initial)
+        self.ops = packed('B')
+        self.args = packed('I')
+        self.values = packed('d' if any(isinstance(v, float) for v in self.initial) else 'q')
+        self.frame_index = packed('I')
+        self.times = packed('f')
+        self.finished = False
+        self.comparisons = 0
+        self.swaps = 0
+
+    def __len__(self):
+        """Number of recorded frames (not counting the initial state)."""
+        return len(self.times)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the packed buffers."""
+        return sum(buf.itemsize * len(buf) for buf in
+                   (self.ops, self.args, self.values, self.frame_index, self.times))
+
+    def _mark(self):
+        return len(self.ops), len(self.args), len(self.values)
+
+    def _truncate(self, mark):
+        ops, args, values = mark
+        del self.ops[ops:]
+        del self.args[args:]
+        del self.values[values:]
+
+    def _push_values(self, *vals):
+        size = len(self.values)
+        try:
+            self.values.extend(vals)
+        except TypeError:
+            # First non-integer value: widen the buffer to doubles (extend()
+            # may have appended part of `vals` before failing)
+            self.values = packed('d', self.values[:size])
+            self.values.extend(vals)
+
+    def _write(self, index, old, new):
+        self.ops.append(OP_WRITE)
+        self.args.append(index)
+        self._push_values(old, new)
+
+    def _insert(self, index, new):
+        self.ops.append(OP_INSERT)
+        self.args.append(index)
+        self._push_values(new)
+
+    def _pop(self, index, old):
+        self.ops.append(OP_POP)
+        self.args.append(index)
+        self._push_values(old)
+
+    def _frame(self, bars, comparisons, swaps, elapsed):
+        if comparisons:
+            self.ops.append(OP_COMPARE)
+            self.args.append(comparisons)
+        if swaps:
+            self.ops.append(OP_SWAP)
+            self.args.append(swaps)
+        self.ops.append(OP_FRAME)
+        self.args.extend(_pack_bar(b) for b in bars)
+        self.frame_index.extend(self._mark())
+        self.times.append(elapsed)
+        self.comparisons += comparisons
+        self.swaps += swaps
+
+
+class TracingList(list):
+    """
+    A list that reports element writes to its TraceRecorder.
+
+    Only the mutations algorithms actually perform are tracked individually
+    (item assignment, same-length slice assignment, insert and pop); any
+    other in-place mutation asks the recorder to diff the list at the next
+    frame instead.
+    """
+
+    __slots__ = ('_recorder',)
+
+    def __init__(self, values, recorder):
+        super().__init__(values)
+        self._recorder = recorder
+
+    def __setitem__(self, index, value):
+        rec = self._recorder
+        if not rec._tracking:
+            return list.__setitem__(self, index, value)
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            value = list(value)
+            if len(indices) != len(value):
+                rec._needs_diff = True
+                return list.__setitem__(self, index, value)
+            old = [list.__getitem__(self, i) for i in indices]
+            list.__setitem__(self, index, value)
+            for i, o, v in zip(indices, old, value):
+                if o != v:
+                    rec._written(i, o, v)
+            return
+        if index < 0:
+            index += len(self)
+        old = list.__getitem__(self, index)
+        list.__setitem__(self, index, value)
+        if old != value:
+            rec._written(index, old, value)
+
+    def insert(self, index, value):
+        rec = self._recorder
+        size = len(self)
+        list.insert(self, index, value)
+        if rec._tracking:
+            if index < 0:
+                index = max(0, index + size)
+            rec._inserted(min(index, size), value)
+
+    def pop(self, index=-1):
+        rec = self._recorder
+        if index < 0:
+            index += len(self)
+        value = list.pop(self, index)
+        if rec._tracking:
+            rec._popped(index, value)
+        return value
+
+
+def _untracked(name):
+    def method(self, *args, **kwargs):
+        self._recorder._needs_diff = True
+        return getattr(list, name)(self, *args, **kwargs)
+    method.__name__ = name
+    return method
+
+
+for _name in ('__delitem__', '__iadd__', '__imul__', 'append', 'extend',
+              'remove', 'clear', 'sort', 'reverse'):
+    setattr(TracingList, _name, _untracked(_name))
+del _name
+
+
+class TraceRecorder:
+    """
+    Drive one algorithm generator and record its run into a Trace.
+
+    The algorithm sorts `self.array`, a TracingList copy of `values`.
+    Frames whose yielded list is not that array (e.g. a scratch buffer the
+    algorithm chooses to display) are recorded by diffing against the
+    previously shown frame, so the trace always describes what was shown.
+
+    Counting happens in a private Counter selected around every step, so
+    recording does not disturb the global counters or other runs.
+    """
+
+    def __init__(self, sort, values, *args):
+        self.trace = Trace(values)
+        self.array = TracingList(values, self)
+        self._shadow = list(values)     # contents of the last shown frame
+        self._shown = self.array        # list the last frame displayed
+        self._pending = []              # (index, old) writes since last frame
+        self._frame_mark = self.trace._mark()
+        self._tracking = True
+        self._needs_diff = False
+        self.counter = Counter()
+        self._iterator = sort(self.array, *args)
+        self._start = time.perf_counter()
+
+    @property
+    def finished(self) -> bool:
+        return self.trace.finished
+
+    # ------------------------------------------------------------------
+    # Callbacks from TracingList
+    # ------------------------------------------------------------------
+    def _written(self, index, old, new):
+        self.trace._write(index, old, new)
+        self._shadow[index] = new
+        self._pending.append((OP_WRITE, index, old))
+
+    def _inserted(self, index, new):
+        self.trace._insert(index, new)
+        self._shadow.insert(index, new)
+        self._pending.append((OP_INSERT, index, None))
+
+    def _popped(self, index, old):
+        self.trace._pop(index, old)
+        self._shadow.pop(index)
+        self._pending.append((OP_POP, index, old))
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def _rollback_pending(self):
+        """Forget the writes logged since the last frame (shadow and buffers)."""
+        shadow = self._shadow
+        for op, index, old in reversed(self._pending):
+            if op == OP_WRITE:
+                shadow[index] = old
+            elif op == OP_INSERT:
+                shadow.pop(index)
+            else:
+                shadow.insert(index, old)
+        self._pending.clear()
+        self.trace._truncate(self._frame_mark)
+
+    def _diff_into_trace(self, shown):
+        """Record the element changes that turn the shadow into `shown`."""
+        shadow = self._shadow
+        trace = self.trace
+        while len(shadow) > len(shown):
+            trace._pop(len(shadow) - 1, shadow.pop())
+        for i, (old, new) in enumerate(zip(shadow, shown)):
+            if old != new:
+                trace._write(i, old, new)
+                shadow[i] = new
+        for i in range(len(shadow), len(shown)):
+            trace._insert(i, shown[i])
+            shadow.append(shown[i])
+
+    def _end_frame(self, shown, bars):
+        if shown is not self.array or self._shown is not self.array or self._needs_diff:
+            self._rollback_pending()
+            self._diff_into_trace(shown)
+        self._pending.clear()
+        self._needs_diff = False
+        self._shown = shown
+        # Writes are only logged as they happen while the array is on screen
+        self._tracking = shown is self.array
+
+        trace = self.trace
+        comparisons = self.counter.comparisons
+        swaps = self.counter.swaps
+        trace._frame(bars, comparisons - trace.comparisons, swaps - trace.swaps,
+                     time.perf_counter() - self._start)
+        self._frame_mark = trace._mark()
+
+    def step(self) -> bool:
+        """
+        Advance the algorithm by one yield and record it.
+
+        Returns False once the run is over; the final sorted state is then
+        recorded as a last frame with no highlighted bars.
+        """
+        if self.trace.finished:
+            return False
+        token = set_counter(self.counter)
+        try:
+            shown, r1, r2, b1, b2 = next(self._iterator)
+        except StopIteration:
+            self._end_frame(self.array, (-1, -1, -1, -1))
+            self.trace.finished = True
+            return False
+        finally:
+            reset_counter(token)
+        self._end_frame(shown, (r1, r2, b1, b2))
+        return True
+
+    def record(self, max_steps: int = None) -> Trace:
+        """Run to completion (or `max_steps` frames) and return the trace."""
+        steps = 0
+        while (max_steps is None or steps < max_steps) and self.step():
+            steps += 1
+        return self.trace
+
+
+def record(sort, values, *args, max_steps: int = None) -> Trace:
+    """Record a full run of `sort(values_copy, *args)`; `values` is not modified."""
+    return TraceRecorder(sort, values, *args).record(max_steps)
+
+
+class TracePlayer:
+    """
+    Replay a Trace frame by frame.
+
+    position 0 is the initial array; position k (1..len(trace)) is the state
+    shown by the k-th recorded frame. `array`, `highlights`, `comparisons`,
+    `swaps` and `elapsed_ms` always describe the current position, so they
+    can be fed straight to the bar renderers and the counter widgets.
+
+    With `heat` set the player also keeps `self.heat`, the per-bar swap heat
+    used by the solo view: every frame adds its swap count to its two red
+    bars, and stepping back subtracts it again.
+
+    The player also remembers which bars changed value or heat since the
+    last take_changes() call, so a renderer can repaint just those.
+    """
+
+    KEYFRAME_INTERVAL = 256
+
+    def __init__(self, trace: Trace, heat: bool = False, keyframe_interval: int = None):
+        self.trace = trace
+        self.array = list(trace.initial)
+        self.heat = [0.0] * len(self.array) if heat else None
+        self.position = 0
+        self.highlights = (-1, -1, -1, -1)
+        self.comparisons = 0
+        self.swaps = 0
+        # Comparisons / swaps counted between the previous frame and this one
+        self.frame_comparisons = 0
+        self.frame_swaps = 0
+        self._cursor = (0, 0, 0)
+        # Indices changed since the last take_changes(); None means all of them
+        self._changed = None
+        # A keyframe copies the whole array, so space them at least one array
+        # length apart to keep their cost O(1) per frame on average
+        self.keyframe_interval = keyframe_interval or max(self.KEYFRAME_INTERVAL,
+                                                          len(self.array))
+        self._keyframes = [self._keyframe()]
+
+    @property
+    def elapsed_ms(self) -> float:
+        return self.trace.times[self.position - 1] * 1000 if self.position else 0.0
+
+    def frame(self):
+        """Return the current frame in the generator format the bar renderers draw."""
+        return (self.array,) + self.highlights
+
+    def take_changes(self):
+        """
+        Return the set of indices whose value or heat changed since the
+        previous call, or None if the whole array has to be assumed changed.
+        """
+        changed = self._changed
+        self._changed = set()
+        return changed
+
+    def _keyframe(self):
+        heat = self.heat[:] if self.heat is not None else None
+        return (self._cursor, self.array[:], heat, self.comparisons, self.swaps)
+
+    def _restore_keyframe(self, index):
+        cursor, array, heat, comparisons, swaps = self._keyframes[index]
+        self._cursor = cursor
+        self.array[:] = array
+        if heat is not None:
+            self.heat[:] = heat
+        self.comparisons = comparisons
+        self.swaps = swaps
+        self.position = index * self.keyframe_interval
+        self._changed = None
+        self.highlights = self._bars_at(self.position)
+        self._restore_frame_counts()
+
+    def _add_heat(self, amount):
+        heat = self.heat
+        for bar in self.highlights[:2]:
+            if 0 <= bar < len(heat):
+                heat[bar] += amount
+                if self._changed is not None:
+                    self._changed.add(bar)
+
+    def _bars_at(self, position):
+        if position == 0:
+            return (-1, -1, -1, -1)
+        arg = self.trace.frame_index[3 * position - 2]
+        return tuple(b - 1 for b in self.trace.args[arg - 4:arg])
+
+    def step_forward(self) -> bool:
+        """Apply the next recorded frame. Returns False at the end of the trace."""
+        trace = self.trace
+        if self.position >= len(trace):
+            return False
+        ops, args, values = trace.ops, trace.args, trace.values
+        array = self.array
+        changed = self._changed
+        o, a, v = self._cursor
+        comparisons = swaps = 0
+        while True:
+            op = ops[o]
+            o += 1
+            if op == OP_FRAME:
+                a += 4
+                break
+            if op == OP_WRITE:
+                array[args[a]] = values[v + 1]
+                if changed is not None:
+                    changed.add(args[a])
+                v += 2
+            elif op == OP_COMPARE:
+                comparisons += args[a]
+            elif op == OP_SWAP:
+                swaps += args[a]
+            elif op == OP_INSERT:
+                array.insert(args[a], values[v])
+                changed = self._changed = None
+                v += 1
+            elif op == OP_POP:
+                array.pop(args[a])
+                changed = self._changed = None
+                v += 1
+            a += 1
+        self._cursor = (o, a, v)
+        self.position += 1
+        self.highlights = tuple(b - 1 for b in args[a - 4:a])
+        self.comparisons += comparisons
+        self.swaps += swaps
+        self.frame_comparisons = comparisons
+        self.frame_swaps = swaps
+        if swaps and self.heat is not None:
+            self._add_heat(swaps)
+        if self.position == len(self._keyframes) * self.keyframe_interval:
+            self._keyframes.append(self._keyframe())
+        return True
+
+    def step_back(self) -> bool:
+        """Undo the current frame. Returns False at the initial state."""
+        if self.position == 0:
+            return False
+        if self.frame_swaps and self.heat is not None:
+            self._add_heat(-self.frame_swaps)
+        trace = self.trace
+        ops, args, values = trace.ops, trace.args, trace.values
+        end_o = self._cursor[0] - 1          # the OP_FRAME being undone
+        if self.position > 1:
+            start = tuple(trace.frame_index[3 * (self.position - 2):3 * (self.position - 1)])
+        else:
+            start = (0, 0, 0)
+
+        # Walk the segment forwards to locate operands, then undo in reverse
+        o, a, v = start
+        segment = []
+        while o < end_o:
+            op = ops[o]
+            segment.append((op, a, v))
+            a += 1
+            v += _VALUE_COUNT[op]
+            o += 1
+
+        array = self.array
+        for op, a, v in reversed(segment):
+            if op == OP_WRITE:
+                array[args[a]] = values[v]
+                if self._changed is not None:
+                    self._changed.add(args[a])
+            elif op == OP_COMPARE:
+                self.comparisons -= args[a]
+            elif op == OP_SWAP:
+                self.swaps -= args[a]
+            elif op == OP_INSERT:
+                array.pop(args[a])
+                self._changed = None
+            elif op == OP_POP:
+                array.insert(args[a], values[v])
+                self._changed = None
+
+        self._cursor = start
+        self.position -= 1
+        self.highlights = self._bars_at(self.position)
+        self._restore_frame_counts()
+        return True
+
+    def _restore_frame_counts(self):
+        """Recompute frame_comparisons / frame_swaps for the current position."""
+        self.frame_comparisons = self.frame_swaps = 0
+        if self.position == 0:
+            return
+        trace = self.trace
+        o = trace.frame_index[3 * self.position - 3] - 1   # this frame's OP_FRAME
+        a = trace.frame_index[3 * self.position - 2] - 4
+        # Counter ops, when present, sit just before the OP_FRAME
+        while o > 0 and trace.ops[o - 1] in (OP_COMPARE, OP_SWAP):
+            o -= 1
+            a -= 1
+            if trace.ops[o] == OP_COMPARE:
+                self.frame_comparisons = trace.args[a]
+            else:
+                self.frame_swaps = trace.args[a]
+
+    def state(self):
+        """
+        The current position as a plain, picklable value for restore(), to
+        continue the replay elsewhere, e.g. in another process.
+        """
+        return (self.position,) + self._keyframe()
+
+    def restore(self, state):
+        """Jump to a position saved by state() of a player of the same trace."""
+        position, cursor, array, heat, comparisons, swaps = state
+        self._cursor = cursor
+        self.array[:] = array
+        if self.heat is not None and heat is not None:
+            self.heat[:] = heat
+        self.comparisons = comparisons
+        self.swaps = swaps
+        self.position = position
+        self._changed = None
+        self.highlights = self._bars_at(position)
+        self._restore_frame_counts()
+
+    def seek(self, position: int):
+        """
+        Move to any position.
+
+        Jumps to the nearest keyframe at or before `position` when that is
+        closer than the current position, then replays forwards or undoes
+        frame by frame.
+        """
+        position = max(0, min(position, len(self.trace)))
+        key = min(position // self.keyframe_interval, len(self._keyframes) - 1)
+        if abs(position - self.position) > position - key * self.keyframe_interval:
+            self._restore_keyframe(key)
+        while self.position < position:
+            self.step_forward()
+        while self.position > position:
+            self.step_back()
+
+    def frames(self):
+        """Yield every remaining frame, like the original algorithm generator."""
+        while self.step_forward():
+            yield self.frame()
@@ -0,0 +1,82 @@
+"""
+Playback speed for the solo and arena loops.
+
+The speed slider is logarithmic: its 0..1 value maps to 1 step per second
+at the left end and MAX_STEPS_PER_SECOND at the right. The loops render at
+most FRAME_RATE_CAP frames per second (pygame.time.Clock), so at high
+speeds a StepPacer hands out many steps per frame and only the state after
+the last of them is drawn.
+"""
+
+import time
+
+FRAME_RATE_CAP = 60
+MAX_STEPS_PER_SECOND = 10_000_000
+SPEED_SLIDER_DEFAULT = 0.3          # ≈ 125 steps/s
+
+# Share of a frame the loops may spend stepping before they render
+FRAME_WORK_BUDGET = 0.8 / FRAME_RATE_CAP
+# Seconds of stepping per frame while skipping to the end; the window keeps
+# handling events in between so Stop still works
+SKIP_FRAME_BUDGET = 0.25
+
+
+def steps_per_second(fraction: float) -> float:
+    """Map a speed slider value (0..1) to steps per second."""
+    return MAX_STEPS_PER_SECOND ** min(max(fraction, 0.0), 1.0)
+
+
+def format_rate(rate: float) -> str:
+    """Short label for a steps-per-second rate, e.g. '125', '3.2k', '10M'."""
+    if rate >= 1e6:
+        return f'{rate / 1e6:.3g}M'
+    if rate >= 1e3:
+        return f'{rate / 1e3:.3g}k'
+    return f'{rate:.0f}'
+
+
+class StepPacer:
+    """
+    Turn a speed in steps per second into a number of steps per frame.
+
+    Fractional steps carry over between frames, so 1 step/s advances once
+    every 60 frames at 60 fps. A stalled frame counts as at most four
+    frames, and steps that did not fit in a frame's work budget are dropped
+    rather than owed, so a slow frame never triggers a burst.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Start counting from now with no steps owed."""
+        self._budget = 0.0
+        self._last = time.perf_counter()
+
+    def steps_due(self, rate: float) -> int:
+        """Return how many steps to take this frame at `rate` steps per second."""
+        now = time.perf_counter()
+        elapsed = min(now - self._last, 4 / FRAME_RATE_CAP)
+        self._last = now
+        self._budget += rate * elapsed
+        steps = int(self._budget)
+        self._budget -= steps
+        return steps
+
+
+def run_steps(step, count: int, budget: float) -> bool:
+    """
+    Call step() up to `count` times or until `budget` seconds have passed.
+
+    step() returns False once the run is over; run_steps() then returns
+    False too. The clock is only read every 256 steps.
+    """
+    deadline = time.perf_counter() + budget
+    done = 0
+    while done < count:
+        if not step():
+            return False
+        done += 1
+        if not done & 255 and time.perf_counter() > deadline:
+            break
+    return True
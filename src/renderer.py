@@ -0,0 +1,377 @@
+"""
+Bar chart rendering for the visualizer.
+
+BarRenderer keeps the bars of the previous frame on a surface of its own and only repaints the
+columns whose height or colour changed since then, returning the screen
+rects that have to be pushed with pygame.display.update(rects).
+ArrayBarRenderer does the same job for arrays with more bars than pixel
+columns: it builds the whole image as a NumPy pixel array and blits it with
+pygame.surfarray in one call. make_bar_renderer() picks between the two, and
+ScreenUpdater decides whether a frame can get away with the changed rects or
+needs a full display update.
+"""
+
+import bisect
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:     # optional, only needed for very large arrays
+    np = None
+
+HAVE_NUMPY = np is not None
+
+# Bar colors
+grey = (100, 100, 100)
+green = (125, 240, 125)
+white = (250, 250, 250)
+red = (255, 50, 50)
+blue = (50, 50, 255)
+
+
+def _heat_color(heat_value, heat_threshold):
+    """
+    Return an RGB color on a green → orange → red gradient.
+
+    heat_value    : accumulated heat for this bar (float)
+    heat_threshold: value at which the bar is fully red
+    """
+    t = min(heat_value / max(heat_threshold, 1), 1.0)   # 0.0 … 1.0
+    if t < 0.5:
+        # green (0,200,80)  →  orange (255,140,0)
+        s = t * 2
+        r = int(0   + s * 255)
+        g = int(200 + s * (140 - 200))
+        b = int(80  + s * (0   - 80))
+    else:
+        # orange (255,140,0)  →  red (220,30,30)
+        s = (t - 0.5) * 2
+        r = int(255 + s * (220 - 255))
+        g = int(140 + s * (30  - 140))
+        b = int(0   + s * 30)
+    return (r, g, b)
+
+
+class BarRenderer:
+    """
+    Incremental bar chart for one screen area.
+
+    Every bar owns a fixed span of whole pixel columns. draw() works out
+    which bars changed height or colour since the previous call, repaints
+    only their columns on the backing surface and returns those columns as
+    screen rects; blit() copies the surface onto the screen.
+
+    Parameters
+    ----------
+    rect : tuple or pygame.Rect
+        Screen area covered by the bars; its height is the maximum bar height.
+    max_value : number or None
+        Value drawn at full height; None draws one value per pixel.
+    background : tuple
+        Colour behind the bars.
+    """
+
+    # Past this many separate rects one rect around all of them is cheaper
+    MAX_DIRTY_RECTS = 32
+
+    def __init__(self, rect, max_value=None, background=white):
+        self.rect = pygame.Rect(rect)
+        self.max_value = max_value
+        self.background = background
+        self.surface = pygame.Surface(self.rect.size)
+        self.surface.fill(background)
+        self._starts = []       # first pixel column of each bar
+        self._ends = []         # one past the last pixel column of each bar
+        self._heights = []      # height each bar was last drawn with
+        self._colors = []       # colour each bar was last drawn with
+        self._highlights = ()   # highlighted bars of the previous frame
+        self._finished = False
+        self._heat = False
+
+    def _layout(self, count):
+        """Assign pixel columns to `count` bars and forget what was drawn."""
+        width = self.rect.width
+        self._starts = [i * width // count for i in range(count)]
+        # When there are more bars than columns neighbours share a column;
+        # the later bar is painted on top
+        self._ends = [max(start + 1, (i + 1) * width // count)
+                      for i, start in enumerate(self._starts)]
+        self._heights = [-1] * count
+        self._colors = [None] * count
+        self.surface.fill(self.background)
+
+    def invalidate(self):
+        """Force the next draw() to repaint every bar."""
+        self._heights = []
+
+    def draw(self, array, redBar1, redBar2, blueBar1, blueBar2,
+             finished=False, swap_heat=None, heat_threshold=100, changed=None) -> list:
+        """
+        Bring the backing surface up to date with one frame.
+
+        Parameters
+        ----------
+        array, redBar1, redBar2, blueBar1, blueBar2
+            One frame as yielded by the algorithms.
+        finished : bool
+            Draw every bar green, as when the sort is done.
+        swap_heat, heat_threshold
+            Optional per-bar heat values, drawn on a green → orange → red
+            gradient (see _heat_color()) that is fully red at heat_threshold.
+        changed : iterable of int or None
+            Indices whose value or heat may have changed since the previous
+            call (e.g. TracePlayer.take_changes()). None compares every bar,
+            which costs O(n) comparisons but still no extra drawing.
+
+        Returns the list of screen rects that changed.
+        """
+        count = len(array)
+        full = count != len(self._heights)
+        if full:
+            if count == 0:
+                self._heights = self._colors = self._starts = self._ends = []
+                self.surface.fill(self.background)
+                return [self.rect]
+            self._layout(count)
+
+        highlights = (redBar1, redBar2, blueBar1, blueBar2)
+        if (full or changed is None or finished != self._finished
+                or (swap_heat is not None) != self._heat):
+            candidates = range(count)
+        else:
+            candidates = set(changed)
+            candidates.update(b for b in highlights + self._highlights if 0 <= b < count)
+        self._highlights = highlights
+        self._finished = finished
+        self._heat = swap_heat is not None
+
+        scale = self.rect.height / self.max_value if self.max_value else 1
+        heights, colors = self._heights, self._colors
+        dirty = []
+        for i in candidates:
+            if i == redBar1 or i == redBar2:
+                color = red
+            elif i == blueBar1 or i == blueBar2:
+                color = blue
+            elif finished:
+                color = green
+            elif swap_heat is not None:
+                color = _heat_color(swap_heat[i], heat_threshold)
+            else:
+                color = grey
+            height = int(array[i] * scale)
+            if height != heights[i] or color != colors[i]:
+                heights[i] = height
+                colors[i] = color
+                dirty.append(i)
+
+        if full:
+            self._paint(0, self.rect.width)
+            return [self.rect]
+        return self._repaint(dirty)
+
+    def _repaint(self, dirty):
+        """Repaint the columns of the `dirty` bars and return them as screen rects."""
+        if not dirty:
+            return []
+        starts, ends = self._starts, self._ends
+        spans = sorted((starts[i], ends[i]) for i in dirty)
+        merged = [list(spans[0])]
+        for start, end in spans[1:]:
+            if start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        for start, end in merged:
+            self._paint(start, end)
+
+        x, y, height = self.rect.x, self.rect.y, self.rect.height
+        if len(merged) > self.MAX_DIRTY_RECTS:
+            return [pygame.Rect(x + merged[0][0], y, merged[-1][1] - merged[0][0], height)]
+        return [pygame.Rect(x + start, y, end - start, height) for start, end in merged]
+
+    def _paint(self, left, right):
+        """Clear columns left..right-1 and redraw every bar that touches them."""
+        surface = self.surface
+        height = self.rect.height
+        surface.fill(self.background, (left, 0, right - left, height))
+        first = bisect.bisect_right(self._ends, left)
+        last = bisect.bisect_left(self._starts, right)
+        for i in range(first, last):
+            bar_height = self._heights[i]
+            if bar_height <= 0:
+                continue
+            x0 = max(self._starts[i], left)
+            x1 = min(self._ends[i], right)
+            surface.fill(self._colors[i], (x0, height - bar_height, x1 - x0, bar_height))
+
+    def blit(self, screen):
+        """Copy the bars onto the screen."""
+        screen.blit(self.surface, self.rect)
+
+
+class ArrayBarRenderer:
+    """
+    Vectorized bar chart for arrays of any size; requires NumPy.
+
+    Takes the same arguments as BarRenderer and lays the bars out on the same
+    pixel columns. When several bars share a column, the tallest of them sets
+    its height and the hottest its colour, and a highlighted bar is drawn
+    over the whole column. Each draw() computes every column's height and
+    colour with array operations, rebuilds the pixels of the columns that
+    differ from the previous frame and blits the pixel buffer with
+    pygame.surfarray.blit_array.
+    """
+
+    # Number of precomputed swap-heat colours
+    HEAT_LEVELS = 256
+
+    def __init__(self, rect, max_value=None, background=white):
+        if np is None:
+            raise RuntimeError('ArrayBarRenderer needs numpy')
+        self.rect = pygame.Rect(rect)
+        self.max_value = max_value
+        self.background = np.array(background, dtype=np.uint8)
+        self.surface = pygame.Surface(self.rect.size)
+        self.surface.fill(background)
+        width, height = self.rect.size
+        # surfarray indexes pixels as [x, y]
+        self._pixels = np.empty((width, height, 3), dtype=np.uint8)
+        self._pixels[:] = self.background
+        # Row y is filled by every bar taller than _levels[y]
+        self._levels = np.arange(height - 1, -1, -1)
+        self._heat_lut = np.array(
+            [_heat_color(level, self.HEAT_LEVELS - 1) for level in range(self.HEAT_LEVELS)],
+            dtype=np.uint8)
+        self._count = -1
+        self._column_heights = None
+        self._column_colors = None
+
+    def _layout(self, count):
+        """Map `count` bars onto the pixel columns, as BarRenderer does."""
+        width = self.rect.width
+        columns = np.arange(width)
+        self._starts = np.arange(count) * width // count
+        self._ends = np.maximum(self._starts + 1, np.arange(1, count + 1) * width // count)
+        if count >= width:
+            # Every column holds whole bars: reduce over each column's group
+            self._groups = np.searchsorted(self._starts, columns, 'left')
+            self._bar_of_column = None
+        else:
+            self._groups = None
+            self._bar_of_column = np.searchsorted(self._starts, columns, 'right') - 1
+        self._count = count
+        self._column_heights = None
+
+    def invalidate(self):
+        """Force the next draw() to rebuild every column."""
+        self._count = -1
+
+    def _per_column(self, values, reduce):
+        if self._groups is not None:
+            return reduce.reduceat(values, self._groups)
+        return values[self._bar_of_column]
+
+    def draw(self, array, redBar1, redBar2, blueBar1, blueBar2,
+             finished=False, swap_heat=None, heat_threshold=100, changed=None) -> list:
+        """
+        Bring the pixel buffer up to date with one frame; see BarRenderer.draw.
+
+        `changed` is accepted for compatibility and ignored: every column is
+        recomputed, which is a handful of array operations.
+        """
+        count = len(array)
+        if count == 0:
+            if self._count == 0:
+                return []
+            self._count = 0
+            self._pixels[:] = self.background
+            self.surface.fill(self.background)
+            return [self.rect]
+        if count != self._count:
+            self._layout(count)
+
+        width = self.rect.width
+        scale = self.rect.height / self.max_value if self.max_value else 1
+        heights = (np.asarray(array, dtype=np.float64) * scale).astype(np.int64)
+        column_heights = self._per_column(heights, np.maximum)
+
+        if finished:
+            column_colors = np.empty((width, 3), dtype=np.uint8)
+            column_colors[:] = green
+        elif swap_heat is not None:
+            top = self.HEAT_LEVELS - 1
+            levels = np.minimum(np.asarray(swap_heat, dtype=np.float64) / max(heat_threshold, 1), 1.0)
+            levels = (levels * top).astype(np.int64)
+            column_colors = self._heat_lut[self._per_column(levels, np.maximum)]
+        else:
+            column_colors = np.empty((width, 3), dtype=np.uint8)
+            column_colors[:] = grey
+
+        # Red wins over blue, as in BarRenderer
+        for bar, color in ((blueBar2, blue), (blueBar1, blue), (redBar2, red), (redBar1, red)):
+            if 0 <= bar < count:
+                start, end = self._starts[bar], self._ends[bar]
+                column_colors[start:end] = color
+                column_heights[start:end] = heights[bar]
+
+        if self._column_heights is None:
+            left, right = 0, width
+        else:
+            differs = np.flatnonzero((column_heights != self._column_heights)
+                                     | (column_colors != self._column_colors).any(axis=1))
+            if not differs.size:
+                return []
+            left, right = int(differs[0]), int(differs[-1]) + 1
+        self._column_heights = column_heights
+        self._column_colors = column_colors
+
+        filled = column_heights[left:right, None] > self._levels[None, :]
+        self._pixels[left:right] = np.where(filled[..., None],
+                                            column_colors[left:right, None, :],
+                                            self.background)
+        pygame.surfarray.blit_array(self.surface, self._pixels)
+        return [pygame.Rect(self.rect.x + left, self.rect.y, right - left, self.rect.height)]
+
+    def blit(self, screen):
+        """Copy the bars onto the screen."""
+        screen.blit(self.surface, self.rect)
+
+
+def make_bar_renderer(rect, count, max_value=None, background=white):
+    """
+    Return a renderer suited to `count` bars in `rect`.
+
+    Per-bar repainting is cheapest while every bar has columns of its own;
+    beyond that, and when NumPy is installed, the vectorized renderer is used.
+    """
+    if np is not None and count > pygame.Rect(rect).width:
+        return ArrayBarRenderer(rect, max_value, background)
+    return BarRenderer(rect, max_value, background)
+
+
+class ScreenUpdater:
+    """
+    Push a frame to the display with pygame.display.update(rects).
+
+    A full update is done on the first frame, after invalidate(), and
+    whenever present() is asked for one, e.g. while an open dropdown covers
+    the bars (see display.Window.needs_full_redraw()).
+    """
+
+    def __init__(self):
+        self._full = True
+
+    def invalidate(self):
+        """Make the next present() a full update."""
+        self._full = True
+
+    def present(self, rects, full=False):
+        """Update `rects`, or the whole display if `full`."""
+        if full or self._full:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
+        self._full = full
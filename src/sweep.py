@@ -0,0 +1,308 @@
+"""
+Parallel benchmark sweep over algorithms × sizes × distributions × seeds.
+
+Every cell of the matrix runs in a worker of a ProcessPoolExecutor (one per
+core by default). A worker builds its own input with
+distributions.make_input(), drains the algorithm's generator to completion
+without pygame and sends back the comparisons, swaps and wall time. Completed cells are written to
+the leaderboard database in batches.
+
+Each cell has a time limit. A pool worker cannot be interrupted from the
+outside, so the limit is cooperative: the worker checks the clock every
+TIMEOUT_CHECK_STEPS steps and gives up once it is exceeded. When a cell
+times out, the not-yet-started cells of the same algorithm and distribution
+at larger sizes are cancelled, so an algorithm that is slower than its
+cost model predicts costs at most one timeout per seed instead of one per
+size. Cells whose predicted step count exceeds the step budget (see
+algmeta) are not run at all, so bogoSort, stoogeSort and slowSort never
+start at the sizes they cannot finish.
+
+Usage (from the src/ directory):
+
+    python -m sweep                                   # the full default matrix
+    python -m sweep bubbleSort quickSort --sizes 10 100 1000 --seeds 5
+    python -m sweep all --distributions random reversed --timeout 30 --workers 8
+    python -m sweep all --no-db
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from algmeta import (DEFAULT_STEP_BUDGET, STEP_BUDGET, STEP_BUDGET_ENV, expected_steps,
+                     format_steps)
+from algs import allAlgorithmsDict, seeded
+from benchmark import spec_argument
+from counters import counting
+from distributions import DISTRIBUTION_NAMES, canonical, make_input
+
+# Everything the sweep can run: the registered algorithms plus those that
+# are not in the GUI dropdowns
+SWEEP_ALGORITHMS = allAlgorithmsDict
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_TIMEOUT = 60.0          # seconds per cell
+TIMEOUT_CHECK_STEPS = 4096      # steps between two looks at the clock
+DB_BATCH_SIZE = 256             # rows per INSERT transaction
+DB_RETRIES = 3                  # attempts at saving a batch before giving up on it
+DB_RETRY_DELAY = 0.5            # seconds before the first retry, doubling after each
+
+# Cell statuses
+OK, TIMEOUT, ERROR, CANCELLED, SKIPPED = 'ok', 'timeout', 'error', 'cancelled', 'skipped'
+
+
+def run_cell(algorithm: str, size: int, distribution: str, seed: int,
+             timeout: float = DEFAULT_TIMEOUT) -> dict:
+    """
+    Sort one input to completion (or until `timeout` seconds) and measure it.
+
+    Runs in a pool worker. The input is built here from (distribution,
+    size, seed) so that only a few numbers cross the process boundary; the
+    result carries the canonical distribution spec that regenerates it.
+    The seed also seeds the algorithm's own randomness (algs.seeded()).
+    The result has the cell's parameters plus 'status', 'comparisons',
+    'swaps', 'steps', 'elapsed_ms' and 'sorted'; on a timeout the counts
+    are those reached so far.
+    """
+    distribution = canonical(distribution, size)
+    array = make_input(distribution, size, seed)
+    sort = seeded(SWEEP_ALGORITHMS[algorithm], seed)
+    status = OK
+    with counting() as counter:
+        start = time.perf_counter()
+        deadline = start + timeout
+        steps = 0
+        for _ in sort(array, 0, size - 1):
+            steps += 1
+            if not steps % TIMEOUT_CHECK_STEPS and time.perf_counter() > deadline:
+                status = TIMEOUT
+                break
+        elapsed = time.perf_counter() - start
+    return {
+        'algorithm':    algorithm,
+        'size':         size,
+        'distribution': distribution,
+        'seed':         seed,
+        'status':       status,
+        'comparisons':  counter.comparisons,
+        'swaps':        counter.swaps,
+        'steps':        steps,
+        'elapsed_ms':   elapsed * 1000,
+        'sorted':       status == OK and all(array[i] <= array[i + 1] for i in range(size - 1)),
+    }
+
+
+def _cell_failed(algorithm, size, distribution, seed, status, error=None) -> dict:
+    """Result entry for a cell that produced no measurements."""
+    return {'algorithm': algorithm, 'size': size, 'distribution': distribution,
+            'seed': seed, 'status': status, 'error': error}
+
+
+def sweep(algorithms, sizes, distributions, seeds, timeout: float = DEFAULT_TIMEOUT,
+          workers: int = None, save: bool = True, on_result=None,
+          step_budget: int = None) -> list:
+    """
+    Run every (algorithm, size, distribution, seed) cell in a process pool.
+
+    Parameters
+    ----------
+    algorithms : list of str
+        Names from SWEEP_ALGORITHMS.
+    sizes, distributions, seeds : lists
+        The other three axes of the matrix. Every algorithm sees the same
+        input for a given (size, distribution, seed).
+    timeout : float
+        Seconds each cell may run before it is abandoned.
+    workers : int or None
+        Pool size; None uses one process per core.
+    save : bool
+        Write the cells that finished with a sorted array to the
+        leaderboard database, DB_BATCH_SIZE rows per transaction. A batch
+        that still fails after DB_RETRIES attempts is given up on: its
+        results get 'saved' False and the error under 'save_error', and
+        the sweep goes on. Saved results get 'saved' True.
+    on_result : callable or None
+        Called with each result dict as it arrives (e.g. for progress).
+    step_budget : int or None
+        Cells predicted to take more steps are reported as SKIPPED instead
+        of run; None uses algmeta.STEP_BUDGET, 0 runs everything.
+
+    Returns the result dicts of all cells, in completion order.
+    """
+    if save:
+        from sqlite3 import Error as DatabaseError
+        from database import save_records
+    step_budget = STEP_BUDGET if step_budget is None else step_budget
+
+    results = []
+    batch = []
+
+    def report(result):
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    def flush():
+        if not batch:
+            return
+        rows = [(r['algorithm'], r['size'], r['swaps'], r['comparisons'], r['elapsed_ms'],
+                 r['seed'], r['distribution']) for r in batch]
+        error = None
+        for attempt in range(DB_RETRIES):
+            if attempt:
+                time.sleep(DB_RETRY_DELAY * 2 ** (attempt - 1))
+            try:
+                save_records(rows)
+            except DatabaseError as exc:
+                error = f'{type(exc).__name__}: {exc}'
+            else:
+                error = None
+                break
+        for result in batch:
+            result['saved'] = error is None
+            if error:
+                result['save_error'] = error
+        batch.clear()
+
+    def cancel_larger(algorithm, distribution, size):
+        # Bigger inputs of an algorithm that already timed out would too
+        for fut, cell in cells.items():
+            if (cell[0] == algorithm and cell[2] == distribution and cell[1] > size
+                    and not fut.cancelled() and fut.cancel()):
+                cancelled.append(cell)
+
+    cells = {}
+    cancelled = []
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        # Small sizes first, so timeouts are seen before larger cells start
+        for size in sorted(sizes):
+            for seed in seeds:
+                for distribution in distributions:
+                    for algorithm in algorithms:
+                        steps = expected_steps(algorithm, size)
+                        if step_budget > 0 and steps is not None and steps > step_budget:
+                            report(_cell_failed(algorithm, size, canonical(distribution, size),
+                                                seed, SKIPPED,
+                                                f'{format_steps(steps)} steps expected'))
+                            continue
+                        fut = executor.submit(run_cell, algorithm, size,
+                                              distribution, seed, timeout)
+                        cells[fut] = (algorithm, size, distribution, seed)
+
+        for fut in as_completed(cells):
+            if fut.cancelled():
+                continue
+            cell = cells[fut]
+            try:
+                result = fut.result()
+            except Exception as exc:
+                result = _cell_failed(*cell, ERROR, f'{type(exc).__name__}: {exc}')
+            if result['status'] == TIMEOUT:
+                cancel_larger(cell[0], cell[2], cell[1])
+            elif result['status'] == OK and save and result['sorted']:
+                batch.append(result)
+                if len(batch) >= DB_BATCH_SIZE:
+                    flush()
+            report(result)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        if save:
+            flush()
+
+    for cell in cancelled:
+        report(_cell_failed(*cell, CANCELLED))
+    return results
+
+
+def format_result(result: dict) -> str:
+    """One progress line for a finished cell."""
+    head = (f"{result['status']:<9} {result['algorithm']:<20} {result['size']:>8} "
+            f"{result['distribution']:<36} {result['seed']:>10}")
+    if 'comparisons' not in result:
+        return head + (f"  {result['error']}" if result.get('error') else '')
+    return (f"{head} {result['comparisons']:>14} {result['swaps']:>14} "
+            f"{result['elapsed_ms']:>11.1f} {'yes' if result['sorted'] else 'NO':>6}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m sweep',
+        description='Benchmark algorithms × sizes × distributions × seeds on all cores.')
+    parser.add_argument('algorithms', nargs='*', default=['all'],
+                        help="Algorithm names, or 'all' (default).")
+    parser.add_argument('-n', '--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Array sizes (default: 10 to 1000000 in decades).')
+    parser.add_argument('-d', '--distributions', nargs='+', type=spec_argument,
+                        default=DISTRIBUTION_NAMES,
+                        help="Input distributions or specs such as 'nearly_sorted:k=5' "
+                             '(default: all, with default parameters).')
+    parser.add_argument('-s', '--seeds', type=int, default=3,
+                        help='Number of seeds per cell (default: 3).')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='First seed; the others follow it (default: random).')
+    parser.add_argument('-t', '--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'Seconds per cell before giving up (default: {DEFAULT_TIMEOUT:g}).')
+    parser.add_argument('--step-budget', type=int, default=STEP_BUDGET, metavar='STEPS',
+                        help='Skip cells predicted to take more steps; 0 for no limit '
+                             f'(default: ${STEP_BUDGET_ENV}, else {DEFAULT_STEP_BUDGET:,}).')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help=f'Worker processes (default: {os.cpu_count()}).')
+    parser.add_argument('--no-db', action='store_true',
+                        help='Do not write results to the leaderboard database.')
+    parser.add_argument('--db', metavar='PATH',
+                        help='Leaderboard database file (default: $LEADERBOARD_DB, '
+                             'else src/leaderboard.db).')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Only print the summary.')
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.db:
+        from database import set_db_path
+        set_db_path(args.db)
+
+    names = args.algorithms
+    if names == ['all']:
+        names = list(SWEEP_ALGORITHMS)
+    unknown = [n for n in names if n not in SWEEP_ALGORITHMS]
+    if unknown:
+        print(f"Unknown algorithm(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    if min(args.sizes) < 1 or args.seeds < 1 or args.timeout <= 0:
+        print('--sizes and --seeds must be positive, --timeout above zero', file=sys.stderr)
+        return 2
+
+    first = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    seeds = [first + k for k in range(args.seeds)]
+
+    total = len(names) * len(args.sizes) * len(args.distributions) * len(seeds)
+    print(f'{total} cells on {args.workers or os.cpu_count()} workers, '
+          f'seeds {seeds[0]}..{seeds[-1]}', file=sys.stderr)
+    start = time.perf_counter()
+    results = sweep(names, args.sizes, args.distributions, seeds, timeout=args.timeout,
+                    workers=args.workers, save=not args.no_db,
+                    on_result=None if args.quiet else lambda r: print(format_result(r)),
+                    step_budget=args.step_budget)
+
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    unsorted = sum(1 for r in results if r['status'] == OK and not r['sorted'])
+    unsaved = [r for r in results if r.get('saved') is False]
+    summary = ', '.join(f'{n} {status}' for status, n in counts.items())
+    print(f'{summary}; {unsorted} unsorted; {time.perf_counter() - start:.1f}s',
+          file=sys.stderr)
+    if unsaved:
+        print(f"{len(unsaved)} results not saved to the leaderboard "
+              f"({unsaved[-1]['save_error']})", file=sys.stderr)
+    return 1 if counts.get(ERROR) or unsaved else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())